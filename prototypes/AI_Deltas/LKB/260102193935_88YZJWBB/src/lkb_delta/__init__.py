@@ -1,4 +1,5 @@
 from .config import DELTA_ID, SimulationConfig, DEFAULT_CONFIG, BiasPulse
+from .records import StepRecord, StepRecords
 from .simulation import run_session
 
 __all__ = [
@@ -6,5 +7,7 @@ __all__ = [
     "SimulationConfig",
     "DEFAULT_CONFIG",
     "BiasPulse",
+    "StepRecord",
+    "StepRecords",
     "run_session",
 ]
@@ -1,11 +1,111 @@
+"""Decaying 3D bias field shaped by radial pulses.
+
+Pulse kernels depend only on the radius, so ``BiasField`` keeps a bounded
+``StencilCache`` of precomputed ``(offset, weight)`` stencils keyed by
+radius. Applying a pulse evaluates no ``exp`` and wraps each axis once, then
+adds ``strength * weight`` at the wrapped cells and clips them to +/-0.8.
+With ``backend="numpy"`` the field is a float64 array and a pulse becomes
+one scatter-add plus clip.
+
+Decay is lazy. The field stores ``raw`` cells plus one global ``scale``, and
+a cell's value is ``raw[i] * scale``. ``decay()`` only multiplies ``scale``,
+and pulses write ``clamp(raw * scale + delta) / scale`` at the cells they
+touch. ``raw`` is rescaled (O(n)) only when ``scale`` leaves
+``[RENORM_FLOOR, RENORM_CEIL]``, which keeps it far from under- or overflow.
+The max-abs ``raw`` value is tracked as cells are written and recomputed only
+when a pulse shrinks the cell that held it, so ``amplitude()`` is O(1) and
+per-step bias cost follows the cells pulses touch. ``view()`` hands the grid
+``(raw, scale)`` without copying.
+"""
 from __future__ import annotations
 
 import math
-from typing import Iterable, List
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Tuple
+
+try:  # Optional dependency: only required for backend="numpy".
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when numpy is absent
+    np = None
 
 from .config import BiasPulse, SimulationConfig
 from .utils import clamp, wrap_index
 
+BIAS_LIMIT = 0.8
+RENORM_FLOOR = 1e-150
+RENORM_CEIL = 1e150
+
+
+@dataclass
+class Stencil:
+    """Cells within ``radius`` of a pulse centre, as offsets into a ``2 * reach + 1`` cube."""
+
+    reach: int
+    offsets: Tuple[Tuple[int, int, int], ...]  # (dx, dy, dz) + reach, for per-axis lookups
+    weights: Tuple[float, ...]
+    arrays: Any = None  # numpy (dx, dy, dz, weights), built on first vectorized use
+
+    @classmethod
+    def build(cls, radius: float) -> "Stencil":
+        reach = math.ceil(radius)
+        radius_sq = radius * radius
+        offsets: List[Tuple[int, int, int]] = []
+        weights: List[float] = []
+        for dx in range(-reach, reach + 1):
+            for dy in range(-reach, reach + 1):
+                for dz in range(-reach, reach + 1):
+                    dist_sq = dx * dx + dy * dy + dz * dz
+                    if dist_sq > radius_sq:
+                        continue
+                    offsets.append((dx + reach, dy + reach, dz + reach))
+                    weights.append(math.exp(-dist_sq / (radius_sq * 0.6)))
+        return cls(reach=reach, offsets=tuple(offsets), weights=tuple(weights))
+
+    def as_arrays(self) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray", "np.ndarray"]:
+        if self.arrays is None:
+            offsets = np.array(self.offsets, dtype=np.intp).reshape(-1, 3) - self.reach
+            self.arrays = (offsets[:, 0], offsets[:, 1], offsets[:, 2], np.array(self.weights))
+        return self.arrays
+
+
+class StencilCache:
+    """LRU map from pulse radius to ``Stencil``, holding at most ``maxsize`` entries."""
+
+    def __init__(self, maxsize: int = 8):
+        if maxsize < 1:
+            raise ValueError("stencil cache maxsize must be >= 1")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[float, Stencil]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, radius: float) -> Stencil:
+        stencil = self._entries.get(radius)
+        if stencil is not None:
+            self.hits += 1
+            self._entries.move_to_end(radius)
+            return stencil
+        self.misses += 1
+        stencil = self._entries[radius] = Stencil.build(radius)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return stencil
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+        }
+
 
 class BiasField:
     def __init__(self, config: SimulationConfig):
@@ -14,31 +114,105 @@ class BiasField:
         self.decay_rate = config.bias_decay
         self.strength = config.bias_strength
         self.default_radius = config.bias_radius
-        self.values: List[float] = [0.0 for _ in range(self.count)]
+        self.stencils = StencilCache(config.stencil_cache_size)
+        self.use_arrays = config.backend == "numpy"
+        self.raw: Any = [0.0 for _ in range(self.count)]
+        if self.use_arrays:
+            if np is None:
+                raise ImportError("backend='numpy' requires numpy (pip install numpy)")
+            self.raw = np.zeros(self.count)
+        self.scale = 1.0
+        self.renormalizations = 0
+        self._peak = 0.0  # max |raw|; exact unless _peak_stale
+        self._peak_stale = False
+
+    @property
+    def values(self) -> Any:
+        """Materialized field (``raw * scale``): a new list, or a new array on numpy."""
+        if self.use_arrays:
+            return self.raw * self.scale
+        scale = self.scale
+        return [v * scale for v in self.raw]
+
+    def view(self) -> Tuple[Any, float]:
+        """``(raw, scale)`` without copying; valid until the next ``decay`` or pulse."""
+        return self.raw, self.scale
 
     def _index(self, x: int, y: int, z: int) -> int:
         s = self.size
         return wrap_index(x, s) + wrap_index(y, s) * s + wrap_index(z, s) * s * s
 
     def decay(self) -> None:
-        for i, v in enumerate(self.values):
-            self.values[i] = v * self.decay_rate
+        self.scale *= self.decay_rate
+        if not RENORM_FLOOR <= self.scale <= RENORM_CEIL:
+            self._renormalize()
+
+    def _renormalize(self) -> None:
+        """Fold ``scale`` into ``raw`` (the only O(n) bias operation)."""
+        if self.use_arrays:
+            self.raw *= self.scale
+        else:
+            scale = self.scale
+            self.raw = [v * scale for v in self.raw]
+        self.scale = 1.0
+        self.renormalizations += 1
+        self._peak_stale = True
 
     def apply_pulse(self, pulse: BiasPulse, strength_scale: float = 1.0) -> None:
         px, py, pz = pulse.position
         radius = max(0.5, pulse.radius or self.default_radius)
-        max_dist = math.ceil(radius)
-        radius_sq = radius * radius
-        for dx in range(-max_dist, max_dist + 1):
-            for dy in range(-max_dist, max_dist + 1):
-                for dz in range(-max_dist, max_dist + 1):
-                    dist_sq = dx * dx + dy * dy + dz * dz
-                    if dist_sq > radius_sq:
-                        continue
-                    kernel = math.exp(-dist_sq / (radius_sq * 0.6))
-                    idx = self._index(px + dx, py + dy, pz + dz)
-                    delta = pulse.strength * self.strength * kernel * strength_scale
-                    self.values[idx] = clamp(self.values[idx] + delta, -0.8, 0.8)
+        stencil = self.stencils.get(radius)
+        gain = pulse.strength * self.strength
+        if self.use_arrays:
+            self._scatter_pulse(stencil, px, py, pz, gain, strength_scale)
+            return
+        s = self.size
+        if 2 * stencil.reach + 1 > s:
+            self._renormalize()  # as on numpy, a stencil that wraps onto itself sees scale 1
+        span = range(-stencil.reach, stencil.reach + 1)
+        xs = [wrap_index(px + d, s) for d in span]
+        ys = [wrap_index(py + d, s) * s for d in span]
+        zs = [wrap_index(pz + d, s) * s * s for d in span]
+        raw, scale, peak = self.raw, self.scale, self._peak
+        for (ox, oy, oz), kernel in zip(stencil.offsets, stencil.weights):
+            idx = xs[ox] + ys[oy] + zs[oz]
+            delta = gain * kernel * strength_scale
+            old = abs(raw[idx])
+            raw[idx] = clamp(raw[idx] * scale + delta, -BIAS_LIMIT, BIAS_LIMIT) / scale
+            new = abs(raw[idx])
+            if new >= peak:
+                peak = new
+            elif old == peak:
+                self._peak_stale = True
+        self._peak = peak
+
+    def _scatter_pulse(self, stencil: Stencil, px: int, py: int, pz: int, gain: float, strength_scale: float) -> None:
+        s = self.size
+        dx, dy, dz, weights = stencil.as_arrays()
+        idx = (px + dx) % s
+        idx += ((py + dy) % s) * s
+        idx += ((pz + dz) % s) * (s * s)
+        delta = weights * gain
+        delta *= strength_scale
+        if 2 * stencil.reach + 1 <= s:
+            # Wrapped cells are distinct, so a gather/add/clip/scatter matches the per-cell loop.
+            touched = self.raw[idx]
+            old_peak = float(np.abs(touched).max())
+            touched *= self.scale
+            touched += delta
+            np.clip(touched, -BIAS_LIMIT, BIAS_LIMIT, out=touched)
+            touched /= self.scale
+            self.raw[idx] = touched
+            new_peak = float(np.abs(touched).max())
+            if new_peak >= self._peak:
+                self._peak = new_peak
+            elif old_peak == self._peak:
+                self._peak_stale = True
+        else:
+            # The stencil wraps onto itself: fold the scale in, sum every contribution, then clip once.
+            self._renormalize()
+            np.add.at(self.raw, idx, delta)
+            np.clip(self.raw, -BIAS_LIMIT, BIAS_LIMIT, out=self.raw)
 
     def apply_pulses(self, pulses: Iterable[BiasPulse], current_step: int) -> None:
         for pulse in pulses:
@@ -46,7 +220,13 @@ class BiasField:
                 self.apply_pulse(pulse)
 
     def amplitude(self) -> float:
-        return max(abs(v) for v in self.values) if self.values else 0.0
+        if self._peak_stale:
+            if self.use_arrays:
+                self._peak = float(np.abs(self.raw).max()) if self.count else 0.0
+            else:
+                self._peak = max(abs(v) for v in self.raw) if self.raw else 0.0
+            self._peak_stale = False
+        return self._peak * self.scale
 
     def flatten(self) -> List[float]:
-        return list(self.values)
+        return self.values
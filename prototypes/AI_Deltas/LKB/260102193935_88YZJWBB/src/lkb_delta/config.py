@@ -4,6 +4,7 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Tuple
 
 DELTA_ID = "260102193935_88YZJWBB"
+BACKENDS = ("python", "numpy")
 
 
 def _default_pulses(grid_size: int) -> List["BiasPulse"]:
@@ -38,6 +39,7 @@ class SimulationConfig:
     bias_decay: float = 0.93
     bias_strength: float = 0.12
     bias_radius: float = 3.0
+    stencil_cache_size: int = 8  # pulse stencils kept, keyed by radius
     lens_weights: Dict[str, float] = field(
         default_factory=lambda: {
             "human": 0.25,
@@ -48,6 +50,8 @@ class SimulationConfig:
     )
     harmonic_clamp: Tuple[float, float] = (0.2, 0.85)
     pulses: List[BiasPulse] = field(default_factory=list)
+    # "python" is the per-cell reference loop; "numpy" steps the whole lattice as arrays.
+    backend: str = "python"
 
     def with_defaults(self) -> "SimulationConfig":
         if not self.pulses:
@@ -1,16 +1,84 @@
+"""Phase lattice with parity jitter, neighbor/delta blending and forgiveness.
+
+Neighbor lookups go through ``neighbor_table(size)``: for every cell, six flat
+indices in ``NEIGHBOR_SIGNS`` order (+x, -x, +y, -y, +z, -z), packed into a
+typed ``array`` (4 bytes per entry rather than a tuple of int objects). The
+numpy backend uses ``_neighbor_columns(size)`` instead, a ``(6, count)``
+index array built with whole-array modular arithmetic. Each is built once per
+grid size, only for the backend that reads it, and shared by every grid of
+that size. The sign of each column gives its contribution to the directional
+``delta`` term.
+
+Two backends share the same update rules. ``backend="python"`` walks the
+lattice cell by cell with ``random.Random`` and is the reference
+implementation. ``backend="numpy"`` evaluates perturb/step/metrics as
+whole-lattice array operations with a ``numpy.random.Generator`` derived
+from the injected ``rng``. Both start from the same initial state and, given
+the same random draws, produce bit-identical fields (see ``_step_arrays``).
+They draw different streams, so full runs match statistically rather than
+bit for bit.
+
+``metrics()`` always measures the current fields with full passes, so it
+stays exact when callers assign fields directly. ``step()`` also produces the
+same metrics as a by-product: while writing the new state it sums
+``|plasma|`` and shifted liquid moments (shifted by the old ``liquid[0]``,
+which keeps the one-pass variance well conditioned) and keeps
+``(energy, dispersion)`` for ``last_step_metrics()``. ``perturb()`` only flips
+plasma signs and toggles parity, which leaves both metrics unchanged, so
+``run_session`` uses the by-product as the next step's pre-step metrics too.
+"""
 from __future__ import annotations
 
 import math
 import random
-from typing import List, Tuple
+from array import array
+from functools import lru_cache
+from typing import Any, List, Sequence, Tuple
 
-from .config import SimulationConfig
+try:  # Optional dependency: only required for backend="numpy".
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when numpy is absent
+    np = None
+
+from .config import BACKENDS, SimulationConfig
 from .lenses import LensOutput
 from .utils import average, clamp, variance, wrap_index
 
+NEIGHBOR_SIGNS = (1, -1, 1, -1, 1, -1)
+
+
+@lru_cache(maxsize=8)
+def neighbor_table(size: int) -> array:
+    """Flat ``(count * 6)`` table: entries ``6 * i .. 6 * i + 5`` are cell ``i``'s neighbors."""
+    table = array("i" if size ** 3 < 2 ** 31 else "q")
+    for z in range(size):
+        for y in range(size):
+            for x in range(size):
+                xp, xm = wrap_index(x + 1, size), wrap_index(x - 1, size)
+                yp, ym = wrap_index(y + 1, size) * size, wrap_index(y - 1, size) * size
+                zp, zm = wrap_index(z + 1, size) * size * size, wrap_index(z - 1, size) * size * size
+                row, plane = y * size, z * size * size
+                table.extend((xp + row + plane, xm + row + plane, x + yp + plane, x + ym + plane, x + row + zp, x + row + zm))
+    return table
+
+
+@lru_cache(maxsize=8)
+def _neighbor_columns(size: int) -> "np.ndarray":
+    """``neighbor_table`` as a ``(6, count)`` array, one contiguous column per direction."""
+    cells = np.arange(size ** 3, dtype=np.intp)
+    columns = np.empty((6, cells.size), dtype=np.intp)
+    for axis, stride in enumerate((1, size, size * size)):
+        coord = (cells // stride) % size
+        base = cells - coord * stride
+        np.add(base, ((coord + 1) % size) * stride, out=columns[2 * axis])
+        np.add(base, ((coord - 1) % size) * stride, out=columns[2 * axis + 1])
+    return columns
+
 
 class PhaseGrid:
     def __init__(self, config: SimulationConfig, rng: random.Random):
+        if config.backend not in BACKENDS:
+            raise ValueError(f"backend must be one of {BACKENDS}, got {config.backend!r}")
         self.size = config.grid_size
         self.count = self.size ** 3
         self.alpha = config.alpha
@@ -21,15 +89,41 @@ class PhaseGrid:
         self.path_b_span = config.path_b_span
         self.rng = rng
 
-        self.plasma: List[float] = []
-        self.liquid: List[float] = []
-        self.solid: List[float] = []
-        self.parity: List[int] = []
+        plasma: List[float] = []
+        liquid: List[float] = []
+        solid: List[float] = []
+        parity: List[int] = []
         for _ in range(self.count):
-            self.plasma.append(rng.uniform(-0.25, 0.25))
-            self.liquid.append(rng.uniform(0.0, 0.4))
-            self.solid.append(rng.uniform(0.0, 0.3))
-            self.parity.append(1 if rng.random() < 0.5 else 0)
+            plasma.append(rng.uniform(-0.25, 0.25))
+            liquid.append(rng.uniform(0.0, 0.4))
+            solid.append(rng.uniform(0.0, 0.3))
+            parity.append(1 if rng.random() < 0.5 else 0)
+        # Lists for the python backend, 1-D float64/int8 arrays for numpy.
+        self.plasma: Any = plasma
+        self.liquid: Any = liquid
+        self.solid: Any = solid
+        self.parity: Any = parity
+
+        self._step_metrics: Tuple[float, float] | None = None
+        self.use_arrays = config.backend == "numpy"
+        if self.use_arrays:
+            if np is None:
+                raise ImportError("backend='numpy' requires numpy (pip install numpy)")
+            # Same initial state as the reference; later draws come from a derived generator.
+            self.np_rng: Any = np.random.default_rng(rng.getrandbits(64))
+            self._columns = _neighbor_columns(self.size)
+            self._work = {
+                name: np.empty(self.count, dtype=bool if name == "mask" else np.float64)
+                for name in (
+                    "effective", "values", "mask", "avg_neighbor", "delta", "path_a", "signs", "plasma", "liquid", "solid"
+                )
+            }
+            self.plasma = np.array(plasma)
+            self.liquid = np.array(liquid)
+            self.solid = np.array(solid)
+            self.parity = np.array(parity, dtype=np.int8)
+        else:
+            self.neighbors = neighbor_table(self.size)
 
     def _coords(self, index: int) -> Tuple[int, int, int]:
         s = self.size
@@ -43,42 +137,52 @@ class PhaseGrid:
         return wrap_index(x, s) + wrap_index(y, s) * s + wrap_index(z, s) * s * s
 
     def _neighbor_stats(self, index: int) -> Tuple[float, float]:
-        x, y, z = self._coords(index)
-        neighbors = [
-            self.plasma[self._index(x + 1, y, z)],
-            self.plasma[self._index(x - 1, y, z)],
-            self.plasma[self._index(x, y + 1, z)],
-            self.plasma[self._index(x, y - 1, z)],
-            self.plasma[self._index(x, y, z + 1)],
-            self.plasma[self._index(x, y, z - 1)],
-        ]
-        avg_neighbor = sum(neighbors) / len(neighbors)
-        delta = (
-            neighbors[0]
-            - neighbors[1]
-            + neighbors[2]
-            - neighbors[3]
-            + neighbors[4]
-            - neighbors[5]
-        ) / len(neighbors)
+        base = 6 * index
+        table = self.neighbors
+        plasma = self.plasma
+        xp, xm = plasma[table[base]], plasma[table[base + 1]]
+        yp, ym = plasma[table[base + 2]], plasma[table[base + 3]]
+        zp, zm = plasma[table[base + 4]], plasma[table[base + 5]]
+        avg_neighbor = (xp + xm + yp + ym + zp + zm) / 6
+        delta = (xp - xm + yp - ym + zp - zm) / 6
         return avg_neighbor, delta
 
     def perturb(self) -> None:
+        if self.use_arrays:
+            flips = self.np_rng.random(self.count) < self.flip_probability
+            toggles = self.np_rng.random(self.count) < self.parity_probability
+            np.negative(self.plasma, out=self.plasma, where=flips)
+            self.parity ^= toggles.view(np.int8)
+            return
         for i in range(self.count):
             if self.rng.random() < self.flip_probability:
                 self.plasma[i] *= -1
             if self.rng.random() < self.parity_probability:
                 self.parity[i] ^= 1
 
-    def step(self, bias_values: List[float], lens_output: LensOutput) -> bool:
+    def step(self, bias_values: Sequence[float], lens_output: LensOutput, bias_scale: float = 1.0) -> bool:
+        """Advance one step; each cell's bias is ``bias_values[i] * bias_scale``.
+
+        ``bias_scale`` lets callers pass ``BiasField.view()`` (raw cells plus
+        the lazy decay multiplier) without materializing the field.
+        """
+        if self.use_arrays:
+            choice = self.np_rng.random(self.count)
+            jitter = self.np_rng.random(self.count)
+            return self._step_arrays(bias_values, lens_output, choice, jitter, bias_scale)
+
         next_plasma: List[float] = [0.0 for _ in range(self.count)]
         next_liquid: List[float] = [0.0 for _ in range(self.count)]
         next_solid: List[float] = [0.0 for _ in range(self.count)]
         forgiveness_triggered = False
+        bias_gain = lens_output.bias_gain * bias_scale
+        energy_sum = 0.0
+        shift = self.liquid[0] if self.count else 0.0
+        liquid_sum = liquid_sq = 0.0
 
         for i in range(self.count):
             base_plasma = self.plasma[i]
-            bias = bias_values[i] * lens_output.bias_gain if bias_values else 0.0
+            bias = bias_values[i] * bias_gain if bias_values else 0.0
             effective_plasma = clamp(base_plasma + bias, -1.2, 1.2)
 
             avg_neighbor, delta_neighbor = self._neighbor_stats(i)
@@ -102,13 +206,130 @@ class PhaseGrid:
             next_plasma[i] = new_plasma
             next_liquid[i] = new_liquid
             next_solid[i] = new_solid
+            energy_sum += abs(new_plasma)
+            offset = new_liquid - shift
+            liquid_sum += offset
+            liquid_sq += offset * offset
 
+        self._store_metrics(energy_sum, liquid_sum, liquid_sq)
         self.plasma = next_plasma
         self.liquid = next_liquid
         self.solid = next_solid
         return forgiveness_triggered
 
+    def _step_arrays(
+        self,
+        bias_values: Sequence[float],
+        lens_output: LensOutput,
+        choice: "np.ndarray",
+        jitter: "np.ndarray",
+        bias_scale: float = 1.0,
+    ) -> bool:
+        """Whole-lattice ``step`` given per-cell path (``choice``) and ``jitter`` draws in [0, 1).
+
+        Operations follow the reference loop's evaluation order, so feeding it
+        the reference's draws reproduces its fields exactly.
+        """
+        work = self._work
+        plasma = self.plasma
+        effective, values, mask = work["effective"], work["values"], work["mask"]
+        if len(bias_values):
+            bias_gain = lens_output.bias_gain * bias_scale
+            np.multiply(np.asarray(bias_values, dtype=np.float64), bias_gain, out=effective)
+            effective += plasma
+        else:
+            np.copyto(effective, plasma)
+        np.clip(effective, -1.2, 1.2, out=effective)
+
+        # Accumulate neighbors column by column in table order, as the reference sums them.
+        avg_neighbor, delta = work["avg_neighbor"], work["delta"]
+        columns = self._columns
+        plasma.take(columns[0], out=avg_neighbor)
+        np.copyto(delta, avg_neighbor)
+        for column, sign in zip(columns[1:], NEIGHBOR_SIGNS[1:]):
+            plasma.take(column, out=values)
+            avg_neighbor += values
+            if sign > 0:
+                delta += values
+            else:
+                delta -= values
+        avg_neighbor /= 6
+        delta /= 6
+
+        path_a = work["path_a"]
+        np.subtract(avg_neighbor, effective, out=path_a)
+        path_a *= 0.5
+        delta *= self.path_b_span  # path_b
+        np.less(choice, lens_output.path_b_probability, out=mask)
+        new_plasma = work["plasma"]
+        np.copyto(new_plasma, path_a)
+        np.copyto(new_plasma, delta, where=mask)
+        new_plasma += effective
+        # (r - 0.5) * flip * (+1 | -1): parity 1/0 maps to +1.0/-1.0 exactly.
+        np.subtract(jitter, 0.5, out=values)
+        values *= self.flip_probability
+        signs = work["signs"]
+        np.multiply(self.parity, 2.0, out=signs)
+        signs -= 1.0
+        values *= signs
+        new_plasma += values
+        np.clip(new_plasma, -1.5, 1.5, out=new_plasma)
+
+        new_liquid, new_solid = work["liquid"], work["solid"]
+        np.add(self.liquid, new_plasma, out=new_liquid)
+        new_liquid *= 1 - lens_output.damping
+        np.multiply(avg_neighbor, lens_output.damping, out=values)
+        new_liquid += values
+        np.multiply(self.solid, 1 - self.alpha, out=new_solid)
+        np.multiply(new_liquid, self.alpha, out=values)
+        new_solid += values
+
+        local_energy = effective  # no longer needed
+        np.abs(new_plasma, out=local_energy)
+        local_energy += np.abs(new_liquid, out=values)
+        local_energy += np.abs(self.solid, out=values)
+        forgive = np.greater(local_energy, self.forgiveness_threshold, out=mask)
+        # 1 - strength on forgiven cells and exactly 1.0 elsewhere, so one multiply per field.
+        damp = np.multiply(forgive, self.forgiveness_strength, out=values)
+        np.subtract(1.0, damp, out=damp)
+        new_plasma *= damp
+        new_liquid *= damp
+        new_solid *= damp
+
+        shift = float(self.liquid[0]) if self.count else 0.0
+        energy_sum = float(np.abs(new_plasma, out=values).sum())
+        offset = np.subtract(new_liquid, shift, out=values)
+        self._store_metrics(energy_sum, float(offset.sum()), float(np.dot(offset, offset)))
+
+        # The replaced fields become next step's output buffers.
+        work["plasma"], work["liquid"], work["solid"] = self.plasma, self.liquid, self.solid
+        self.plasma = new_plasma
+        self.liquid = new_liquid
+        self.solid = new_solid
+        return bool(forgive.any())
+
+    def _store_metrics(self, energy_sum: float, liquid_sum: float, liquid_sq: float) -> None:
+        if not self.count:
+            self._step_metrics = (0.0, 0.0)
+            return
+        mean_offset = liquid_sum / self.count
+        spread = max(liquid_sq / self.count - mean_offset * mean_offset, 0.0)
+        self._step_metrics = (energy_sum / self.count, math.sqrt(spread))
+
+    def last_step_metrics(self) -> Tuple[float, float]:
+        """``metrics()`` as accumulated by the last ``step()`` (full passes before any step).
+
+        Only ``step()`` and ``perturb()`` keep this in sync with the fields;
+        after assigning fields directly, call ``metrics()`` instead.
+        """
+        if self._step_metrics is None:
+            return self.metrics()
+        return self._step_metrics
+
     def metrics(self) -> Tuple[float, float]:
+        """``(mean |plasma|, std of liquid)`` of the current fields, from full passes."""
+        if self.use_arrays:
+            return float(np.abs(self.plasma).mean()), float(self.liquid.std())
         energy = average(abs(p) for p in self.plasma)
         dispersion = math.sqrt(variance(self.liquid))
         return energy, dispersion
@@ -0,0 +1,180 @@
+"""Columnar per-step history returned by ``run_session`` (SV10).
+
+``StepRecords`` keeps one typed ``array.array`` per ``StepRecord`` field, so a
+step costs a few bytes per field instead of a dataclass instance. Columns are
+preallocated to ``capacity`` and double when full, which makes ``append``
+O(1) amortized. ``column()`` exposes a zero-copy ``memoryview``. ``mean()``
+and ``total()`` reduce whole columns, with numpy when it is installed.
+Histories can be saved to and loaded from ``.npz`` (numpy required) or
+streamed to CSV row by row.
+
+The store is also a read-only ``Sequence`` of ``StepRecord``: indexing and
+iteration build records on demand, so callers written against the old list
+of records keep working.
+"""
+from __future__ import annotations
+
+import csv
+import math
+import os
+from array import array
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass
+from typing import IO, Any, Dict, Iterator, Tuple, Union
+
+try:  # Optional dependency: only required for .npz files and numpy reductions.
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when numpy is absent
+    np = None
+
+
+@dataclass
+class StepRecord:
+    step: int
+    energy: float
+    dispersion: float
+    bias_amplitude: float
+    path_b_probability: float
+    damping: float
+    forgiveness_triggered: bool
+
+    def to_dict(self) -> Dict[str, float | int | bool]:
+        return asdict(self)
+
+
+FIELDS: Tuple[Tuple[str, str, str], ...] = (
+    # (field, array-module typecode, numpy dtype)
+    ("step", "q", "<i8"),
+    ("energy", "d", "<f8"),
+    ("dispersion", "d", "<f8"),
+    ("bias_amplitude", "d", "<f8"),
+    ("path_b_probability", "d", "<f8"),
+    ("damping", "d", "<f8"),
+    ("forgiveness_triggered", "B", "|b1"),
+)
+BOOL_FIELDS = frozenset(name for name, code, _ in FIELDS if code == "B")
+
+
+class StepRecords(Sequence):
+    """Typed, growable columns of step metrics that also read as ``StepRecord`` rows."""
+
+    def __init__(self, capacity: int = 64) -> None:
+        self.capacity = max(1, capacity)
+        self._size = 0
+        self._columns: Dict[str, array] = {
+            name: array(code, [0]) * self.capacity for name, code, _ in FIELDS
+        }
+        self._ordered = tuple(self._columns[name] for name, _, _ in FIELDS)  # grown in place
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _grow(self) -> None:
+        for column in self._columns.values():
+            column.extend(array(column.typecode, [0]) * self.capacity)
+        self.capacity *= 2
+
+    def append(
+        self,
+        step: int,
+        energy: float,
+        dispersion: float,
+        bias_amplitude: float,
+        path_b_probability: float,
+        damping: float,
+        forgiveness_triggered: bool,
+    ) -> None:
+        """Store one step (arguments follow ``StepRecord``'s field order)."""
+        index = self._size
+        if index == self.capacity:
+            self._grow()
+        columns = self._ordered
+        columns[0][index] = step
+        columns[1][index] = energy
+        columns[2][index] = dispersion
+        columns[3][index] = bias_amplitude
+        columns[4][index] = path_b_probability
+        columns[5][index] = damping
+        columns[6][index] = forgiveness_triggered
+        self._size = index + 1
+
+    def append_record(self, record: StepRecord) -> None:
+        self.append(**asdict(record))
+
+    def _row(self, index: int) -> StepRecord:
+        values = {name: column[index] for name, column in self._columns.items()}
+        for name in BOOL_FIELDS:
+            values[name] = bool(values[name])
+        return StepRecord(**values)
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self._row(i) for i in range(*index.indices(self._size))]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("step record index out of range")
+        return self._row(index)
+
+    def __iter__(self) -> Iterator[StepRecord]:
+        for index in range(self._size):
+            yield self._row(index)
+
+    def column(self, name: str) -> memoryview:
+        """Zero-copy view of one field (booleans read as 0/1).
+
+        While a view is alive its column cannot be resized, so release views
+        before appending past ``capacity``.
+        """
+        return memoryview(self._columns[name])[: self._size]
+
+    def total(self, name: str) -> float:
+        """Sum of a column; a boolean column gives its count of ``True``."""
+        values = self.column(name)
+        if np is not None:
+            return np.frombuffer(values, dtype=values.format).sum().item()
+        if name in BOOL_FIELDS or values.format == "q":
+            return sum(values)
+        return math.fsum(values)
+
+    def mean(self, name: str) -> float:
+        if not self._size:
+            return 0.0
+        values = self.column(name)
+        if np is not None:
+            return float(np.frombuffer(values, dtype=values.format).mean())
+        return self.total(name) / self._size
+
+    def save_npz(self, path: Union[str, os.PathLike]) -> None:
+        if np is None:
+            raise ImportError("saving .npz step records requires numpy (pip install numpy)")
+        np.savez(
+            path,
+            **{name: np.frombuffer(self.column(name), dtype=code).astype(dtype) for name, code, dtype in FIELDS},
+        )
+
+    @classmethod
+    def load_npz(cls, path: Union[str, os.PathLike]) -> "StepRecords":
+        if np is None:
+            raise ImportError("loading .npz step records requires numpy (pip install numpy)")
+        with np.load(path) as data:
+            size = len(data[FIELDS[0][0]])
+            records = cls(capacity=size)
+            for name, code, _ in FIELDS:
+                values = np.ascontiguousarray(data[name], dtype=code)
+                records._columns[name][:size] = array(code, values.tobytes())
+        records._size = size
+        return records
+
+    def write_csv(self, target: Union[str, os.PathLike, IO[str]]) -> None:
+        """Stream a header plus one row per step without building records."""
+        if isinstance(target, (str, os.PathLike)):
+            with open(target, "w", newline="") as handle:
+                self.write_csv(handle)
+            return
+        writer = csv.writer(target)
+        writer.writerow([name for name, _, _ in FIELDS])
+        columns = [self.column(name) for name, _, _ in FIELDS]
+        flags = [name in BOOL_FIELDS for name, _, _ in FIELDS]
+        for row in zip(*columns):
+            writer.writerow([bool(value) if flag else value for value, flag in zip(row, flags)])
@@ -2,10 +2,9 @@ from __future__ import annotations
 
 import argparse
 import json
-from statistics import mean
 from typing import Any, Dict
 
-from .config import DELTA_ID, SimulationConfig
+from .config import BACKENDS, DELTA_ID, SimulationConfig
 from .simulation import run_session
 
 
@@ -15,21 +14,28 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--steps", type=int, default=defaults.steps, help="Number of simulation steps (default: 40)")
     parser.add_argument("--grid-size", type=int, default=defaults.grid_size, help="Grid dimension for the lattice")
     parser.add_argument("--seed", type=int, default=defaults.seed, help="Seed for deterministic runs")
+    parser.add_argument(
+        "--backend",
+        choices=BACKENDS,
+        default=defaults.backend,
+        help="Grid backend: per-cell pure-Python reference or whole-array numpy",
+    )
+    parser.add_argument(
+        "--records",
+        help="Also write per-step records to this path (.npz needs numpy; anything else is CSV)",
+    )
     return parser
 
 
 def summarize(result: Dict[str, Any]) -> Dict[str, Any]:
     steps = result["steps"]
-    avg_energy = mean(s.energy for s in steps) if steps else 0.0
-    avg_dispersion = mean(s.dispersion for s in steps) if steps else 0.0
-    forgiveness_hits = sum(1 for s in steps if s.forgiveness_triggered)
     return {
         "delta_id": DELTA_ID,
         "steps": len(steps),
-        "avg_energy": avg_energy,
-        "avg_dispersion": avg_dispersion,
-        "forgiveness_events": forgiveness_hits,
-        "last_bias_amplitude": steps[-1].bias_amplitude if steps else 0.0,
+        "avg_energy": steps.mean("energy"),
+        "avg_dispersion": steps.mean("dispersion"),
+        "forgiveness_events": int(steps.total("forgiveness_triggered")),
+        "last_bias_amplitude": steps.column("bias_amplitude")[-1] if steps else 0.0,
     }
 
 
@@ -37,8 +43,15 @@ def main() -> None:
     parser = build_parser()
     args = parser.parse_args()
 
-    config = SimulationConfig(steps=args.steps, grid_size=args.grid_size, seed=args.seed).with_defaults()
+    config = SimulationConfig(
+        steps=args.steps, grid_size=args.grid_size, seed=args.seed, backend=args.backend
+    ).with_defaults()
     result = run_session(config)
+    if args.records:
+        if args.records.endswith(".npz"):
+            result["steps"].save_npz(args.records)
+        else:
+            result["steps"].write_csv(args.records)
     summary = summarize(result)
     print(json.dumps(summary, indent=2))
 
@@ -1,3 +1,5 @@
+import pytest
+
 from lkb_delta.config import BiasPulse, SimulationConfig
 from lkb_delta.bias import BiasField
 
@@ -13,3 +15,58 @@ def test_bias_pulse_and_decay():
 
     field.decay()
     assert field.amplitude() < amplitude_after_pulse
+
+
+def test_stencil_cache_reuses_radii_and_stays_bounded():
+    config = SimulationConfig(grid_size=8, stencil_cache_size=2, pulses=[])
+    field = BiasField(config)
+    for radius in (1.5, 1.5, 2.0, 1.5, 3.0, 2.0):
+        field.apply_pulse(BiasPulse(step=0, position=(1, 2, 3), strength=0.5, radius=radius))
+
+    stats = field.stencils.stats()
+    assert stats["misses"] == 4  # 1.5, 2.0, 3.0, then 2.0 again after eviction
+    assert stats["hits"] == 2
+    assert stats["evictions"] == 2
+    assert len(field.stencils) == 2
+
+
+def test_numpy_scatter_matches_reference_pulses():
+    pytest.importorskip("numpy")
+    pulses = [
+        BiasPulse(step=0, position=(0, 0, 0), strength=3.0, radius=2.5),
+        BiasPulse(step=0, position=(5, 1, 4), strength=-1.0, radius=1.2),
+        BiasPulse(step=0, position=(2, 2, 2), strength=0.7, radius=4.0),  # wraps onto itself
+    ]
+    fields = [BiasField(SimulationConfig(grid_size=6, backend=backend)) for backend in ("python", "numpy")]
+    for field in fields:
+        for pulse in pulses:
+            field.apply_pulse(pulse, strength_scale=1.3)
+            field.decay()
+
+    reference, arrays = fields
+    assert arrays.values.tolist() == reference.values
+    assert arrays.amplitude() == reference.amplitude()
+
+
+def test_lazy_decay_tracks_eager_values_and_amplitude():
+    config = SimulationConfig(grid_size=6, bias_decay=1e-40, bias_strength=0.3, pulses=[])
+    field = BiasField(config)
+    field.apply_pulse(BiasPulse(step=0, position=(1, 1, 1), strength=2.0, radius=1.5))
+    eager = field.values
+
+    for _ in range(5):  # scale drops below RENORM_FLOOR on the fourth decay
+        field.decay()
+        eager = [v * config.bias_decay for v in eager]
+    assert field.renormalizations == 1
+    assert field.values == pytest.approx(eager, rel=1e-12, abs=0.0)
+
+    peak = field.amplitude()
+    assert peak == max(abs(v) for v in field.values)
+    # Pull the peak cell down: the tracked amplitude must follow.
+    field.apply_pulse(BiasPulse(step=0, position=(1, 1, 1), strength=-1.5 * peak / 0.3, radius=0.5))
+    assert field.amplitude() == max(abs(v) for v in field.values)
+    assert field.amplitude() < peak
+
+    raw, scale = field.view()
+    assert raw is field.raw
+    assert [v * scale for v in raw] == field.values
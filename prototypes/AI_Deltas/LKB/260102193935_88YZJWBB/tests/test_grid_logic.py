@@ -1,9 +1,12 @@
 import random
 
+import pytest
+
 from lkb_delta.bias import BiasField
 from lkb_delta.config import BiasPulse, SimulationConfig
-from lkb_delta.grid import PhaseGrid
+from lkb_delta.grid import PhaseGrid, _neighbor_columns, neighbor_table
 from lkb_delta.lenses import LensMixer
+from lkb_delta.simulation import run_session
 
 
 def test_forgiveness_damps_high_energy():
@@ -28,3 +31,89 @@ def test_forgiveness_damps_high_energy():
     forgiveness_triggered = grid.step(bias.flatten(), lens_output)
     assert forgiveness_triggered
     assert max(abs(p) for p in grid.plasma) <= 1.5
+
+
+def test_neighbor_table_matches_wrapped_coordinates():
+    config = SimulationConfig(grid_size=4)
+    grid = PhaseGrid(config, random.Random(1))
+    for i in range(grid.count):
+        x, y, z = grid._coords(i)
+        expected = [
+            grid._index(x + 1, y, z),
+            grid._index(x - 1, y, z),
+            grid._index(x, y + 1, z),
+            grid._index(x, y - 1, z),
+            grid._index(x, y, z + 1),
+            grid._index(x, y, z - 1),
+        ]
+        assert list(grid.neighbors[6 * i:6 * i + 6]) == expected
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 5])
+def test_numpy_neighbor_columns_match_table(size):
+    pytest.importorskip("numpy")
+    columns = _neighbor_columns(size)
+    assert columns.shape == (6, size ** 3)
+    assert columns.T.ravel().tolist() == list(neighbor_table(size))
+
+
+def test_numpy_step_reproduces_reference_given_same_draws():
+    np = pytest.importorskip("numpy")
+    config = SimulationConfig(grid_size=5, forgiveness_threshold=0.5, path_b_span=0.3)
+    config.pulses = [BiasPulse(step=0, position=(2, 2, 2), strength=2.0, radius=1.5)]
+    bias = BiasField(config)
+    bias.apply_pulses(config.pulses, current_step=0)
+    lens = LensMixer(config.lens_weights, config.path_b_base, config.path_b_span, config.harmonic_clamp)
+
+    reference = PhaseGrid(config, random.Random(11))
+    array_config = SimulationConfig(grid_size=5, forgiveness_threshold=0.5, path_b_span=0.3, backend="numpy")
+    arrays = PhaseGrid(array_config, random.Random(11))
+    assert arrays.plasma.tolist() == reference.plasma
+
+    lens_output = lens.mix(*reference.metrics(), bias.amplitude())
+    replay = random.Random()
+    replay.setstate(reference.rng.getstate())
+    draws = [replay.random() for _ in range(2 * reference.count)]
+
+    expected = reference.step(bias.flatten(), lens_output)
+    triggered = arrays._step_arrays(bias.flatten(), lens_output, np.array(draws[0::2]), np.array(draws[1::2]))
+    assert triggered == expected
+    assert arrays.plasma.tolist() == reference.plasma
+    assert arrays.liquid.tolist() == reference.liquid
+    assert arrays.solid.tolist() == reference.solid
+
+
+def test_numpy_backend_is_deterministic_and_bounded():
+    pytest.importorskip("numpy")
+    config = SimulationConfig(grid_size=6, steps=12, backend="numpy").with_defaults()
+    first = [r.to_dict() for r in run_session(config)["steps"]]
+    second = [r.to_dict() for r in run_session(config)["steps"]]
+    assert first == second
+
+    grid = PhaseGrid(config, random.Random(2))
+    lens = LensMixer(config.lens_weights, config.path_b_base, config.path_b_span, config.harmonic_clamp)
+    for _ in range(5):
+        grid.perturb()
+        grid.step([], lens.mix(*grid.metrics(), 0.0))
+    assert float(abs(grid.plasma).max()) <= 1.5
+
+
+@pytest.mark.parametrize("backend", ["python", "numpy"])
+def test_step_metrics_match_full_passes_and_survive_perturb(backend):
+    if backend == "numpy":
+        pytest.importorskip("numpy")
+    config = SimulationConfig(grid_size=5, backend=backend)
+    grid = PhaseGrid(config, random.Random(4))
+    lens = LensMixer(config.lens_weights, config.path_b_base, config.path_b_span, config.harmonic_clamp)
+    for _ in range(3):
+        grid.perturb()
+        grid.step([], lens.mix(*grid.last_step_metrics(), 0.0))
+        energy, dispersion = grid.last_step_metrics()
+        assert energy == pytest.approx(grid.metrics()[0], rel=1e-12)
+        assert dispersion == pytest.approx(grid.metrics()[1], rel=1e-9)
+        grid.perturb()
+        assert grid.metrics() == pytest.approx((energy, dispersion), rel=1e-9)
+
+    grid.plasma = [1.0] * grid.count  # direct assignment, as callers may do
+    assert grid.metrics()[0] == 1.0
+    assert grid.last_step_metrics()[0] == energy
@@ -0,0 +1,54 @@
+import csv
+import io
+
+import pytest
+
+from lkb_delta.records import StepRecord, StepRecords
+
+
+def _fill(records, count):
+    for step in range(count):
+        records.append(
+            step=step,
+            energy=0.5 * step,
+            dispersion=0.1,
+            bias_amplitude=1.0 / (step + 1),
+            path_b_probability=0.6,
+            damping=0.3,
+            forgiveness_triggered=step % 3 == 0,
+        )
+
+
+def test_records_grow_and_read_back_as_step_records():
+    records = StepRecords(capacity=2)
+    _fill(records, 7)
+
+    assert len(records) == 7
+    assert records.capacity == 8
+    assert records[-1] == StepRecord(6, 3.0, 0.1, 1.0 / 7, 0.6, 0.3, True)
+    assert [r.step for r in records[1:3]] == [1, 2]
+    assert all(isinstance(r.forgiveness_triggered, bool) for r in records)
+    assert records.mean("energy") == pytest.approx(1.5)
+    assert records.total("forgiveness_triggered") == 3
+    assert records.column("step").tolist() == list(range(7))
+    with pytest.raises(IndexError):
+        records[7]
+
+
+def test_records_round_trip_through_npz_and_csv(tmp_path):
+    records = StepRecords()
+    _fill(records, 5)
+
+    buffer = io.StringIO()
+    records.write_csv(buffer)
+    rows = list(csv.DictReader(io.StringIO(buffer.getvalue())))
+    assert [int(row["step"]) for row in rows] == list(range(5))
+    assert [row["forgiveness_triggered"] for row in rows] == ["True", "False", "False", "True", "False"]
+
+    pytest.importorskip("numpy")
+    path = tmp_path / "records.npz"
+    records.save_npz(path)
+    loaded = StepRecords.load_npz(path)
+    assert list(loaded) == list(records)
+    _fill(loaded, 1)  # loaded stores keep growing
+    assert len(loaded) == 6
@@ -0,0 +1,72 @@
+"""Step time and prefetch counters with a recorded bias stream.
+
+Usage: PYTHONPATH=src python benchmarks/bench_bias_source.py [--grid 64] [--frames 64] [--steps 60]
+Writes a float32 ``(frames, n, n, n)`` stack to a temp dir, then runs the swarm
+without a source, with synchronous reads (``prefetch=1``) and with prefetch.
+Runs are repeated with the file evicted from the page cache (``cold``, via
+``posix_fadvise`` where available) and with it resident (``warm``). Prints a
+Markdown table (the README numbers come from this script).
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from dataclasses import replace
+from pathlib import Path
+
+import numpy as np
+
+from phasecube_delta.bias_source import NpyBiasSource
+from phasecube_delta.config import DEFAULT_CONFIG
+from phasecube_delta.multigrid import MultiGridSwarm
+
+
+def evict(path: Path) -> bool:
+    if not hasattr(os, "posix_fadvise"):
+        return False
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+    return True
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--grid", type=int, default=64)
+    parser.add_argument("--frames", type=int, default=64)
+    parser.add_argument("--steps", type=int, default=60)
+    parser.add_argument("--prefetch", type=int, default=4)
+    args = parser.parse_args()
+    cfg = replace(DEFAULT_CONFIG, grid_size=args.grid, dtype="float32")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bias.npy"
+        stack = np.lib.format.open_memmap(path, mode="w+", dtype=np.float32, shape=(args.frames,) + (args.grid,) * 3)
+        rng = np.random.default_rng(0)
+        for i in range(args.frames):
+            stack[i] = rng.standard_normal((args.grid,) * 3, dtype=np.float32)
+        stack.flush()
+        del stack
+        print("| source | cache | ms/step | hits | misses |")
+        print("|---|---|---|---|---|")
+        runs = [("none", None, "-")]
+        for cache in ("cold", "warm"):
+            runs += [("sync (prefetch=1)", 1, cache), (f"prefetch={args.prefetch}", args.prefetch, cache)]
+        for label, prefetch, cache in runs:
+            if cache == "cold" and not evict(path):
+                continue
+            source = NpyBiasSource(path, prefetch=prefetch, gain=0.05) if prefetch else None
+            with MultiGridSwarm(cfg, seed=0, bias_source=source) as swarm:
+                start = time.perf_counter()
+                summary = swarm.run(args.steps, 0.05)
+                elapsed = (time.perf_counter() - start) / args.steps
+            counters = summary.get("bias_source", {"hits": "-", "misses": "-"})
+            print(f"| {label} | {cache} | {elapsed * 1e3:.1f} | {counters['hits']} | {counters['misses']} |")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Time CoupledSwarm as the grid count grows, for ring (sparse) and all-to-all (dense) coupling.
+
+Usage: PYTHONPATH=src python benchmarks/bench_coupled.py [--grid 16] [--counts 3 8 16 32 64] [--steps 10]
+Prints a Markdown table (the README numbers come from this script).
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from dataclasses import replace
+
+import numpy as np
+
+from phasecube_delta.config import DEFAULT_CONFIG
+from phasecube_delta.coupled import Coupling, CoupledSwarm
+
+
+def per_step(cfg, coupling: Coupling, steps: int) -> float:
+    swarm = CoupledSwarm(cfg, coupling, seed=0)
+    swarm.run(1, 0.05)  # size the arena
+    start = time.perf_counter()
+    swarm.run(steps, 0.05)
+    return (time.perf_counter() - start) / steps
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--grid", type=int, default=16)
+    parser.add_argument("--counts", type=int, nargs="+", default=[3, 8, 16, 32, 64])
+    parser.add_argument("--steps", type=int, default=10)
+    args = parser.parse_args()
+    cfg = replace(DEFAULT_CONFIG, grid_size=args.grid)
+    print("| grids | ring ms/step | ring ms/grid | dense ms/step | dense ms/grid |")
+    print("|---|---|---|---|---|")
+    for count in args.counts:
+        ring = per_step(cfg, Coupling.ring(count), args.steps)
+        full = np.full((count, count), 0.1 / count)
+        dense = per_step(cfg, Coupling(full, full, 1.0, 0.5), args.steps)
+        print(
+            f"| {count} | {ring * 1e3:.1f} | {ring * 1e3 / count:.2f} "
+            f"| {dense * 1e3:.1f} | {dense * 1e3 / count:.2f} |"
+        )
+
+
+if __name__ == "__main__":
+    main()
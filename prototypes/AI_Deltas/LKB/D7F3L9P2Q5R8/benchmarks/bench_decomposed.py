@@ -0,0 +1,83 @@
+"""Strong and weak scaling of DecomposedGrid against a single-process PhaseGrid.
+
+Usage: PYTHONPATH=src python benchmarks/bench_decomposed.py [--grid 128] [--workers 1 2 4] [--steps 5]
+Strong scaling keeps the grid fixed; weak scaling grows it so every worker
+owns about ``grid^3 / max(workers)`` cells. Step time covers perturb + step.
+Prints Markdown tables. Speedups only mean something on a host with at least
+``max(workers)`` free cores.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from dataclasses import replace
+
+import numpy as np
+
+from phasecube_delta.config import DEFAULT_CONFIG, SimulationConfig
+from phasecube_delta.decomposed import DecomposedGrid
+from phasecube_delta.grid import PhaseGrid
+
+WEIGHTS = {"harmonic": 0.3, "predictive": 0.3, "systemic": 0.2, "human": 0.2}
+
+
+def time_single(cfg: SimulationConfig, steps: int) -> float:
+    grid = PhaseGrid(cfg, np.random.default_rng(0), label="core")
+    noise = np.random.default_rng(1)
+    bias = np.empty(grid.plasma.shape, dtype=grid.plasma.dtype)
+    start = time.perf_counter()
+    for _ in range(steps):
+        grid.perturb()
+        noise.standard_normal(out=bias, dtype=bias.dtype)
+        bias *= 0.05
+        grid.step(bias, WEIGHTS)
+    return (time.perf_counter() - start) / steps
+
+
+def time_decomposed(cfg: SimulationConfig, workers: int, steps: int) -> float:
+    with DecomposedGrid(cfg, workers=workers, seed=0) as grid:
+        grid.perturb()
+        grid.step_local_bias(WEIGHTS, 0.05)  # warm up
+        start = time.perf_counter()
+        for _ in range(steps):
+            grid.perturb()
+            grid.step_local_bias(WEIGHTS, 0.05)
+        return (time.perf_counter() - start) / steps
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--grid", type=int, default=128)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--steps", type=int, default=5)
+    parser.add_argument("--dtype", default="float64")
+    args = parser.parse_args()
+    cfg = replace(DEFAULT_CONFIG, grid_size=args.grid, dtype=args.dtype)
+    cores = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count()
+    print(f"cores available: {cores}\n")
+
+    single = time_single(cfg, args.steps)
+    print(f"Strong scaling, {args.grid}^3 (single-process PhaseGrid: {single * 1e3:.0f} ms/step)\n")
+    print("| workers | ms/step | speedup vs 1 worker | efficiency |")
+    print("|---|---|---|---|")
+    base = None
+    for workers in args.workers:
+        elapsed = time_decomposed(cfg, workers, args.steps)
+        base = base or elapsed
+        print(f"| {workers} | {elapsed * 1e3:.0f} | {base / elapsed:.2f}x | {base / elapsed / workers:.0%} |")
+
+    top = max(args.workers)
+    print(f"\nWeak scaling, ~{args.grid}^3/{top} cells per worker\n")
+    print("| workers | grid | ms/step | efficiency |")
+    print("|---|---|---|---|")
+    base = None
+    for workers in args.workers:
+        size = max(workers, round(args.grid * (workers / top) ** (1 / 3)))
+        elapsed = time_decomposed(replace(cfg, grid_size=size), workers, args.steps)
+        base = base or elapsed
+        print(f"| {workers} | {size}^3 | {elapsed * 1e3:.0f} | {base / elapsed:.0%} |")
+
+
+if __name__ == "__main__":
+    main()
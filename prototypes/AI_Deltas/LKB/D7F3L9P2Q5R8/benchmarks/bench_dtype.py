@@ -0,0 +1,50 @@
+"""Compare float64 vs float32 tri-grid step time and resident state size.
+
+Usage: PYTHONPATH=src python benchmarks/bench_dtype.py [--sizes 32 64 128] [--steps 10]
+Prints a Markdown table (the README numbers come from this script).
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from dataclasses import replace
+
+from phasecube_delta.config import DEFAULT_CONFIG
+from phasecube_delta.multigrid import MultiGridSwarm
+
+
+def state_bytes(swarm: MultiGridSwarm) -> int:
+    grids = (swarm.core, swarm.echo, swarm.memory)
+    fields = sum(g.plasma.nbytes + g.liquid.nbytes + g.solid.nbytes + g.parity.nbytes for g in grids)
+    cache = sum(g._plasma_neighbor_sum.nbytes for g in grids)
+    ring = swarm.delay._ring.nbytes * 2 if swarm.delay._ring is not None else 0  # ring + accumulator
+    return fields + cache + ring + swarm.arena.nbytes
+
+
+def measure(size: int, dtype: str, steps: int) -> tuple[float, int]:
+    swarm = MultiGridSwarm(replace(DEFAULT_CONFIG, grid_size=size, dtype=dtype), seed=1)
+    swarm.step(0, 0.05)  # size the arena and delay ring
+    start = time.perf_counter()
+    for i in range(1, steps + 1):
+        swarm.step(i, 0.05)
+    return (time.perf_counter() - start) / steps, state_bytes(swarm)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[32, 64, 128])
+    parser.add_argument("--steps", type=int, default=10)
+    args = parser.parse_args()
+    print("| grid | float64 step | float32 step | speedup | float64 state | float32 state |")
+    print("|---|---|---|---|---|---|")
+    for size in args.sizes:
+        t64, b64 = measure(size, "float64", args.steps)
+        t32, b32 = measure(size, "float32", args.steps)
+        print(
+            f"| {size}^3 | {t64 * 1e3:.1f} ms | {t32 * 1e3:.1f} ms | {t64 / t32:.2f}x "
+            f"| {b64 / 2**20:.1f} MiB | {b32 / 2**20:.1f} MiB |"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""Compare B separate swarms against one ensemble swarm with B replicas.
+
+Usage: PYTHONPATH=src python benchmarks/bench_ensemble.py [--sizes 4 8 16 32] [--replicas 32] [--steps 20]
+Prints a Markdown table (the README numbers come from this script).
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from dataclasses import replace
+
+from phasecube_delta.config import DEFAULT_CONFIG
+from phasecube_delta.multigrid import MultiGridSwarm
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[4, 8, 16, 32])
+    parser.add_argument("--replicas", type=int, default=32)
+    parser.add_argument("--steps", type=int, default=20)
+    args = parser.parse_args()
+    print(f"| grid | {args.replicas} separate swarms | ensemble of {args.replicas} | speedup |")
+    print("|---|---|---|---|")
+    for size in args.sizes:
+        cfg = replace(DEFAULT_CONFIG, grid_size=size)
+        start = time.perf_counter()
+        for seed in range(args.replicas):
+            MultiGridSwarm(cfg, seed=seed).run(args.steps, 0.05)
+        loop = time.perf_counter() - start
+        start = time.perf_counter()
+        MultiGridSwarm(replace(cfg, ensemble_size=args.replicas), seed=0).run(args.steps, 0.05)
+        batched = time.perf_counter() - start
+        print(f"| {size}^3 | {loop:.3f} s | {batched:.3f} s | {loop / batched:.1f}x |")
+
+
+if __name__ == "__main__":
+    main()
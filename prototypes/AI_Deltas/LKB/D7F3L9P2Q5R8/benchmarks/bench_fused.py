@@ -0,0 +1,57 @@
+"""Whole-array PhaseGrid.step vs the fused slab kernel (``fused_step=True``).
+
+Usage: PYTHONPATH=src python benchmarks/bench_fused.py [--sizes 64 128 256] [--steps 6]
+Times ``step()`` alone (perturb runs outside the timer) and checks that both
+modes leave identical fields. Prints a Markdown table (the README numbers come
+from this script).
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from dataclasses import replace
+
+import numpy as np
+
+from phasecube_delta.config import DEFAULT_CONFIG
+from phasecube_delta.grid import PhaseGrid
+from phasecube_delta.lenses import LensScheduler
+
+
+def time_steps(cfg, steps: int, bias: np.ndarray) -> tuple[float, PhaseGrid]:
+    scheduler = LensScheduler(cfg.lens_schedule, cfg)
+    grid = PhaseGrid(cfg, np.random.default_rng(0), "bench")
+    grid.perturb()
+    grid.step(bias, {}, scheduler.tunables(0))  # size the arena
+    total = 0.0
+    for t in range(1, steps + 1):
+        grid.perturb()
+        start = time.perf_counter()
+        grid.step(bias, {}, scheduler.tunables(t))
+        total += time.perf_counter() - start
+    return total / steps, grid
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[64, 128, 256])
+    parser.add_argument("--steps", type=int, default=6)
+    args = parser.parse_args()
+    print("| grid | dtype | array step | fused step | speedup |")
+    print("|---|---|---|---|---|")
+    for size in args.sizes:
+        for dtype in ("float64", "float32"):
+            cfg = replace(DEFAULT_CONFIG, grid_size=size, dtype=dtype)
+            bias = np.random.default_rng(3).normal(0.0, 0.05, (size,) * 3).astype(dtype)
+            array_time, array_grid = time_steps(cfg, args.steps, bias)
+            fused_time, fused_grid = time_steps(replace(cfg, fused_step=True), args.steps, bias)
+            assert np.array_equal(array_grid.liquid, fused_grid.liquid)
+            print(
+                f"| {size}^3 | {dtype} | {array_time * 1e3:.1f} ms | {fused_time * 1e3:.1f} ms "
+                f"| {array_time / fused_time:.2f}x |"
+            )
+            del array_grid, fused_grid
+
+
+if __name__ == "__main__":
+    main()
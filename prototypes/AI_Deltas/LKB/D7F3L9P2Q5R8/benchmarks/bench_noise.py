@@ -0,0 +1,49 @@
+"""Cost and statistics of each BiasNoise mode.
+
+Usage: PYTHONPATH=src python benchmarks/bench_noise.py [--sizes 64 128] [--fills 20]
+Prints a Markdown table (the README numbers come from this script). ``lag-1 x``
+is the correlation between x-neighbours, and ``lag-1 t`` is the correlation of
+a cell with itself one fill later.
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+
+from phasecube_delta.noise import BiasNoise
+
+MODES = (("fresh", {}), ("bank", {"bank_factor": 4}), ("lowres", {"lowres_factor": 2}), ("lowres", {"lowres_factor": 4}))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[64, 128])
+    parser.add_argument("--fills", type=int, default=20)
+    args = parser.parse_args()
+    print("| grid | dtype | mode | ms/fill | std | lag-1 x | lag-1 t |")
+    print("|---|---|---|---|---|---|---|")
+    for size in args.sizes:
+        for dtype in (np.float64, np.float32):
+            for mode, options in MODES:
+                noise = BiasNoise(np.random.default_rng(0), mode=mode, **options)
+                out = np.empty((size,) * 3, dtype=dtype)
+                noise.fill(out, 1.0)  # draw the bank / size the scratch
+                previous = out.copy()
+                start = time.perf_counter()
+                for _ in range(args.fills):
+                    noise.fill(out, 1.0)
+                cost = (time.perf_counter() - start) / args.fills
+                lag_x = np.corrcoef(out[:-1].ravel(), out[1:].ravel())[0, 1]
+                noise.fill(previous, 1.0)
+                lag_t = np.corrcoef(out.ravel(), previous.ravel())[0, 1]
+                label = mode if mode != "lowres" else f"lowres f={options['lowres_factor']}"
+                print(
+                    f"| {size}^3 | {np.dtype(dtype).name} | {label} | {cost * 1e3:.2f} "
+                    f"| {out.std():.3f} | {lag_x:+.3f} | {lag_t:+.3f} |"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Persistent scratch buffers for allocation-free stepping (SV7).
+
+Grids and the swarm ask the arena for named work arrays instead of building
+temporaries, so after the first step every whole-grid intermediate reuses the
+same memory. The arena counts the bytes it allocates, both in total and since
+the last ``begin_step()``, so a regression that introduces new buffers (or
+shape churn) shows up as a non-zero ``step_bytes`` in steady state.
+"""
+from __future__ import annotations
+
+import threading
+from typing import Dict, Tuple
+
+import numpy as np
+
+
+class ScratchArena:
+    def __init__(self) -> None:
+        self._buffers: Dict[str, np.ndarray] = {}
+        self._lock = threading.Lock()  # grids may request buffers from worker threads
+        self.total_bytes = 0
+        self.step_bytes = 0
+
+    def get(self, name: str, shape: Tuple[int, ...], dtype: np.dtype | type = np.float64) -> np.ndarray:
+        """Return the buffer ``name``, (re)allocating it only on first use or a shape/dtype change."""
+        with self._lock:
+            buffer = self._buffers.get(name)
+            if buffer is None or buffer.shape != tuple(shape) or buffer.dtype != np.dtype(dtype):
+                buffer = np.empty(shape, dtype=dtype)
+                self._buffers[name] = buffer
+                self.total_bytes += buffer.nbytes
+                self.step_bytes += buffer.nbytes
+            return buffer
+
+    def begin_step(self) -> None:
+        """Reset the per-step allocation counter."""
+        self.step_bytes = 0
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes currently held by live buffers."""
+        return sum(buffer.nbytes for buffer in self._buffers.values())
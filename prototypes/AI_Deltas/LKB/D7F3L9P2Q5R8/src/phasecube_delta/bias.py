@@ -13,29 +13,100 @@ import numpy as np
 
 @dataclass
 class DelayLine:
+    """Ring buffer of bias frames with a recursively decayed accumulator.
+
+    Frames live in one preallocated ``(length, *frame.shape)`` array, and the
+    replay sum ``sum(decay**i * frame[-1 - i])`` is updated on every push as
+    ``decay * acc + new - decay**length * evicted``. Push and replay therefore
+    cost the same for any ``length``. The accumulator is rebuilt exactly each
+    time the ring wraps (amortized one extra pass per push) so cancellation
+    error from the evictions cannot build up. The weighted eviction goes
+    through a preallocated scratch frame, so steady-state pushes allocate
+    nothing.
+    """
+
     length: int
     decay: float
 
     def __post_init__(self) -> None:
-        self.frames: List[np.ndarray] = []
+        if self.length < 1:
+            raise ValueError("length must be >= 1")
+        self._ring: np.ndarray | None = None
+        self._acc: np.ndarray | None = None
+        self._scratch: np.ndarray | None = None
+        self._head = 0  # slot the next frame is written to
+        self._count = 0
+        self._evict_weight = self.decay ** self.length
+
+    @property
+    def frames(self) -> List[np.ndarray]:
+        """Stored frames, oldest first (views into the ring buffer)."""
+        if self._ring is None:
+            return []
+        start = (self._head - self._count) % self.length
+        return [self._ring[(start + i) % self.length] for i in range(self._count)]
 
     def push(self, frame: np.ndarray) -> None:
-        """Store a bias frame, trimming to bounded length."""
-        self.frames.append(np.array(frame, copy=True))
-        if len(self.frames) > self.length:
-            self.frames.pop(0)
+        """Store a bias frame, evicting the oldest once ``length`` are held."""
+        dtype = getattr(frame, "dtype", np.dtype(np.float64))
+        if self._ring is None or self._ring.shape[1:] != np.shape(frame) or self._ring.dtype != dtype:
+            # Frames keep their own precision (float32 grids get float32 frames).
+            self._ring = np.zeros((self.length, *np.shape(frame)), dtype=dtype)
+            self._acc = np.zeros(np.shape(frame), dtype=dtype)
+            self._scratch = np.empty(np.shape(frame), dtype=dtype)
+            self._head = 0
+            self._count = 0
+        slot = self._ring[self._head]
+        acc = self._acc
+        acc *= self.decay
+        if self._count == self.length:
+            acc -= np.multiply(slot, self._evict_weight, out=self._scratch)
+        else:
+            self._count += 1
+        slot[...] = frame
+        acc += slot
+        self._head = (self._head + 1) % self.length
+        if self._head == 0:
+            self._rebuild()
+
+    def _rebuild(self) -> None:
+        acc = self._acc
+        acc.fill(0.0)
+        for frame in self.frames:
+            acc *= self.decay
+            acc += frame
 
     def replay(self) -> np.ndarray:
-        """Blend stored frames with exponential decay."""
-        if not self.frames:
+        """Decay-weighted sum of stored frames (newest weighted 1).
+
+        Returns a read-only view of the accumulator; it changes on the next
+        ``push``, so copy it if it must outlive the current step.
+        """
+        if self._acc is None:
             return np.array([])
-        acc = np.zeros_like(self.frames[-1])
-        for i, frame in enumerate(reversed(self.frames)):
-            acc += frame * (self.decay ** i)
-        return acc
+        view = self._acc.view()
+        view.flags.writeable = False
+        return view
+
 
+def make_bias_field(
+    grid_size: int,
+    rng: np.random.Generator,
+    magnitude: float,
+    out: np.ndarray | None = None,
+    dtype: np.dtype | type = np.float64,
+) -> np.ndarray:
+    """Create a decaying bias field seeded from stochastic noise (SV2/SV5).
 
-def make_bias_field(grid_size: int, rng: np.random.Generator, magnitude: float) -> np.ndarray:
-    """Create a decaying bias field seeded from stochastic noise (SV2/SV5)."""
-    base = rng.normal(loc=0.0, scale=magnitude, size=(grid_size, grid_size, grid_size))
-    return base
+    Pass ``out`` to draw into an existing ``(n, n, n)`` buffer instead of
+    allocating (its dtype wins over ``dtype``). float64 values match
+    ``rng.normal(0, magnitude, size)``; float32 draws use the float32 sampler.
+    """
+    size = (grid_size, grid_size, grid_size)
+    if out is None:
+        if np.dtype(dtype) == np.float64:
+            return rng.normal(loc=0.0, scale=magnitude, size=size)
+        out = np.empty(size, dtype=dtype)
+    rng.standard_normal(out=out, dtype=out.dtype)
+    out *= magnitude
+    return out
@@ -0,0 +1,127 @@
+"""Recorded bias streams injected into the core grid (SV2/SV6).
+
+A ``BiasSource`` hands ``MultiGridSwarm.step`` one influence-only frame per
+step. The frame is added (times ``gain``) to the core bias and never
+overwrites state. ``NpyBiasSource`` replays a ``(T, n, n, n)`` ``.npy``
+stack through ``np.load(mmap_mode="r")``, so multi-GB recordings are paged
+in on demand rather than loaded. A background thread keeps the next
+``prefetch - 1`` frames copied into a ring of resident slots, so disk reads
+overlap with stepping.
+"""
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Dict, List, Union
+
+import numpy as np
+
+
+class BiasSource:
+    """Interface: ``frame(step)`` returns an ``(n, n, n)`` array valid until the next call."""
+
+    gain: float = 1.0
+
+    def frame(self, step: int) -> np.ndarray:
+        raise NotImplementedError
+
+    def counters(self) -> Dict[str, int]:
+        return {}
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> "BiasSource":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+class NpyBiasSource(BiasSource):
+    """Memory-mapped ``.npy`` frame stack with a background prefetch ring.
+
+    Frames are consumed in step order and wrap around after the last one.
+    Slot ``s % prefetch`` holds step ``s``. The producer thread only fills
+    steps in ``(held, held + prefetch)``, where ``held`` is the frame the
+    swarm is currently using, so a returned frame is never overwritten under
+    the caller. A request whose slot is not ready counts as a miss and is
+    read synchronously into a spare buffer. Any other request counts as a
+    hit. A non-sequential request (a seek) restarts the prefetch window
+    after it. ``prefetch=1`` disables the thread, so every read is a
+    synchronous miss.
+    """
+
+    def __init__(self, path: Union[str, Path], prefetch: int = 4, gain: float = 1.0) -> None:
+        if prefetch < 1:
+            raise ValueError("prefetch must be >= 1")
+        self.path = Path(path)
+        self.data = np.load(self.path, mmap_mode="r")
+        if self.data.ndim < 4 or len(self.data) == 0:
+            raise ValueError(f"{self.path} must hold a non-empty (T, n, n, n) frame stack")
+        self.prefetch = prefetch
+        self.gain = gain
+        self.hits = 0
+        self.misses = 0
+        frame_shape = self.data.shape[1:]
+        self._slots = np.empty((prefetch, *frame_shape), dtype=self.data.dtype)
+        self._slot_step: List[int] = [-1] * prefetch
+        self._spare = np.empty(frame_shape, dtype=self.data.dtype)
+        self._held = -1
+        self._next = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+        if prefetch > 1:
+            self._thread = threading.Thread(target=self._produce, name=f"prefetch:{self.path.name}", daemon=True)
+            self._thread.start()
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def _read(self, step: int, out: np.ndarray) -> np.ndarray:
+        np.copyto(out, self.data[step % len(self.data)])
+        return out
+
+    def _produce(self) -> None:
+        while True:
+            with self._cond:
+                while not self._closed and self._next >= self._held + self.prefetch:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                # Skip frames the consumer already read synchronously.
+                self._next = max(self._next, self._held + 1)
+                step = self._next
+                slot = step % self.prefetch
+                self._slot_step[slot] = -1
+                self._next += 1
+            self._read(step, self._slots[slot])
+            with self._cond:
+                self._slot_step[slot] = step
+                self._cond.notify_all()
+
+    def frame(self, step: int) -> np.ndarray:
+        slot = step % self.prefetch
+        with self._cond:
+            ready = self._thread is not None and self._slot_step[slot] == step
+            if step != self._held + 1:
+                self._next = step + 1  # seek: restart the window after this frame
+            self._held = step
+            self._cond.notify_all()
+        if ready:
+            self.hits += 1
+            return self._slots[slot]
+        self.misses += 1
+        return self._read(step, self._spare)
+
+    def counters(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "prefetch": self.prefetch}
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
@@ -6,7 +6,14 @@ and human-readable. No hidden global state.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict
+from typing import Dict, Tuple
+
+import numpy as np
+
+# Floating dtypes accepted by SimulationConfig.dtype.
+DTYPES = ("float64", "float32")
+# Base bias noise generators accepted by SimulationConfig.bias_noise (see noise.py).
+NOISE_MODES = ("fresh", "bank", "lowres")
 
 
 @dataclass
@@ -44,6 +51,49 @@ class SimulationConfig:
     forgiveness_strength: float = 0.55
     max_steps: int = 200
     lens_schedule: LensSchedule = field(default_factory=LensSchedule)
+    # Storage dtype for grids, bias fields, delay frames and coupling terms.
+    # Metric reductions always accumulate in float64.
+    dtype: str = "float64"
+    # Replicas stepped together along a leading batch axis; 0 = single grid.
+    ensemble_size: int = 0
+    # Threads stepping core/echo/memory concurrently; results do not depend on it.
+    threads: int = 1
+    # Worker processes per MultiGridSwarm grid (see decomposed.py); 0 = in-process PhaseGrid.
+    workers: int = 0
+    # Base bias noise generator (see noise.py): "fresh", "bank" or "lowres".
+    bias_noise: str = "fresh"
+    noise_bank_factor: int = 4  # bank pool size in grids
+    noise_bank_refresh: int = 0  # redraw the bank every k fills; 0 = never
+    noise_lowres_factor: int = 2  # lowres block edge; must divide grid_size
+    # Evaluate PhaseGrid.step as two slab-by-slab passes (see PhaseGrid._step_fused).
+    fused_step: bool = False
+    slab_bytes: int = 1 << 20  # working-set target per slab, roughly one L2
+
+    def __post_init__(self) -> None:
+        if self.dtype not in DTYPES:
+            raise ValueError(f"dtype must be one of {DTYPES}, got {self.dtype!r}")
+        if self.ensemble_size < 0:
+            raise ValueError("ensemble_size must be >= 0")
+        if self.threads < 1:
+            raise ValueError("threads must be >= 1")
+        if self.workers < 0:
+            raise ValueError("workers must be >= 0")
+        if self.workers and self.ensemble_size:
+            raise ValueError("workers > 0 does not support ensemble_size; decompose one lattice at a time")
+        if self.bias_noise not in NOISE_MODES:
+            raise ValueError(f"bias_noise must be one of {NOISE_MODES}, got {self.bias_noise!r}")
+        if self.bias_noise == "lowres" and self.grid_size % self.noise_lowres_factor:
+            raise ValueError("noise_lowres_factor must divide grid_size")
+
+    @property
+    def field_shape(self) -> Tuple[int, ...]:
+        """Shape of each phase field: ``(n, n, n)`` or ``(B, n, n, n)``."""
+        spatial = (self.grid_size, self.grid_size, self.grid_size)
+        return (self.ensemble_size, *spatial) if self.ensemble_size else spatial
+
+    @property
+    def np_dtype(self) -> np.dtype:
+        return np.dtype(self.dtype)
 
 
 DEFAULT_CONFIG = SimulationConfig()
@@ -0,0 +1,396 @@
+"""Multi-process domain decomposition of a PhaseGrid (SV3/SV7).
+
+``DecomposedGrid`` splits the toroidal lattice into x-slabs, one per worker
+process. Plasma/liquid/solid/parity live in ``multiprocessing.shared_memory``
+blocks, so each worker updates its own slab in place and reads the one-plane
+halos of its neighbors (x-1 below the slab, x+1 above it) straight from the
+shared arrays. Plasma only changes in ``perturb()``, and every command ends at
+a barrier, so the halos a worker reads during ``step()`` are always settled.
+
+Global reductions are collective. Each worker posts a partial sum to a shared
+reduction table, waits at a barrier, then folds the table in a fixed order.
+Every worker therefore reaches the same dispersion and the same forgiveness
+decision, without the parent gathering any field data. ``np.std(mix)`` keeps
+its two-pass form: first the global mean, then the global sum of squared
+deviations.
+
+The bias comes from one of two places. ``step(bias_field, ...)`` mirrors
+``PhaseGrid.step``: workers read their slab of a shared ``bias`` block, which
+the caller either fills in place (``grid.bias``, no copy) or which the parent
+copies ``bias_field`` into. ``step_local_bias(...)`` has every worker draw
+Gaussian bias for its own slab instead, so no full-lattice array passes
+through the parent at all. ``MultiGridSwarm`` uses the first path when
+``config.workers > 0``, assembling its bias terms straight into each grid's
+shared block.
+
+Workers draw from their own ``SeedSequence`` streams, so results depend on
+the worker count and are statistically, not bitwise, equivalent to a
+single-process ``PhaseGrid``.
+"""
+from __future__ import annotations
+
+import multiprocessing as mp
+import threading
+from multiprocessing import shared_memory
+from multiprocessing.connection import wait as wait_for
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from . import lenses
+from .config import SimulationConfig
+from .grid import GridMetrics
+
+FIELDS: Tuple[Tuple[str, str], ...] = (
+    ("plasma", ""), ("liquid", ""), ("solid", ""), ("parity", "int8"), ("bias", "")
+)
+# Control slots written by the parent before each command.
+CMD, PATH_P, THRESHOLD, BIAS_GAIN, BIAS_MAG, BIAS_MODE = range(6)
+PERTURB, STEP, STOP = 1.0, 2.0, 3.0
+# Where a step's bias comes from: none, the shared bias block, or drawn per worker.
+NO_BIAS, SHARED_BIAS, LOCAL_BIAS = 0.0, 1.0, 2.0
+# Reduction columns, one row per worker.
+MIX_SUM, MIX_SQDEV, ENERGY_SUM, BIAS_SUM = range(4)
+BARRIER_TIMEOUT = 600.0
+
+
+def slab_bounds(grid_size: int, workers: int) -> List[Tuple[int, int]]:
+    """Contiguous x-ranges ``[x0, x1)`` covering the grid, sizes differing by at most one."""
+    if not 1 <= workers <= grid_size:
+        raise ValueError(f"workers must be in [1, {grid_size}], got {workers}")
+    edges = np.linspace(0, grid_size, workers + 1).round().astype(int)
+    return [(int(edges[i]), int(edges[i + 1])) for i in range(workers)]
+
+
+def slab_neighbor_sum(field: np.ndarray, x0: int, x1: int, out: np.ndarray) -> np.ndarray:
+    """Six-neighbor toroidal sum for ``field[x0:x1]``, reading x-halos from ``field``.
+
+    Terms accumulate in the order x-1, x+1, y-1, y+1, z-1, z+1, like
+    ``PhaseGrid._neighbor_sum``, so the slab result is bit-identical to the
+    matching rows of the full pass.
+    """
+    n = field.shape[0]
+    out[:1] = field[(x0 - 1) % n]
+    out[1:] = field[x0 : x1 - 1]
+    out[:-1] += field[x0 + 1 : x1]
+    out[-1:] += field[x1 % n]
+    slab = field[x0:x1]
+    out[:, 1:] += slab[:, :-1]
+    out[:, :1] += slab[:, -1:]
+    out[:, :-1] += slab[:, 1:]
+    out[:, -1:] += slab[:, :1]
+    out[:, :, 1:] += slab[:, :, :-1]
+    out[:, :, :1] += slab[:, :, -1:]
+    out[:, :, :-1] += slab[:, :, 1:]
+    out[:, :, -1:] += slab[:, :, :1]
+    return out
+
+
+def _open_block(name: str) -> shared_memory.SharedMemory:
+    # Spawned workers share the parent's resource tracker, which already
+    # tracks every block; the parent unlinks them in close().
+    return shared_memory.SharedMemory(name=name)
+
+
+def _attach(names: Dict[str, str], shape: Tuple[int, ...], dtype: str) -> Tuple[List[Any], Dict[str, np.ndarray]]:
+    handles, arrays = [], {}
+    for field, field_dtype in FIELDS:
+        handle = _open_block(names[field])
+        handles.append(handle)
+        arrays[field] = np.ndarray(shape, dtype=field_dtype or dtype, buffer=handle.buf)
+    return handles, arrays
+
+
+def _worker(
+    rank: int,
+    config: SimulationConfig,
+    bounds: List[Tuple[int, int]],
+    names: Dict[str, str],
+    seed_seq: np.random.SeedSequence,
+    start: Any,
+    inner: Any,
+) -> None:
+    n = config.grid_size
+    shape = (n, n, n)
+    handles, fields = _attach(names, shape, config.dtype)
+    control_handle = _open_block(names["control"])
+    reduce_handle = _open_block(names["reduce"])
+    control = np.ndarray((8,), dtype=np.float64, buffer=control_handle.buf)
+    table = np.ndarray((len(bounds), 4), dtype=np.float64, buffer=reduce_handle.buf)
+    x0, x1 = bounds[rank]
+    rng = np.random.default_rng(seed_seq)
+    dtype = config.np_dtype
+    plasma, liquid, solid, parity, shared_bias = (fields[name][x0:x1] for name, _ in FIELDS)
+    local_shape = plasma.shape
+    mix = np.empty(local_shape, dtype=dtype)
+    work = np.empty(local_shape, dtype=dtype)
+    uniform = np.empty(local_shape, dtype=dtype)
+    mask = np.empty(local_shape, dtype=np.bool_)
+    cells = n ** 3
+
+    for field in (plasma, liquid, solid):
+        rng.random(out=field, dtype=dtype)
+        field *= 0.5
+    parity[...] = rng.integers(0, 2, local_shape, dtype=np.int8)
+
+    def draw_mask(probability: float) -> np.ndarray:
+        rng.random(out=uniform, dtype=dtype)
+        return np.less(uniform, probability, out=mask)
+
+    def collective(column: int, value: float) -> float:
+        table[rank, column] = value
+        inner.wait(BARRIER_TIMEOUT)
+        # Every rank folds the table in the same order, so all agree bitwise.
+        return float(table[:, column].sum())
+
+    try:
+        start.wait(BARRIER_TIMEOUT)  # initial state written
+        while True:
+            start.wait(BARRIER_TIMEOUT)
+            command = control[CMD]
+            if command == STOP:
+                break
+            if command == PERTURB:
+                np.add(plasma, 1.0, out=work)
+                np.remainder(work, 1.0, out=work)
+                np.copyto(plasma, work, where=draw_mask(config.flip_probability))
+                parity ^= draw_mask(config.parity_probability)
+            elif command == STEP:
+                np.add(plasma, liquid, out=mix)
+                mix += solid
+                mix /= 3.0
+                slab_neighbor_sum(fields["plasma"], x0, x1, work)
+                work /= 6.0
+                np.subtract(plasma, work, out=work)
+                np.abs(work, out=work)
+                np.multiply(parity, 0.13, out=uniform)
+                work += uniform
+                np.copyto(mix, work, where=draw_mask(control[PATH_P]))
+
+                # Influence-only bias for the owned slab (SV2).
+                bias_mode = control[BIAS_MODE]
+                bias_sum = 0.0
+                if bias_mode != NO_BIAS:
+                    bias = shared_bias
+                    if bias_mode == LOCAL_BIAS:
+                        bias = rng.standard_normal(out=work, dtype=dtype)
+                        work *= control[BIAS_MAG]
+                    bias_sum = float(bias.sum(dtype=np.float64))
+                    np.multiply(bias, control[BIAS_GAIN], out=work)
+                    mix += work
+
+                mean = collective(MIX_SUM, float(mix.sum(dtype=np.float64))) / cells
+                np.subtract(mix, mean, out=work, casting="same_kind")
+                np.multiply(work, work, out=work)
+                dispersion = np.sqrt(collective(MIX_SQDEV, float(work.sum(dtype=np.float64))) / cells)
+                if dispersion > control[THRESHOLD]:
+                    mix *= config.forgiveness_strength
+
+                np.remainder(mix, 1.0, out=liquid)
+                solid *= 1.0 - config.alpha
+                np.multiply(mix, config.alpha, out=work)
+                solid += work
+                np.remainder(solid, 1.0, out=solid)
+
+                np.add(plasma, liquid, out=work)
+                table[rank, ENERGY_SUM] = work.sum(dtype=np.float64)
+                table[rank, BIAS_SUM] = bias_sum
+            start.wait(BARRIER_TIMEOUT)
+    except BaseException:
+        start.abort()
+        inner.abort()
+        raise
+    finally:
+        del plasma, liquid, solid, parity, shared_bias, fields, control, table
+        for handle in handles + [control_handle, reduce_handle]:
+            handle.close()
+
+
+class DecomposedGrid:
+    """A PhaseGrid split into x-slabs across worker processes.
+
+    Mirrors ``PhaseGrid.perturb``/``step``; ``step_local_bias`` lets the
+    workers draw the bias instead. Use it as a context manager, or call
+    ``close()`` to stop the workers and release the shared memory.
+    """
+
+    def __init__(
+        self,
+        config: SimulationConfig,
+        workers: int = 2,
+        seed: int | np.random.SeedSequence = 0,
+        label: str = "core",
+    ) -> None:
+        if config.ensemble_size:
+            raise ValueError("DecomposedGrid does not support ensemble_size; decompose one lattice at a time")
+        self.config = config
+        self.label = label
+        self.bounds = slab_bounds(config.grid_size, workers)
+        self.forgiveness_events = 0
+        n = config.grid_size
+        shape = (n, n, n)
+        self._blocks: List[shared_memory.SharedMemory] = []
+        self._names: Dict[str, str] = {}
+        self._fields: Dict[str, np.ndarray] = {}
+        for field, field_dtype in FIELDS:
+            dtype = np.dtype(field_dtype or config.dtype)
+            block = self._allocate(field, int(np.prod(shape)) * dtype.itemsize)
+            self._fields[field] = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+        self._control = np.ndarray((8,), dtype=np.float64, buffer=self._allocate("control", 8 * 8).buf)
+        self._table = np.ndarray((workers, 4), dtype=np.float64, buffer=self._allocate("reduce", workers * 4 * 8).buf)
+
+        ctx = mp.get_context("spawn")
+        self._start = ctx.Barrier(workers + 1)
+        self._inner = inner = ctx.Barrier(workers)
+        seed_seq = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+        streams = seed_seq.spawn(workers)
+        self._processes = [
+            ctx.Process(
+                target=_worker,
+                args=(rank, config, self.bounds, self._names, streams[rank], self._start, inner),
+                daemon=True,
+            )
+            for rank in range(workers)
+        ]
+        for process in self._processes:
+            process.start()
+        self._closed = False
+        threading.Thread(target=self._watch, daemon=True).start()
+        self._wait()
+
+    def _watch(self) -> None:
+        # A worker that dies mid-command would leave everyone else blocked
+        # at a barrier; break the barriers so the parent raises instead.
+        wait_for([process.sentinel for process in self._processes])
+        if not self._closed:
+            self._start.abort()
+            self._inner.abort()
+
+    def _wait(self) -> None:
+        try:
+            self._start.wait(BARRIER_TIMEOUT)
+        except threading.BrokenBarrierError:
+            codes = [process.exitcode for process in self._processes]
+            self.close()
+            raise RuntimeError(f"decomposed grid worker failed (exit codes {codes})") from None
+
+    def _allocate(self, name: str, nbytes: int) -> shared_memory.SharedMemory:
+        block = shared_memory.SharedMemory(create=True, size=max(nbytes, 1))
+        self._blocks.append(block)
+        self._names[name] = block.name
+        return block
+
+    @property
+    def workers(self) -> int:
+        return len(self.bounds)
+
+    def field(self, name: str) -> np.ndarray:
+        """Copy of a shared field (``plasma``, ``liquid``, ``solid``, ``parity`` or ``bias``)."""
+        return self._fields[name].copy()
+
+    # Live views of the shared fields, like PhaseGrid's attributes. Workers
+    # only write them during a command, so they are settled between calls.
+    @property
+    def plasma(self) -> np.ndarray:
+        return self._fields["plasma"]
+
+    @property
+    def liquid(self) -> np.ndarray:
+        return self._fields["liquid"]
+
+    @property
+    def solid(self) -> np.ndarray:
+        return self._fields["solid"]
+
+    @property
+    def parity(self) -> np.ndarray:
+        return self._fields["parity"]
+
+    @property
+    def bias(self) -> np.ndarray:
+        """Shared ``(n, n, n)`` bias block; fill it in place and pass it to ``step`` to skip the copy."""
+        return self._fields["bias"]
+
+    def _run(self, command: float) -> None:
+        self._control[CMD] = command
+        self._wait()  # release workers
+        self._wait()  # wait for completion
+
+    def perturb(self) -> None:
+        self._run(PERTURB)
+
+    def step(
+        self,
+        bias_field: np.ndarray,
+        lens_weights: Dict[str, float],
+        tunables: lenses.LensTunables | None = None,
+    ) -> GridMetrics:
+        """``PhaseGrid.step`` with a caller-supplied bias (empty for none).
+
+        ``bias_field`` is copied into the shared ``bias`` block unless it is
+        that block already.
+        """
+        if bias_field.size == 0:
+            return self._step(NO_BIAS, lens_weights, tunables)
+        if bias_field is not self._fields["bias"]:
+            np.copyto(self._fields["bias"], bias_field, casting="same_kind")
+        return self._step(SHARED_BIAS, lens_weights, tunables)
+
+    def step_local_bias(
+        self,
+        lens_weights: Dict[str, float],
+        bias_magnitude: float,
+        tunables: lenses.LensTunables | None = None,
+    ) -> GridMetrics:
+        """Step with Gaussian bias of std ``bias_magnitude`` drawn by each worker for its slab."""
+        self._control[BIAS_MAG] = bias_magnitude
+        return self._step(LOCAL_BIAS, lens_weights, tunables)
+
+    def _step(self, bias_mode: float, lens_weights: Dict[str, float], tunables: lenses.LensTunables | None) -> GridMetrics:
+        cfg = self.config
+        if tunables is None:
+            tunables = lenses.fuse_tunables(cfg, lens_weights)
+        path_p, threshold, bias_gain = tunables
+        self._control[PATH_P] = path_p
+        self._control[THRESHOLD] = threshold
+        self._control[BIAS_GAIN] = bias_gain
+        self._control[BIAS_MODE] = bias_mode
+        self._run(STEP)
+
+        cells = cfg.grid_size ** 3
+        dispersion = float(np.sqrt(self._table[:, MIX_SQDEV].sum() / cells))
+        if dispersion > threshold:
+            self.forgiveness_events += 1
+        return GridMetrics(
+            energy=float(self._table[:, ENERGY_SUM].sum() / cells / 2.0),
+            divergence=dispersion,
+            forgiveness_events=self.forgiveness_events,
+            mean_bias=float(self._table[:, BIAS_SUM].sum() / cells),
+        )
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        if all(process.is_alive() for process in self._processes) and not self._start.broken:
+            self._control[CMD] = STOP
+            try:
+                self._start.wait(BARRIER_TIMEOUT)
+            except threading.BrokenBarrierError:
+                pass
+        self._closed = True
+        for process in self._processes:
+            process.join(timeout=10)
+            if process.is_alive():
+                process.terminate()
+        self._fields.clear()
+        self._control = self._table = None  # type: ignore[assignment]
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+
+    def __enter__(self) -> "DecomposedGrid":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
@@ -2,89 +2,392 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Tuple
+from typing import Dict, List, Tuple, Union
 
 import numpy as np
 
+from .arena import ScratchArena
 from .config import SimulationConfig
 from . import lenses
 
 
+# Scalars for a single grid; shape-(B,) arrays when the grid holds an ensemble.
+Metric = Union[float, np.ndarray]
+# Slab-sized arrays alive in the fused step; sizes slabs from config.slab_bytes.
+SLAB_ARRAYS = 12
+
+
 @dataclass
 class GridMetrics:
-    energy: float
-    divergence: float
-    forgiveness_events: int
-    mean_bias: float
+    energy: Metric
+    divergence: Metric
+    forgiveness_events: Union[int, np.ndarray]
+    mean_bias: Metric
 
 
 class PhaseGrid:
-    def __init__(self, config: SimulationConfig, rng: np.random.Generator, label: str) -> None:
+    """Plasma/liquid/solid lattice with toroidal neighbors.
+
+    Plasma only changes in ``perturb()``, and only at the flipped cells, so the
+    grid caches the plasma neighbor sum and refreshes it around those cells
+    instead of re-rolling the whole field every step. Refreshed entries are
+    summed in the same order as the full ``np.roll`` pass, so the cache is
+    bit-identical to recomputing it.
+
+    ``perturb()`` and ``step()`` write every whole-grid intermediate into
+    buffers from ``arena`` (shared across grids by ``MultiGridSwarm``) and
+    update liquid/solid in place, so steady-state stepping allocates nothing
+    proportional to the grid.
+
+    With ``config.ensemble_size = B > 0`` every field gains a leading batch
+    axis, ``(B, n, n, n)``. Spatial operations act on the last three axes,
+    while dispersion, forgiveness and metrics are evaluated per replica, so
+    ``B`` independent replicas advance in one vectorized step.
+    """
+
+    def __init__(
+        self,
+        config: SimulationConfig,
+        rng: np.random.Generator,
+        label: str,
+        arena: ScratchArena | None = None,
+        scratch: str = "grid",
+    ) -> None:
         self.config = config
         self.rng = rng
         self.label = label
-        size = (config.grid_size, config.grid_size, config.grid_size)
-        self.plasma = self.rng.random(size) * 0.5
-        self.liquid = self.rng.random(size) * 0.5
-        self.solid = self.rng.random(size) * 0.5
+        self.arena = arena if arena is not None else ScratchArena()
+        # Arena namespace for step scratch; grids stepping concurrently need distinct ones.
+        self._buffers = {
+            name: f"{scratch}.{name}"
+            for name in ("random", "mask", "mix", "work", "slab.random", "slab.mask", "slab.work", "slab.term", "slab.square")
+        }
+        size = config.field_shape
+        dtype = config.np_dtype
+        self.plasma = self.rng.random(size, dtype=dtype) * 0.5
+        self.liquid = self.rng.random(size, dtype=dtype) * 0.5
+        self.solid = self.rng.random(size, dtype=dtype) * 0.5
         self.parity = self.rng.integers(0, 2, size, dtype=np.int8)
-        self.forgiveness_events = 0
+        self.batched = config.ensemble_size > 0
+        self.forgiveness_events: Union[int, np.ndarray] = (
+            np.zeros(config.ensemble_size, dtype=np.int64) if self.batched else 0
+        )
+        self._neighbor_source: np.ndarray | None = None
+        self._plasma_neighbor_sum = np.empty(0)
+
+    @staticmethod
+    def _per_replica(value: Metric) -> Metric:
+        """Shape per-replica values ``(B,)`` to broadcast against ``(B, n, n, n)``."""
+        if np.ndim(value) == 0:
+            return value
+        return np.reshape(value, (-1, 1, 1, 1))
+
+    def _spatial_mean(self, values: np.ndarray) -> Metric:
+        """float64 mean over the lattice: a float, or one value per replica."""
+        if not self.batched:
+            return float(values.mean(dtype=np.float64))
+        return values.mean(axis=(-3, -2, -1), dtype=np.float64)
+
+    def _draw_mask(self, probability: Metric) -> np.ndarray:
+        shape = self.plasma.shape
+        uniform = self.arena.get(self._buffers["random"], shape, self.plasma.dtype)
+        self.rng.random(out=uniform, dtype=uniform.dtype)
+        mask = self.arena.get(self._buffers["mask"], shape, np.bool_)
+        return np.less(uniform, self._per_replica(probability), out=mask)
 
     def perturb(self) -> None:
-        flips = self.rng.random(self.plasma.shape) < self.config.flip_probability
-        parity_flips = self.rng.random(self.parity.shape) < self.config.parity_probability
-        self.plasma = (self.plasma + flips.astype(float)) % 1.0
-        self.parity = (self.parity + parity_flips.astype(np.int8)) % 2
-
-    def neighbor_average(self, field: np.ndarray) -> np.ndarray:
-        return (
-            np.roll(field, 1, axis=0)
-            + np.roll(field, -1, axis=0)
-            + np.roll(field, 1, axis=1)
-            + np.roll(field, -1, axis=1)
-            + np.roll(field, 1, axis=2)
-            + np.roll(field, -1, axis=2)
-        ) / 6.0
+        self._ensure_neighbor_cache()
+        flipped = np.flatnonzero(self._draw_mask(self.config.flip_probability))
+        parity_flips = self._draw_mask(self.config.parity_probability)
+        plasma = self.plasma.reshape(-1)
+        plasma[flipped] = (plasma[flipped] + 1.0) % 1.0
+        self.parity ^= parity_flips
+        self._refresh_neighbor_sum(flipped)
+
+    @staticmethod
+    def _neighbor_sum(field: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+        """Six-neighbor toroidal sum over the last three axes via wrapped slices.
+
+        No ``np.roll`` copies. Terms accumulate in the order x-1, x+1, y-1,
+        y+1, z-1, z+1, matching ``_refresh_neighbor_sum``.
+        """
+        if out is None:
+            out = np.empty_like(field)
+
+        def at(axis: int, part: slice) -> Tuple[object, ...]:
+            return (Ellipsis, part) + (slice(None),) * (2 - axis)
+
+        out[at(0, slice(1, None))] = field[at(0, slice(None, -1))]
+        out[at(0, slice(0, 1))] = field[at(0, slice(-1, None))]
+        out[at(0, slice(None, -1))] += field[at(0, slice(1, None))]
+        out[at(0, slice(-1, None))] += field[at(0, slice(0, 1))]
+        for axis in (1, 2):
+            out[at(axis, slice(1, None))] += field[at(axis, slice(None, -1))]
+            out[at(axis, slice(0, 1))] += field[at(axis, slice(-1, None))]
+            out[at(axis, slice(None, -1))] += field[at(axis, slice(1, None))]
+            out[at(axis, slice(-1, None))] += field[at(axis, slice(0, 1))]
+        return out
+
+    def neighbor_average(self, field: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+        if field is self.plasma:
+            self._ensure_neighbor_cache()
+            return np.divide(self._plasma_neighbor_sum, 6.0, out=out)
+        total = self._neighbor_sum(field, out)
+        return np.divide(total, 6.0, out=total)
+
+    def resync(self) -> None:
+        """Rebuild the plasma neighbor-sum cache after in-place plasma edits."""
+        if self._plasma_neighbor_sum.shape != self.plasma.shape:
+            self._plasma_neighbor_sum = np.empty_like(self.plasma)
+        self._neighbor_sum(self.plasma, out=self._plasma_neighbor_sum)
+        self._neighbor_source = self.plasma
+
+    def _ensure_neighbor_cache(self) -> None:
+        if self._neighbor_source is not self.plasma:
+            self.resync()
+
+    def _refresh_neighbor_sum(self, flipped: np.ndarray) -> None:
+        """Recompute cached sums for the six neighbors of each flipped cell."""
+        shape = self.plasma.shape
+        n = shape[-1]
+        # The slice-based full pass is allocation-free and beats the gather
+        # path once more than ~0.4% of cells flipped (measured at 48^3-128^3).
+        if flipped.size * 256 >= self.plasma.size:
+            self.resync()
+            return
+        if not flipped.size:
+            return
+        *batch, x, y, z = np.unravel_index(flipped, shape)
+        batch = [np.tile(b, 6) for b in batch]
+        ax = np.concatenate(((x + 1) % n, (x - 1) % n, x, x, x, x))
+        ay = np.concatenate((y, y, (y + 1) % n, (y - 1) % n, y, y))
+        az = np.concatenate((z, z, z, z, (z + 1) % n, (z - 1) % n))
+        affected = np.unique(np.ravel_multi_index((*batch, ax, ay, az), shape))
+        *batch, x, y, z = np.unravel_index(affected, shape)
+        b = tuple(batch)
+        p = self.plasma
+        # Same operand order as the slice pass in _neighbor_sum.
+        self._plasma_neighbor_sum.reshape(-1)[affected] = (
+            p[b + ((x - 1) % n, y, z)]
+            + p[b + ((x + 1) % n, y, z)]
+            + p[b + (x, (y - 1) % n, z)]
+            + p[b + (x, (y + 1) % n, z)]
+            + p[b + (x, y, (z - 1) % n)]
+            + p[b + (x, y, (z + 1) % n)]
+        )
 
     def step(
         self,
         bias_field: np.ndarray,
-        lens_weights: Dict[str, float],
+        lens_weights: Dict[str, Metric],
+        tunables: lenses.LensTunables | None = None,
     ) -> GridMetrics:
         cfg = self.config
-        # Adjust tunables via lens fusion
-        path_p = lenses.fuse_path_probability(cfg.path_b_probability, lens_weights)
-        forgiveness_threshold = lenses.fuse_forgiveness_threshold(
-            cfg.forgiveness_threshold, lens_weights
-        )
-        bias_gain = lenses.fuse_bias_gain(cfg.bias_strength, lens_weights)
+        # Adjust tunables via lens fusion, unless the scheduler's table already did
+        if tunables is None:
+            tunables = lenses.fuse_tunables(cfg, lens_weights)
+        path_p, forgiveness_threshold, bias_gain = tunables
 
-        # Precompute neighbor averages for plasma and liquid to keep toroidal symmetry
-        neighbor_mean = self.neighbor_average(self.plasma)
-        path_a = (self.plasma + self.liquid + self.solid) / 3.0
-        path_b = np.abs(self.plasma - neighbor_mean) + (self.parity * 0.13)
+        if cfg.fused_step:
+            dispersion, energy, mean_bias = self._step_fused(bias_field, path_p, forgiveness_threshold, bias_gain)
+        else:
+            dispersion, energy, mean_bias = self._step_arrays(bias_field, path_p, forgiveness_threshold, bias_gain)
+        events = self.forgiveness_events.copy() if self.batched else self.forgiveness_events
 
-        branch = self.rng.random(self.plasma.shape) < path_p
-        mix = np.where(branch, path_b, path_a)
+        return GridMetrics(energy=energy, divergence=dispersion, forgiveness_events=events, mean_bias=mean_bias)
+
+    def _forgive(self, dispersion: Metric, threshold: Metric) -> Metric:
+        """Count forgiveness events; return the damping factor (per replica when batched)."""
+        strength = self.config.forgiveness_strength
+        if self.batched:
+            active = dispersion > threshold
+            self.forgiveness_events += active
+            return np.where(active, strength, 1.0)
+        forgiveness = strength if dispersion > threshold else 1.0
+        if forgiveness < 1.0:
+            self.forgiveness_events += 1
+        return forgiveness
+
+    def _step_arrays(
+        self, bias_field: np.ndarray, path_p: Metric, forgiveness_threshold: Metric, bias_gain: Metric
+    ) -> Tuple[Metric, Metric, Metric]:
+        """Whole-array update; returns (dispersion, energy, mean bias)."""
+        cfg = self.config
+        arena = self.arena
+        shape = self.plasma.shape
+        dtype = self.plasma.dtype
+        mix = arena.get(self._buffers["mix"], shape, dtype)
+        work = arena.get(self._buffers["work"], shape, dtype)
+
+        # path_a = (plasma + liquid + solid) / 3, built in the mix buffer
+        np.add(self.plasma, self.liquid, out=mix)
+        mix += self.solid
+        mix /= 3.0
+        # path_b = |plasma - neighbor mean| + parity * 0.13 (toroidal neighbors)
+        self.neighbor_average(self.plasma, out=work)
+        np.subtract(self.plasma, work, out=work)
+        np.abs(work, out=work)
+        parity_term = arena.get(self._buffers["random"], shape, dtype)
+        np.multiply(self.parity, 0.13, out=parity_term)
+        work += parity_term
+
+        branch = self._draw_mask(path_p)
+        np.copyto(mix, work, where=branch)
 
         # Influence-only bias; never overwrites internal state (SV2)
         if bias_field.size > 0:
-            mix += bias_field * bias_gain
+            np.multiply(bias_field, self._per_replica(bias_gain), out=work)
+            mix += work
 
-        dispersion = float(np.std(mix))
-        forgiveness = cfg.forgiveness_strength if dispersion > forgiveness_threshold else 1.0
-        if forgiveness < 1.0:
-            self.forgiveness_events += 1
-        damped_mix = mix * forgiveness
+        dispersion = self._std(mix, work)
+        forgiveness = self._forgive(dispersion, forgiveness_threshold)
+        if np.any(forgiveness < 1.0):
+            mix *= self._per_replica(forgiveness)
 
-        # Update phases
-        self.liquid = damped_mix % 1.0
-        self.solid = (self.solid * (1.0 - cfg.alpha) + damped_mix * cfg.alpha) % 1.0
+        # Update phases in place
+        np.remainder(mix, 1.0, out=self.liquid)
+        self.solid *= 1.0 - cfg.alpha
+        np.multiply(mix, cfg.alpha, out=work)
+        self.solid += work
+        np.remainder(self.solid, 1.0, out=self.solid)
         # TODO: add explicit plasticity rewiring hook; parity/flip noise is the current minimal stand-in to keep locality simple.
         # Plasma only drifts via perturbation; do not overwrite here
 
-        energy = float(np.mean(self.plasma + self.liquid) / 2.0)
-        divergence = float(dispersion)
-        mean_bias = float(np.mean(bias_field)) if bias_field.size else 0.0
+        np.add(self.plasma, self.liquid, out=work)
+        energy = self._spatial_mean(work) / 2.0
+        if bias_field.size == 0:
+            mean_bias: Metric = 0.0
+        elif self.batched and bias_field.ndim == 4:
+            mean_bias = self._spatial_mean(bias_field)
+        else:
+            mean_bias = float(np.mean(bias_field, dtype=np.float64))
+        return dispersion, energy, mean_bias
+
+    def _step_fused(
+        self, bias_field: np.ndarray, path_p: Metric, forgiveness_threshold: Metric, bias_gain: Metric
+    ) -> Tuple[Metric, Metric, Metric]:
+        """Slab-by-slab update in two passes; returns (dispersion, energy, mean bias).
+
+        The lattice is walked in slabs of whole planes along its outermost
+        (contiguous) spatial axis, sized so about ``SLAB_ARRAYS`` slab-sized
+        arrays fit in ``config.slab_bytes``. Pass 1 builds each slab's mix
+        (path_a/path_b, the branch draw and the bias) from the cached plasma
+        neighbor sum. It writes the mix to the arena and folds float64 sums for
+        the dispersion. Once the forgiveness decision is known, pass 2 damps
+        the mix and updates liquid, solid and the energy sum. Each field
+        streams through memory about twice per step instead of more than ten
+        times.
+
+        Branch uniforms are drawn slab by slab in flat order, which consumes
+        the generator exactly as one whole-field draw does. The wrap to
+        ``[0, 1)`` uses ``x - floor(x)``, which rounds the same exact value as
+        ``np.remainder(x, 1.0)`` and is several times cheaper. The fields
+        therefore match ``_step_arrays`` bit for bit. Dispersion comes from
+        ``sum`` / ``sum of squares`` rather than the two-pass ``_std``, so
+        metrics agree to rounding.
+        """
+        cfg = self.config
+        n = cfg.grid_size
+        replicas = cfg.ensemble_size or 1
+        cells = n ** 3
+        dtype = self.plasma.dtype
+        self._ensure_neighbor_cache()
+
+        def planes(values: np.ndarray) -> np.ndarray:
+            return values.reshape(replicas, n, n, n)
+
+        plasma, liquid, solid = planes(self.plasma), planes(self.liquid), planes(self.solid)
+        parity, neighbor_sum = planes(self.parity), planes(self._plasma_neighbor_sum)
+        mix = planes(self.arena.get(self._buffers["mix"], self.plasma.shape, dtype))
+        has_bias = bias_field.size > 0
+        shared_bias = has_bias and bias_field.ndim == 3
+        bias = bias_field if shared_bias or not has_bias else planes(bias_field)
+
+        rows = max(1, min(n, cfg.slab_bytes // (SLAB_ARRAYS * n * n * dtype.itemsize)))
+        slab = (rows, n, n)
+        work = self.arena.get(self._buffers["slab.work"], slab, dtype)
+        term = self.arena.get(self._buffers["slab.term"], slab, dtype)
+        uniform = self.arena.get(self._buffers["slab.random"], slab, dtype)
+        branch = self.arena.get(self._buffers["slab.mask"], slab, np.bool_)
+        square = self.arena.get(self._buffers["slab.square"], slab, np.float64)
+        # Keep operand types as _step_arrays sees them: Python floats stay weak
+        # scalars, per-replica values are float64 (matters for float32 grids).
+        # Those stay (1, 1, 1) arrays, since numpy 1.x value-based casting
+        # would demote a float64 scalar to float32.
+        def per_replica(value: Metric) -> List[Metric]:
+            if np.ndim(value) == 0:
+                return [value] * replicas
+            return list(np.asarray(value, dtype=np.float64).reshape(-1, 1, 1, 1))
+
+        path_p, bias_gain = per_replica(path_p), per_replica(bias_gain)
+        sums = np.zeros((replicas, 4))  # mix, mix^2, plasma + liquid, bias
+        bounds = [(x0, min(n, x0 + rows)) for x0 in range(0, n, rows)]
+
+        for b in range(replicas):
+            for x0, x1 in bounds:
+                r = x1 - x0
+                p, m, w, t = plasma[b, x0:x1], mix[b, x0:x1], work[:r], term[:r]
+                np.add(p, liquid[b, x0:x1], out=m)
+                m += solid[b, x0:x1]
+                m /= 3.0
+                np.divide(neighbor_sum[b, x0:x1], 6.0, out=w)
+                np.subtract(p, w, out=w)
+                np.abs(w, out=w)
+                np.multiply(parity[b, x0:x1], 0.13, out=t)
+                w += t
+                self.rng.random(out=uniform[:r], dtype=dtype)
+                np.less(uniform[:r], path_p[b], out=branch[:r])
+                np.copyto(m, w, where=branch[:r])
+                if has_bias:
+                    slab_bias = bias[x0:x1] if shared_bias else bias[b, x0:x1]
+                    np.multiply(slab_bias, bias_gain[b], out=w)
+                    m += w
+                    sums[b, 3] += slab_bias.sum(dtype=np.float64)
+                sums[b, 0] += m.sum(dtype=np.float64)
+                np.multiply(m, m, out=square[:r], dtype=np.float64)
+                sums[b, 1] += square[:r].sum()
+
+        mean = sums[:, 0] / cells
+        dispersion_per = np.sqrt(np.maximum(sums[:, 1] / cells - mean * mean, 0.0))
+        dispersion: Metric = dispersion_per if self.batched else float(dispersion_per[0])
+        forgiveness = per_replica(self._forgive(dispersion, forgiveness_threshold))
+
+        alpha = cfg.alpha
+        for b in range(replicas):
+            for x0, x1 in bounds:
+                m, s, w = mix[b, x0:x1], solid[b, x0:x1], work[: x1 - x0]
+                if forgiveness[b] < 1.0:
+                    m *= forgiveness[b]
+                # x - floor(x) rounds the same exact value as np.remainder(x, 1.0)
+                # (signed zeros included) at a fraction of the cost.
+                np.floor(m, out=w)
+                np.subtract(m, w, out=liquid[b, x0:x1])
+                s *= 1.0 - alpha
+                np.multiply(m, alpha, out=w)
+                s += w
+                np.floor(s, out=w)
+                np.subtract(s, w, out=s)
+                np.add(plasma[b, x0:x1], liquid[b, x0:x1], out=w)
+                sums[b, 2] += w.sum(dtype=np.float64)
+
+        energy = sums[:, 2] / cells / 2.0
+        mean_bias = sums[:, 3] / cells
+        if not self.batched:
+            return dispersion, float(energy[0]), float(mean_bias[0]) if has_bias else 0.0
+        if not has_bias:
+            return dispersion, energy, 0.0
+        return dispersion, energy, float(mean_bias[0]) if shared_bias else mean_bias
+
+    def _std(self, values: np.ndarray, work: np.ndarray) -> Metric:
+        """``np.std(values)`` (per replica) computed through ``work``.
 
-        return GridMetrics(energy=energy, divergence=divergence, forgiveness_events=self.forgiveness_events, mean_bias=mean_bias)
+        Means accumulate in float64 even when the grid is float32.
+        """
+        if not self.batched:
+            np.subtract(values, values.mean(dtype=np.float64), out=work, casting="same_kind")
+            np.multiply(work, work, out=work)
+            return float(np.sqrt(work.mean(dtype=np.float64)))
+        mean = values.mean(axis=(-3, -2, -1), dtype=np.float64, keepdims=True)
+        np.subtract(values, mean, out=work, casting="same_kind")
+        np.multiply(work, work, out=work)
+        return np.sqrt(self._spatial_mean(work))
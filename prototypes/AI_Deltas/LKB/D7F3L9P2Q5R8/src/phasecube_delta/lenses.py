@@ -1,22 +1,82 @@
 """Lens presets and scheduler (SV4/SV6/SV7)."""
 from __future__ import annotations
 
-from typing import Dict, Tuple
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
 
 import numpy as np
 
-from .config import LensSchedule
+from .config import LensSchedule, SimulationConfig
+
+# Lens weights and fused tunables are floats, or shape-(B,) arrays when an
+# ensemble runs per-replica lens weights.
+Weight = Union[float, np.ndarray]
+
+
+def _as_weight(value: np.ndarray) -> Weight:
+    return float(value) if np.ndim(value) == 0 else np.asarray(value, dtype=np.float64)
+
+
+class LensTunables(NamedTuple):
+    """Fused per-step tunables consumed by ``PhaseGrid.step``."""
+
+    path_probability: Weight
+    forgiveness_threshold: Weight
+    bias_gain: Weight
+
+
+def fuse_tunables(config: SimulationConfig, weights: Dict[str, Weight]) -> LensTunables:
+    return LensTunables(
+        fuse_path_probability(config.path_b_probability, weights),
+        fuse_forgiveness_threshold(config.forgiveness_threshold, weights),
+        fuse_bias_gain(config.bias_strength, weights),
+    )
 
 
 class LensScheduler:
-    def __init__(self, schedule: LensSchedule) -> None:
+    """Blends lens presets over time from tables compiled once.
+
+    The schedule repeats every ``cadence * len(presets)`` steps, so the
+    blended weights for one period are computed at construction and each
+    lookup is a modulo plus an index. With ``config`` the fused tunables
+    (path probability, forgiveness threshold, bias gain) are tabulated too:
+    ``tunables(step)`` returns floats, and ``tunables_at(steps)`` gathers
+    arrays for an array of steps, e.g. one per replica.
+    """
+
+    def __init__(self, schedule: LensSchedule, config: Optional[SimulationConfig] = None) -> None:
         self.schedule = schedule
         self.sequence = list(schedule.presets.keys())
         if not self.sequence:
             raise ValueError("At least one lens preset is required")
+        self.period = schedule.cadence * len(self.sequence)
+        self._weights = [self._compute_weights(step) for step in range(self.period)]
+        self._tunables: List[LensTunables] = []
+        self.table: Optional[LensTunables] = None
+        if config is not None:
+            self.compile(config)
+
+    def compile(self, config: SimulationConfig) -> LensTunables:
+        """Tabulate the fused tunables of every step in one period."""
+        self._tunables = [fuse_tunables(config, weights) for weights in self._weights]
+        self.table = LensTunables(*(np.array(column) for column in zip(*self._tunables)))
+        return self.table
 
     def active_weights(self, step: int) -> Dict[str, float]:
         """Return blended lens weights for the given step."""
+        return self._weights[step % self.period]
+
+    def tunables(self, step: int) -> LensTunables:
+        """Fused tunables for ``step`` (requires ``config`` or ``compile``)."""
+        return self._tunables[step % self.period]
+
+    def tunables_at(self, steps: np.ndarray) -> LensTunables:
+        """Vectorized lookup: fused tunables for an array of steps."""
+        if self.table is None:
+            raise RuntimeError("LensScheduler.compile(config) must run before tunables_at")
+        index = np.asarray(steps) % self.period
+        return LensTunables(*(column[index] for column in self.table))
+
+    def _compute_weights(self, step: int) -> Dict[str, float]:
         idx = (step // self.schedule.cadence) % len(self.sequence)
         next_idx = (idx + 1) % len(self.sequence)
         within_blend = step % self.schedule.cadence
@@ -35,22 +95,22 @@ class LensScheduler:
         return {k: v / total for k, v in blended.items()}
 
 
-def fuse_path_probability(base: float, weights: Dict[str, float]) -> float:
+def fuse_path_probability(base: float, weights: Dict[str, Weight]) -> Weight:
     """Adjust path branching probability using lens influence (SV4)."""
     predictive = weights.get("predictive", 0.25)
     harmonic = weights.get("harmonic", 0.25)
     adjusted = base + 0.15 * (predictive - 0.5) - 0.1 * (harmonic - 0.5)
-    return float(np.clip(adjusted, 0.05, 0.95))
+    return _as_weight(np.clip(adjusted, 0.05, 0.95))
 
 
-def fuse_forgiveness_threshold(base: float, weights: Dict[str, float]) -> float:
+def fuse_forgiveness_threshold(base: float, weights: Dict[str, Weight]) -> Weight:
     """Tune forgiveness activation with harmonic emphasis (SV1/SV8)."""
     harmonic = weights.get("harmonic", 0.25)
-    return float(max(0.05, base * (0.9 + 0.4 * harmonic)))
+    return _as_weight(np.maximum(0.05, base * (0.9 + 0.4 * harmonic)))
 
 
-def fuse_bias_gain(base: float, weights: Dict[str, float]) -> float:
+def fuse_bias_gain(base: float, weights: Dict[str, Weight]) -> Weight:
     """Human/predictive lenses nudge bias responsiveness (SV2/SV5)."""
     human = weights.get("human", 0.25)
     predictive = weights.get("predictive", 0.25)
-    return float(base * (0.9 + 0.3 * human + 0.2 * predictive))
+    return _as_weight(base * (0.9 + 0.3 * human + 0.2 * predictive))
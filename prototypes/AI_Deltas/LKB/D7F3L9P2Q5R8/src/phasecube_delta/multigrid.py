@@ -1,15 +1,31 @@
 """Tri-grid orchestration with bias/delay feedback (SV6/SV7)."""
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict
+from typing import Any, Callable, Dict, Iterator, Optional, Union
 
 import numpy as np
 
-from .bias import DelayLine, make_bias_field
+from .arena import ScratchArena
+from .bias import DelayLine
+from .bias_source import BiasSource
 from .config import SimulationConfig
+from .decomposed import DecomposedGrid
 from .grid import PhaseGrid, GridMetrics
-from .lenses import LensScheduler
+from .lenses import LensScheduler, LensTunables
+from .noise import BiasNoise
+from .stats import RunningStats
+
+# Metrics folded into running statistics: (stats key, grid attribute, metric).
+TRACKED = (
+    ("core_energy", "core", "energy"),
+    ("echo_energy", "echo", "energy"),
+    ("memory_energy", "memory", "energy"),
+    ("core_divergence", "core", "divergence"),
+    ("echo_divergence", "echo", "divergence"),
+    ("memory_divergence", "memory", "divergence"),
+)
 
 
 @dataclass
@@ -22,40 +38,108 @@ class SwarmSnapshot:
 
 
 class MultiGridSwarm:
-    def __init__(self, config: SimulationConfig, seed: int = 0) -> None:
+    """Core/echo/memory grids with independent RNG streams and one scratch arena.
+
+    ``seed`` feeds a ``SeedSequence`` that is spawned into four streams: one
+    for the swarm's bias fields and one per grid. Once the bias fields are
+    assembled, each grid's perturb + step depends only on its own state and
+    stream. With ``config.threads > 1`` the three updates therefore run
+    concurrently in a thread pool (NumPy releases the GIL for large array
+    operations), and the results are identical for any thread count.
+
+    Bias and cross-talk terms are assembled in arena buffers. Sequential grids
+    reuse the same step scratch, while threaded grids get their own, so
+    ``arena.step_bytes`` stays at zero once the first step has sized it.
+
+    With ``config.ensemble_size = B`` every grid, bias buffer and delay frame
+    carries a leading replica axis, so one ``step`` advances ``B``
+    independent swarms and the summary reports per-replica and aggregate
+    statistics.
+
+    ``bias_source`` (see ``bias_source.py``) adds one recorded frame per step,
+    scaled by its ``gain``, to the core bias. The swarm takes ownership and
+    closes it in ``close()``, and the summary reports its prefetch counters.
+
+    With ``config.workers = W > 0`` each grid is a ``DecomposedGrid`` split
+    across ``W`` worker processes. The swarm assembles every bias term
+    directly in the grid's shared bias block, so the workers read it without
+    a copy. ``close()`` stops the workers.
+    """
+
+    def __init__(self, config: SimulationConfig, seed: int = 0, bias_source: Optional[BiasSource] = None) -> None:
         self.config = config
-        self.rng = np.random.default_rng(seed)
-        self.core = PhaseGrid(config, self.rng, label="core")
-        self.echo = PhaseGrid(config, self.rng, label="echo")
-        self.memory = PhaseGrid(config, self.rng, label="memory")
+        self.bias_source = bias_source
+        swarm_seq, *grid_seqs = np.random.SeedSequence(seed).spawn(4)
+        self.rng = np.random.default_rng(swarm_seq)
+        self.noise = BiasNoise.from_config(config, self.rng)
+        self.arena = ScratchArena()
+        threaded = config.threads > 1
+        self.core, self.echo, self.memory = (
+            DecomposedGrid(config, workers=config.workers, seed=grid_seq, label=label)
+            if config.workers
+            else PhaseGrid(
+                config,
+                np.random.default_rng(grid_seq),
+                label=label,
+                arena=self.arena,
+                scratch=label if threaded else "grid",
+            )
+            for label, grid_seq in zip(("core", "echo", "memory"), grid_seqs)
+        )
+        self._pool = ThreadPoolExecutor(max_workers=config.threads) if threaded else None
+        self.stats: Dict[str, RunningStats] = {key: RunningStats() for key, _, _ in TRACKED}
+        self._forgiveness_events: Any = 0
         self.delay = DelayLine(length=config.delay_length, decay=config.delay_decay)
-        self.scheduler = LensScheduler(config.lens_schedule)
+        self.scheduler = LensScheduler(config.lens_schedule, config)
 
     def step(self, step_idx: int, base_bias_mag: float) -> SwarmSnapshot:
         lens_weights = self.scheduler.active_weights(step_idx)
+        tunables = self.scheduler.tunables(step_idx)
+
+        arena = self.arena
+        arena.begin_step()
+        shape = self.config.field_shape
+        dtype = self.config.np_dtype
+        core_bias = self._bias_buffer(self.core, "swarm.core_bias")
+        echo_self_bias = self._bias_buffer(self.echo, "swarm.echo_bias")
+        memory_self_bias = self._bias_buffer(self.memory, "swarm.memory_bias")
+        work = arena.get("swarm.work", shape, dtype)
 
         # Influence-only bias fields
-        base_bias = make_bias_field(self.config.grid_size, self.rng, base_bias_mag)
+        base_bias = self.noise.fill(arena.get("swarm.base_bias", shape, dtype), base_bias_mag)
         self.delay.push(base_bias)
         delayed = self.delay.replay()
 
         # Cross-talk: echo/memory feed soft bias into core
-        echo_bias = self.echo.liquid * self.config.coupling_echo_to_core
-        memory_bias = self.memory.solid * self.config.coupling_memory_to_core
+        np.add(base_bias, delayed, out=core_bias)
+        np.multiply(self.echo.liquid, self.config.coupling_echo_to_core, out=work)
+        core_bias += work
+        np.multiply(self.memory.solid, self.config.coupling_memory_to_core, out=work)
+        core_bias += work
+        if self.bias_source is not None:
+            np.multiply(self.bias_source.frame(step_idx), self.bias_source.gain, out=work)
+            core_bias += work
 
-        core_bias = base_bias + delayed + echo_bias + memory_bias
-        echo_self_bias = base_bias * 0.5 + self.core.liquid * 0.08
-        memory_self_bias = delayed * 0.7 + base_bias * 0.3
+        np.multiply(base_bias, 0.5, out=echo_self_bias)
+        np.multiply(self.core.liquid, 0.08, out=work)
+        echo_self_bias += work
+        np.multiply(delayed, 0.7, out=memory_self_bias)
+        np.multiply(base_bias, 0.3, out=work)
+        memory_self_bias += work
 
         # Perturb before stepping to maintain non-collapse (SV2)
-        self.core.perturb()
-        self.echo.perturb()
-        self.memory.perturb()
-
-        core_metrics = self.core.step(core_bias, lens_weights)
-        echo_metrics = self.echo.step(echo_self_bias, lens_weights)
-        memory_metrics = self.memory.step(memory_self_bias, lens_weights)
-        # TODO: add audio/file-fed bias injection once I/O is reintroduced; kept headless per scope.
+        jobs = (
+            (self.core, core_bias),
+            (self.echo, echo_self_bias),
+            (self.memory, memory_self_bias),
+        )
+        if self._pool is None:
+            core_metrics, echo_metrics, memory_metrics = (
+                self._advance(grid, bias, lens_weights, tunables) for grid, bias in jobs
+            )
+        else:
+            futures = [self._pool.submit(self._advance, grid, bias, lens_weights, tunables) for grid, bias in jobs]
+            core_metrics, echo_metrics, memory_metrics = (future.result() for future in futures)
 
         return SwarmSnapshot(
             step=step_idx,
@@ -65,24 +149,109 @@ class MultiGridSwarm:
             memory=memory_metrics,
         )
 
-    def run(self, steps: int, base_bias_mag: float) -> Dict[str, float]:
-        snapshots = []
+    def _bias_buffer(self, grid: Union[PhaseGrid, DecomposedGrid], name: str) -> np.ndarray:
+        """Where ``grid``'s bias is assembled: its shared block when decomposed, else the arena."""
+        if isinstance(grid, DecomposedGrid):
+            return grid.bias
+        return self.arena.get(name, self.config.field_shape, self.config.np_dtype)
+
+    @staticmethod
+    def _advance(
+        grid: Union[PhaseGrid, DecomposedGrid], bias: np.ndarray, lens_weights: Dict[str, float], tunables: LensTunables
+    ) -> GridMetrics:
+        grid.perturb()
+        return grid.step(bias, lens_weights, tunables)
+
+    def close(self) -> None:
+        """Shut down the stepping thread pool, decomposed grid workers and the bias source's prefetch thread."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        for grid in (self.core, self.echo, self.memory):
+            if isinstance(grid, DecomposedGrid):
+                grid.close()
+        if self.bias_source is not None:
+            self.bias_source.close()
+
+    def __enter__(self) -> "MultiGridSwarm":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def iter_steps(self, steps: int, base_bias_mag: float) -> Iterator[SwarmSnapshot]:
+        """Step ``steps`` times, yielding each snapshot as it is produced.
+
+        Metrics are folded into ``self.stats`` as they go (reset at the
+        start), so ``_summarize()`` is ready once the generator is exhausted.
+        """
+        self.stats = {key: RunningStats() for key, _, _ in TRACKED}
+        self._forgiveness_events = np.zeros(self.config.ensemble_size) if self.config.ensemble_size else 0
         for i in range(steps):
-            snapshots.append(self.step(i, base_bias_mag))
+            snapshot = self.step(i, base_bias_mag)
+            self._fold(snapshot)
+            yield snapshot
+
+    def run(
+        self,
+        steps: int,
+        base_bias_mag: float,
+        on_snapshot: Optional[Callable[[SwarmSnapshot], None]] = None,
+    ) -> Dict[str, Any]:
+        """Run and summarize in constant memory.
 
-        return self._summarize(snapshots)
+        Snapshots are not retained; pass ``on_snapshot`` (or iterate
+        ``iter_steps``) to observe or keep them.
+        """
+        for snapshot in self.iter_steps(steps, base_bias_mag):
+            if on_snapshot is not None:
+                on_snapshot(snapshot)
+        return self._summarize()
 
-    def _summarize(self, snapshots) -> Dict[str, float]:
-        core_energy = np.mean([s.core.energy for s in snapshots]) if snapshots else 0.0
-        echo_energy = np.mean([s.echo.energy for s in snapshots]) if snapshots else 0.0
-        memory_energy = np.mean([s.memory.energy for s in snapshots]) if snapshots else 0.0
-        core_div = np.mean([s.core.divergence for s in snapshots]) if snapshots else 0.0
-        forgiveness_events = snapshots[-1].core.forgiveness_events if snapshots else 0
+    def _fold(self, snapshot: SwarmSnapshot) -> None:
+        for key, grid, metric in TRACKED:
+            self.stats[key].push(getattr(getattr(snapshot, grid), metric))
+        self._forgiveness_events = snapshot.core.forgiveness_events
+
+    def _summarize(self) -> Dict[str, Any]:
+        summary = self._summarize_ensemble() if self.config.ensemble_size else self._summarize_single()
+        if self.bias_source is not None:
+            summary["bias_source"] = self.bias_source.counters()
+        return summary
+
+    def _summarize_single(self) -> Dict[str, Any]:
+        stats = self.stats
         return {
-            "core_energy": float(core_energy),
-            "echo_energy": float(echo_energy),
-            "memory_energy": float(memory_energy),
-            "core_divergence": float(core_div),
-            "core_forgiveness_events": int(forgiveness_events),
-            "steps": len(snapshots),
+            "core_energy": float(stats["core_energy"].mean),
+            "echo_energy": float(stats["echo_energy"].mean),
+            "memory_energy": float(stats["memory_energy"].mean),
+            "core_divergence": float(stats["core_divergence"].mean),
+            "core_forgiveness_events": int(self._forgiveness_events),
+            "steps": stats["core_energy"].count,
+            "stats": {key: value.to_dict() for key, value in stats.items()},
+        }
+
+    def _summarize_ensemble(self) -> Dict[str, Any]:
+        """Aggregate keys hold the mean over replicas; ``replicas`` and
+        ``spread`` give per-replica values and their std/sem/min/max."""
+        size = self.config.ensemble_size
+        per_replica = {
+            key: np.broadcast_to(self.stats[key].mean, (size,))
+            for key in ("core_energy", "echo_energy", "memory_energy", "core_divergence")
+        }
+        per_replica["core_forgiveness_events"] = np.broadcast_to(self._forgiveness_events, (size,))
+        summary: Dict[str, Any] = {key: float(np.mean(values)) for key, values in per_replica.items()}
+        summary["steps"] = self.stats["core_energy"].count
+        summary["ensemble_size"] = size
+        summary["replicas"] = {key: np.asarray(values).tolist() for key, values in per_replica.items()}
+        summary["spread"] = {
+            key: {
+                "std": float(np.std(values, ddof=1)) if size > 1 else 0.0,
+                "sem": float(np.std(values, ddof=1) / np.sqrt(size)) if size > 1 else 0.0,
+                "min": float(np.min(values)),
+                "max": float(np.max(values)),
+            }
+            for key, values in per_replica.items()
         }
+        summary["stats"] = {key: value.to_dict() for key, value in self.stats.items()}
+        return summary
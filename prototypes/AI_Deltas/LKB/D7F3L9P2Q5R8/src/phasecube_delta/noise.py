@@ -0,0 +1,103 @@
+"""Bias-noise generators feeding the influence-only bias field (SV2/SV5).
+
+Every mode fills a caller-owned buffer in place with zero-mean noise of
+standard deviation ``magnitude``, so the swarm never allocates a field per
+step. They differ in how much fresh entropy each step pays for:
+
+- ``fresh``: i.i.d. N(0, magnitude^2) per cell and step, using the ziggurat
+  ``standard_normal(out=)`` in the buffer dtype (float32 uses the float32
+  sampler). This is the reference mode, identical to ``make_bias_field``.
+- ``bank``: a pool of ``bank_factor * cells`` standard normals drawn once.
+  Each step reads a window at a random offset with a random sign, which
+  costs one scaled copy. Within a frame the cells are independent
+  N(0, magnitude^2). Across frames, values are reused from the pool (shifted
+  and sign-flipped), so frames are not independent. ``bank_refresh = k``
+  redraws the pool every ``k`` fills to bound the reuse.
+- ``lowres``: draws ``(n / f)^3`` normals and repeats each one over an
+  ``f^3`` block (nearest-neighbour upsampling). The per-cell marginal is
+  still N(0, magnitude^2) and frames are independent, but the field is
+  piecewise constant, with correlation length ``f`` cells.
+"""
+from __future__ import annotations
+
+from typing import Optional
+
+import numpy as np
+
+from .config import NOISE_MODES, SimulationConfig
+
+
+class BiasNoise:
+    """Fills bias buffers in place using one of ``NOISE_MODES``; owns its bank/low-res scratch."""
+
+    def __init__(
+        self,
+        rng: np.random.Generator,
+        mode: str = "fresh",
+        bank_factor: int = 4,
+        bank_refresh: int = 0,
+        lowres_factor: int = 2,
+    ) -> None:
+        if mode not in NOISE_MODES:
+            raise ValueError(f"mode must be one of {NOISE_MODES}, got {mode!r}")
+        if bank_factor < 2:
+            raise ValueError("bank_factor must be >= 2")
+        if lowres_factor < 1:
+            raise ValueError("lowres_factor must be >= 1")
+        self.rng = rng
+        self.mode = mode
+        self.bank_factor = bank_factor
+        self.bank_refresh = bank_refresh
+        self.lowres_factor = lowres_factor
+        self.fills = 0
+        self._bank: Optional[np.ndarray] = None
+        self._low: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_config(cls, config: SimulationConfig, rng: np.random.Generator) -> "BiasNoise":
+        return cls(
+            rng,
+            mode=config.bias_noise,
+            bank_factor=config.noise_bank_factor,
+            bank_refresh=config.noise_bank_refresh,
+            lowres_factor=config.noise_lowres_factor,
+        )
+
+    def fill(self, out: np.ndarray, magnitude: float) -> np.ndarray:
+        """Overwrite ``out`` (``(..., n, n, n)``) with noise of std ``magnitude``."""
+        self.fills += 1
+        if self.mode == "bank":
+            return self._fill_bank(out, magnitude)
+        if self.mode == "lowres":
+            return self._fill_lowres(out, magnitude)
+        self.rng.standard_normal(out=out, dtype=out.dtype)
+        out *= magnitude
+        return out
+
+    def _fill_bank(self, out: np.ndarray, magnitude: float) -> np.ndarray:
+        cells = out.size
+        bank = self._bank
+        if bank is None or bank.size != cells * self.bank_factor or bank.dtype != out.dtype:
+            bank = self._bank = np.empty(cells * self.bank_factor, dtype=out.dtype)
+            self.rng.standard_normal(out=bank, dtype=bank.dtype)
+        elif self.bank_refresh and self.fills % self.bank_refresh == 0:
+            self.rng.standard_normal(out=bank, dtype=bank.dtype)
+        offset = int(self.rng.integers(0, bank.size - cells + 1))
+        sign = magnitude if self.rng.random() < 0.5 else -magnitude
+        np.multiply(bank[offset:offset + cells].reshape(out.shape), sign, out=out)
+        return out
+
+    def _fill_lowres(self, out: np.ndarray, magnitude: float) -> np.ndarray:
+        f = self.lowres_factor
+        batch, n = out.shape[:-3], out.shape[-1]
+        if n % f:
+            raise ValueError(f"grid_size {n} is not divisible by lowres_factor {f}")
+        m = n // f
+        low_shape = (*batch, m, m, m)
+        if self._low is None or self._low.shape != low_shape or self._low.dtype != out.dtype:
+            self._low = np.empty(low_shape, dtype=out.dtype)
+        self.rng.standard_normal(out=self._low, dtype=out.dtype)
+        self._low *= magnitude
+        blocks = out.reshape(*batch, m, f, m, f, m, f)
+        np.copyto(blocks, self._low[..., :, None, :, None, :, None])
+        return out
@@ -4,9 +4,10 @@ from __future__ import annotations
 import argparse
 import json
 from dataclasses import asdict
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
-from .config import DEFAULT_CONFIG, SimulationConfig
+from .bias_source import BiasSource, NpyBiasSource
+from .config import DEFAULT_CONFIG, DTYPES, NOISE_MODES, SimulationConfig
 from .multigrid import MultiGridSwarm
 
 
@@ -16,6 +17,21 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser.add_argument("--seed", type=int, default=7, help="Random seed for reproducibility")
     parser.add_argument("--grid-size", type=int, default=DEFAULT_CONFIG.grid_size, help="Grid dimension (n => n^3 agents)")
     parser.add_argument("--bias", type=float, default=0.05, help="Base bias magnitude")
+    parser.add_argument(
+        "--ensemble", type=int, default=DEFAULT_CONFIG.ensemble_size, help="Replicas stepped together (0 = single swarm)"
+    )
+    parser.add_argument("--threads", type=int, default=DEFAULT_CONFIG.threads, help="Threads stepping the three grids")
+    parser.add_argument(
+        "--workers", type=int, default=DEFAULT_CONFIG.workers, help="Worker processes per grid (0 = in-process)"
+    )
+    parser.add_argument("--dtype", choices=DTYPES, default=DEFAULT_CONFIG.dtype, help="Grid/bias storage precision")
+    parser.add_argument(
+        "--bias-noise", choices=NOISE_MODES, default=DEFAULT_CONFIG.bias_noise, help="Base bias noise generator"
+    )
+    parser.add_argument("--fused", action="store_true", help="Step grids with the fused two-pass slab kernel")
+    parser.add_argument("--bias-file", help="(T, n, n, n) .npy stack of recorded bias frames fed to the core grid")
+    parser.add_argument("--bias-file-gain", type=float, default=1.0, help="Scale applied to recorded bias frames")
+    parser.add_argument("--prefetch", type=int, default=4, help="Recorded frames kept resident by the prefetch thread")
     return parser.parse_args(argv)
 
 
@@ -38,21 +54,32 @@ def build_config(args: argparse.Namespace) -> SimulationConfig:
         forgiveness_strength=cfg.forgiveness_strength,
         max_steps=args.steps,
         lens_schedule=cfg.lens_schedule,
+        dtype=getattr(args, "dtype", cfg.dtype),
+        ensemble_size=getattr(args, "ensemble", cfg.ensemble_size),
+        threads=getattr(args, "threads", cfg.threads),
+        workers=getattr(args, "workers", cfg.workers),
+        bias_noise=getattr(args, "bias_noise", cfg.bias_noise),
+        fused_step=getattr(args, "fused", cfg.fused_step),
     )
     return cfg
 
 
-def run_simulation(cfg: SimulationConfig, steps: int, bias: float, seed: int) -> Dict[str, Any]:
-    swarm = MultiGridSwarm(cfg, seed=seed)
-    summary = swarm.run(steps=steps, base_bias_mag=bias)
-    summary.update({"grid_size": cfg.grid_size, "seed": seed, "bias": bias})
+def run_simulation(
+    cfg: SimulationConfig, steps: int, bias: float, seed: int, bias_source: Optional[BiasSource] = None
+) -> Dict[str, Any]:
+    with MultiGridSwarm(cfg, seed=seed, bias_source=bias_source) as swarm:
+        summary = swarm.run(steps=steps, base_bias_mag=bias)
+    summary.update({"grid_size": cfg.grid_size, "seed": seed, "bias": bias, "dtype": cfg.dtype})
     return summary
 
 
 def main(argv: list[str] | None = None) -> None:
     args = parse_args(argv)
     cfg = build_config(args)
-    summary = run_simulation(cfg, steps=args.steps, bias=args.bias, seed=args.seed)
+    source = None
+    if args.bias_file:
+        source = NpyBiasSource(args.bias_file, prefetch=args.prefetch, gain=args.bias_file_gain)
+    summary = run_simulation(cfg, steps=args.steps, bias=args.bias, seed=args.seed, bias_source=source)
     print(json.dumps(summary, indent=2))
 
 
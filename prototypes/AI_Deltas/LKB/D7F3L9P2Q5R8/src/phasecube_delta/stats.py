@@ -0,0 +1,63 @@
+"""Streaming metric accumulators for long swarm runs (SV7).
+
+``RunningStats`` folds one value per step into a Welford mean/variance plus
+min, max and last value, so a run summary costs O(1) memory however many
+steps it covers. Values may be floats or shape-(B,) arrays (ensemble runs);
+the statistics are then kept per replica.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, Union
+
+import numpy as np
+
+Value = Union[float, np.ndarray]
+
+
+class RunningStats:
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean: Value = 0.0
+        self._m2: Value = 0.0
+        self.min: Value | None = None
+        self.max: Value | None = None
+        self.last: Value | None = None
+
+    def push(self, value: Value) -> None:
+        if np.ndim(value):
+            value = np.array(value, dtype=np.float64)
+        else:
+            value = float(value)
+        self.count += 1
+        delta = value - self.mean
+        self.mean = self.mean + delta / self.count
+        self._m2 = self._m2 + delta * (value - self.mean)
+        self.min = value if self.min is None else np.minimum(self.min, value)
+        self.max = value if self.max is None else np.maximum(self.max, value)
+        self.last = value
+
+    @property
+    def variance(self) -> Value:
+        """Sample variance (``ddof=1``); zero until two values were seen."""
+        if self.count < 2:
+            return self._m2 * 0.0
+        return self._m2 / (self.count - 1)
+
+    @property
+    def std(self) -> Value:
+        return np.sqrt(self.variance)
+
+    def to_dict(self) -> Dict[str, Any]:
+        def plain(value: Value | None) -> Any:
+            if value is None:
+                return None
+            return np.asarray(value).tolist() if np.ndim(value) else float(value)
+
+        return {
+            "count": self.count,
+            "mean": plain(self.mean),
+            "std": plain(self.std),
+            "min": plain(self.min),
+            "max": plain(self.max),
+            "last": plain(self.last),
+        }
@@ -0,0 +1,74 @@
+import numpy as np
+
+from phasecube_delta.config import DEFAULT_CONFIG, SimulationConfig
+from phasecube_delta.decomposed import DecomposedGrid, slab_bounds, slab_neighbor_sum
+from phasecube_delta.grid import PhaseGrid
+
+WEIGHTS = {"harmonic": 0.3, "predictive": 0.3, "systemic": 0.2, "human": 0.2}
+
+
+def test_slab_halo_sums_match_full_pass():
+    field = np.random.default_rng(0).random((7, 5, 6))
+    full = PhaseGrid._neighbor_sum(field)
+    for x0, x1 in slab_bounds(7, 3):
+        out = np.empty((x1 - x0, 5, 6))
+        assert np.array_equal(slab_neighbor_sum(field, x0, x1, out), full[x0:x1])
+
+
+def test_decomposed_grid_is_statistically_equivalent():
+    cfg = SimulationConfig(**{**DEFAULT_CONFIG.__dict__, "grid_size": 12})
+    reference = PhaseGrid(cfg, np.random.default_rng(1), label="core")
+    noise = np.random.default_rng(2)
+    ref_metrics = []
+    for _ in range(30):
+        reference.perturb()
+        ref_metrics.append(reference.step(noise.normal(0.0, 0.05, reference.plasma.shape), WEIGHTS))
+
+    with DecomposedGrid(cfg, workers=2, seed=1) as grid:
+        metrics = []
+        for _ in range(30):
+            grid.perturb()
+            metrics.append(grid.step_local_bias(WEIGHTS, bias_magnitude=0.05))
+        liquid = grid.field("liquid")
+
+    assert liquid.shape == (12, 12, 12)
+    assert ((liquid >= 0) & (liquid <= 1)).all()
+    for name in ("energy", "divergence"):
+        ours = np.mean([getattr(m, name) for m in metrics[5:]])
+        theirs = np.mean([getattr(m, name) for m in ref_metrics[5:]])
+        assert abs(ours - theirs) < 0.05 * theirs
+
+
+def test_decomposed_grid_takes_caller_bias_in_place_or_copied():
+    cfg = SimulationConfig(**{**DEFAULT_CONFIG.__dict__, "grid_size": 6})
+    bias = np.random.default_rng(3).normal(0.0, 0.05, (6, 6, 6))
+    runs = []
+    for in_place in (False, True):
+        with DecomposedGrid(cfg, workers=2, seed=5) as grid:
+            metrics = []
+            for _ in range(3):
+                grid.perturb()
+                if in_place:
+                    grid.bias[...] = bias
+                    metrics.append(grid.step(grid.bias, WEIGHTS))
+                else:
+                    metrics.append(grid.step(bias, WEIGHTS))
+            runs.append((metrics, grid.field("liquid")))
+        assert all(np.isclose(m.mean_bias, bias.mean()) for m in metrics)
+    assert runs[0][0] == runs[1][0]
+    assert np.array_equal(runs[0][1], runs[1][1])
+
+
+def test_multigrid_swarm_runs_on_decomposed_grids():
+    from phasecube_delta.multigrid import MultiGridSwarm
+
+    base = {**DEFAULT_CONFIG.__dict__, "grid_size": 8}
+    with MultiGridSwarm(SimulationConfig(**base), seed=3) as swarm:
+        reference = swarm.run(steps=20, base_bias_mag=0.05)
+    with MultiGridSwarm(SimulationConfig(**{**base, "workers": 2}), seed=3) as swarm:
+        assert isinstance(swarm.core, DecomposedGrid)
+        summary = swarm.run(steps=20, base_bias_mag=0.05)
+        liquid = swarm.core.field("liquid")
+    assert summary["steps"] == 20
+    assert ((liquid >= 0) & (liquid <= 1)).all()
+    assert abs(summary["core_energy"] - reference["core_energy"]) < 0.05 * reference["core_energy"]
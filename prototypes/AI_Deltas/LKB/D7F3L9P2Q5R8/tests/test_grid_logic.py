@@ -25,3 +25,82 @@ def test_bias_does_not_overwrite_plasma():
     grid.step(bias, {"harmonic": 0.3, "predictive": 0.3, "systemic": 0.2, "human": 0.2})
     # Plasma should only change via perturb, not step
     assert np.allclose(original_plasma, grid.plasma)
+
+
+def test_incremental_neighbor_sum_matches_full_roll():
+    cfg = SimulationConfig(**{**DEFAULT_CONFIG.__dict__, "grid_size": 6, "flip_probability": 0.05})
+    grid = PhaseGrid(cfg, np.random.default_rng(4), label="core")
+    bias = np.zeros_like(grid.plasma)
+    for _ in range(5):
+        grid.perturb()
+        grid.step(bias, {"harmonic": 0.3, "predictive": 0.3, "systemic": 0.2, "human": 0.2})
+    cached = grid.neighbor_average(grid.plasma)
+    assert np.array_equal(cached, grid.neighbor_average(grid.plasma.copy()))
+
+
+def test_ensemble_forgiveness_is_per_replica():
+    cfg = SimulationConfig(**{**DEFAULT_CONFIG.__dict__, "grid_size": 4, "ensemble_size": 2, "forgiveness_threshold": 0.1})
+    grid = PhaseGrid(cfg, np.random.default_rng(0), label="core")
+    assert grid.plasma.shape == (2, 4, 4, 4)
+    # Replica 0 is flat, replica 1 spans [0, 1): only replica 1 should trip forgiveness.
+    plasma = np.zeros_like(grid.plasma)
+    plasma[1] = np.linspace(0, 1, 64, endpoint=False).reshape(4, 4, 4)
+    grid.plasma = plasma
+    grid.liquid[:] = plasma
+    grid.solid[:] = plasma
+    grid.parity[:] = 0
+    bias = np.zeros_like(grid.plasma)
+    metrics = grid.step(bias, {"harmonic": 0.25, "predictive": 0.25, "systemic": 0.25, "human": 0.25})
+    assert metrics.divergence.shape == (2,)
+    assert metrics.divergence[0] < metrics.divergence[1]
+    assert list(metrics.forgiveness_events) == [0, 1]
+
+
+def test_compiled_lens_table_matches_per_step_fusion():
+    from phasecube_delta import lenses
+
+    cfg = SimulationConfig(**{**DEFAULT_CONFIG.__dict__, "grid_size": 4})
+    scheduler = lenses.LensScheduler(cfg.lens_schedule, cfg)
+    steps = np.arange(2 * scheduler.period + 5)
+    for step in steps:
+        assert scheduler.tunables(int(step)) == lenses.fuse_tunables(cfg, scheduler.active_weights(int(step)))
+    gathered = scheduler.tunables_at(steps.reshape(-1, 1) + np.arange(3))  # (steps, replicas)
+    assert gathered.bias_gain.shape == (steps.size, 3)
+    assert gathered.path_probability[7, 2] == scheduler.tunables(9).path_probability
+
+    # Stepping with the tabulated tunables matches fusing inside step().
+    grids = [PhaseGrid(cfg, np.random.default_rng(1), label="core") for _ in range(2)]
+    bias = np.full(grids[0].plasma.shape, 0.05)
+    weights = scheduler.active_weights(50)
+    first = grids[0].step(bias, weights)
+    second = grids[1].step(bias, weights, scheduler.tunables(50))
+    assert first == second
+    np.testing.assert_array_equal(grids[0].liquid, grids[1].liquid)
+
+
+def test_fused_step_matches_array_step():
+    from dataclasses import replace
+
+    from phasecube_delta.lenses import LensScheduler
+
+    for dtype, ensemble, threshold in (("float64", 0, 0.32), ("float32", 0, 0.09), ("float32", 3, 0.09)):
+        # Tiny slab budget so the 9^3 lattice splits into several slabs.
+        cfg = replace(
+            DEFAULT_CONFIG, grid_size=9, dtype=dtype, ensemble_size=ensemble, forgiveness_threshold=threshold, slab_bytes=1
+        )
+        scheduler = LensScheduler(cfg.lens_schedule, cfg)
+        reference = PhaseGrid(cfg, np.random.default_rng(1), label="array")
+        fused = PhaseGrid(replace(cfg, fused_step=True), np.random.default_rng(1), label="fused")
+        bias = np.random.default_rng(2).normal(0.0, 0.05, cfg.field_shape).astype(dtype)
+        for t in range(8):
+            reference.perturb()
+            fused.perturb()
+            want = reference.step(bias, {}, scheduler.tunables(t))
+            got = fused.step(bias, {}, scheduler.tunables(t))
+            for name in ("plasma", "parity", "liquid", "solid"):
+                np.testing.assert_array_equal(getattr(fused, name), getattr(reference, name))
+            np.testing.assert_array_equal(got.forgiveness_events, want.forgiveness_events)
+            np.testing.assert_allclose(got.divergence, want.divergence, atol=1e-7)
+            np.testing.assert_allclose(got.energy, want.energy, atol=1e-12)
+            np.testing.assert_allclose(got.mean_bias, want.mean_bias, atol=1e-12)
+        assert np.any(fused.forgiveness_events > 0) == (threshold < 0.1)
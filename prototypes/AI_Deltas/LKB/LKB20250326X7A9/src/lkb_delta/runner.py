@@ -35,17 +35,26 @@ def main() -> None:
     parser.add_argument("--steps", type=int, default=DEFAULT_CONFIG.steps, help="Number of simulation steps")
     parser.add_argument("--grid-size", type=int, default=DEFAULT_CONFIG.grid_size, help="Grid dimension (n => n^3 agents)")
     parser.add_argument("--seed", type=int, default=DEFAULT_CONFIG.seed, help="Random seed for reproducibility")
+    parser.add_argument(
+        "--records",
+        help="Also write per-step records to this path (.npz needs numpy; anything else is CSV)",
+    )
     args = parser.parse_args()
 
     config = build_config(args)
-    records = run_session(config)
+    steps = run_session(config)["steps"]
+    if args.records:
+        if args.records.endswith(".npz"):
+            steps.save_npz(args.records)
+        else:
+            steps.write_csv(args.records)
 
     summary = {
         "delta_id": DELTA_ID,
-        "steps": len(records["steps"]),
-        "energy_avg": sum(r.energy for r in records["steps"]) / len(records["steps"]),
-        "dispersion_avg": sum(r.dispersion for r in records["steps"]) / len(records["steps"]),
-        "forgiveness_count": sum(1 for r in records["steps"] if r.forgiveness_triggered),
+        "steps": len(steps),
+        "energy_avg": steps.mean("energy"),
+        "dispersion_avg": steps.mean("dispersion"),
+        "forgiveness_count": int(steps.total("forgiveness_triggered")),
     }
     print(json.dumps(summary, indent=2))
 
@@ -1,27 +1,16 @@
 from __future__ import annotations
 
 import random
-from dataclasses import dataclass
-from typing import Dict, List
+from typing import Any, Dict
 
 from .bias import BiasField
 from .config import DEFAULT_CONFIG, SimulationConfig
 from .grid import PhaseGrid
 from .lenses import LensMixer
+from .records import StepRecord, StepRecords  # StepRecord stays importable from here
 
 
-@dataclass
-class StepRecord:
-    step: int
-    energy: float
-    dispersion: float
-    path_b_probability: float
-    damping: float
-    bias_amplitude: float
-    forgiveness_triggered: bool
-
-
-def run_session(config: SimulationConfig = DEFAULT_CONFIG) -> Dict[str, List[StepRecord]]:
+def run_session(config: SimulationConfig = DEFAULT_CONFIG) -> Dict[str, Any]:
     rng = random.Random(config.seed)
     bias_field = BiasField(
         size=config.grid_size,
@@ -41,7 +30,7 @@ def run_session(config: SimulationConfig = DEFAULT_CONFIG) -> Dict[str, List[Ste
     )
     lenses = LensMixer(config.lens_weights, config.clamp_path_b, config.harmonic_clamp)
 
-    records: List[StepRecord] = []
+    records = StepRecords(capacity=config.steps)
     for step in range(config.steps):
         # Simulated stereo spectrum seeded from RNG; stands in for mic/file input (per SV3/SV9 inference).
         # TODO: Bridge real mic/file ingestion to replace RNG bins while keeping bias influence-only.
@@ -61,15 +50,13 @@ def run_session(config: SimulationConfig = DEFAULT_CONFIG) -> Dict[str, List[Ste
 
         new_metrics = grid.metrics()
         records.append(
-            StepRecord(
-                step=step,
-                energy=new_metrics.energy,
-                dispersion=new_metrics.dispersion,
-                path_b_probability=lens_output.path_b_probability,
-                damping=lens_output.damping,
-                bias_amplitude=bias_field.amplitude,
-                forgiveness_triggered=forgiveness_triggered,
-            )
+            step=step,
+            energy=new_metrics.energy,
+            dispersion=new_metrics.dispersion,
+            path_b_probability=lens_output.path_b_probability,
+            damping=lens_output.damping,
+            bias_amplitude=bias_field.amplitude,
+            forgiveness_triggered=forgiveness_triggered,
         )
 
     return {"steps": records}
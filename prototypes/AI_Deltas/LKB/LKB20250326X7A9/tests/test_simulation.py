@@ -1,3 +1,5 @@
+import pytest
+
 from lkb_delta.config import SimulationConfig
 from lkb_delta.simulation import run_session
 
@@ -46,3 +48,25 @@ def test_forgiveness_triggers_on_dispersion():
     assert triggered is True
     assert dispersion > 0.05
     assert max(grid.plasma) < 1.0
+
+
+def test_step_records_summaries_and_csv_match_record_view(tmp_path):
+    import csv
+
+    result = run_session(SimulationConfig(steps=12, seed=5, grid_size=6))
+    steps = result["steps"]
+    rows = list(steps)
+    assert steps.mean("energy") == pytest.approx(sum(r.energy for r in rows) / len(rows))
+    assert steps.total("forgiveness_triggered") == sum(1 for r in rows if r.forgiveness_triggered)
+
+    path = tmp_path / "steps.csv"
+    steps.write_csv(path)
+    with open(path, newline="") as handle:
+        written = list(csv.DictReader(handle))
+    assert [float(row["dispersion"]) for row in written] == [r.dispersion for r in rows]
+
+    pytest.importorskip("numpy")
+    from lkb_delta.records import StepRecords
+
+    steps.save_npz(tmp_path / "steps.npz")
+    assert list(StepRecords.load_npz(tmp_path / "steps.npz")) == rows
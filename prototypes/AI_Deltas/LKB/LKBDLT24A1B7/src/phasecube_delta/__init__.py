@@ -4,8 +4,9 @@ This module packages a small, tunable lattice with harmonic and forgiveness
 controls suitable for CLI execution or testing.
 """
 
-__all__ = ["LensWeights", "SimulationConfig", "LatticeSimulator"]
+__all__ = ["LensWeights", "SimulationConfig", "LatticeSimulator", "save_checkpoint", "load_checkpoint"]
 __version__ = "0.1.0"
 
 from .config import LensWeights, SimulationConfig
 from .simulation import LatticeSimulator
+from .checkpoint import load_checkpoint, save_checkpoint
@@ -0,0 +1,174 @@
+"""Binary checkpoints for pausing and resuming long lattice runs (SV5).
+
+Layout (all little-endian)::
+
+    b"PCDCKPT1" | header length (uint64) | JSON header | arrays...
+
+The JSON header carries the config, backend, RNG state, step/forgiveness
+counters, early-stopping progress and long-run histories. The four state
+fields follow as
+packed arrays (``<f8`` plasma/liquid/solid, ``|i1`` parity), each starting on
+a 64-byte boundary so they can be mapped straight from the file.
+
+Loading memory-maps the file copy-on-write: the numpy backend wraps the mapped
+pages without reading them, so resuming a large lattice is close to instant;
+the list backend still has to materialize Python lists. Restoring the RNG
+state makes a resumed run bit-identical to an uninterrupted one; the plasma
+statistics are recomputed exactly from the restored fields.
+"""
+from __future__ import annotations
+
+import array
+import json
+import mmap
+import os
+import random
+import struct
+import sys
+from dataclasses import asdict
+from typing import Any, Dict, Tuple
+
+from .config import SimulationConfig
+from .convergence import ConvergenceTracker
+from .history import RunHistory
+from .simulation import LatticeSimulator, LatticeState, np
+
+MAGIC = b"PCDCKPT1"
+FORMAT_VERSION = 1
+ALIGN = 64
+FIELDS: Tuple[Tuple[str, str, str], ...] = (
+    # (field, array-module typecode, numpy dtype)
+    ("plasma", "d", "<f8"),
+    ("liquid", "d", "<f8"),
+    ("solid", "d", "<f8"),
+    ("parity", "b", "|i1"),
+)
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // ALIGN) * ALIGN
+
+
+def _rng_state(simulator: LatticeSimulator) -> Dict[str, Any]:
+    if simulator.use_arrays:
+        return {"kind": "numpy", "state": simulator.rng.bit_generator.state}
+    version, internal, gauss_next = simulator.rng.getstate()
+    return {"kind": "random", "state": [version, list(internal), gauss_next]}
+
+
+def _restore_rng(payload: Dict[str, Any]) -> Any:
+    if payload["kind"] == "numpy":
+        if np is None:
+            raise ImportError("checkpoint uses backend='numpy' but numpy is not installed")
+        state = payload["state"]
+        rng = np.random.Generator(getattr(np.random, state["bit_generator"])())
+        rng.bit_generator.state = state
+        return rng
+    version, internal, gauss_next = payload["state"]
+    rng = random.Random()
+    rng.setstate((version, tuple(internal), gauss_next))
+    return rng
+
+
+def _field_bytes(values: Any, typecode: str, dtype: str) -> Any:
+    if np is not None and isinstance(values, np.ndarray):
+        return np.ascontiguousarray(values, dtype=dtype)
+    packed = array.array(typecode, values)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return packed
+
+
+def save_checkpoint(simulator: LatticeSimulator, path: str | os.PathLike) -> None:
+    """Write ``simulator`` to ``path`` atomically (temp file + rename)."""
+    simulator._ensure_plasma_cache()
+    count = simulator.count
+    header: Dict[str, Any] = {
+        "format": FORMAT_VERSION,
+        "config": asdict(simulator.config),
+        "count": count,
+        "steps_completed": simulator.steps_completed,
+        "forgiveness_events": simulator.forgiveness_count,
+        "rng": _rng_state(simulator),
+        "stop_reason": simulator.stop_reason,
+        "tracker": simulator.tracker.to_dict() if simulator.tracker else None,
+        "history": simulator.history.to_dict() if simulator.history else None,
+        "arrays": {},
+    }
+    # Offsets depend on the header size, so settle the layout with a
+    # placeholder first and then widen until the header fits.
+    itemsizes = {"d": 8, "b": 1}
+    base = 0
+    while True:
+        offset = base
+        for name, typecode, dtype in FIELDS:
+            offset = _aligned(offset)
+            header["arrays"][name] = {"offset": offset, "dtype": dtype, "length": count}
+            offset += count * itemsizes[typecode]
+        encoded = json.dumps(header).encode("utf-8")
+        needed = _aligned(len(MAGIC) + 8 + len(encoded))
+        if needed <= base:
+            break
+        base = needed
+
+    tmp_path = f"{os.fspath(path)}.tmp"
+    with open(tmp_path, "wb") as handle:
+        handle.write(MAGIC)
+        handle.write(struct.pack("<Q", len(encoded)))
+        handle.write(encoded)
+        for name, typecode, dtype in FIELDS:
+            handle.write(b"\0" * (header["arrays"][name]["offset"] - handle.tell()))
+            handle.write(_field_bytes(getattr(simulator.state, name), typecode, dtype))
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(tmp_path, path)
+
+
+def _read_header(mapped: mmap.mmap) -> Dict[str, Any]:
+    if mapped[: len(MAGIC)] != MAGIC:
+        raise ValueError("not a phasecube_delta checkpoint")
+    start = len(MAGIC) + 8
+    if len(mapped) < start:
+        raise ValueError("truncated checkpoint header")
+    (length,) = struct.unpack_from("<Q", mapped, len(MAGIC))
+    if len(mapped) < start + length:
+        raise ValueError("truncated checkpoint header")
+    header = json.loads(bytes(mapped[start : start + length]).decode("utf-8"))
+    if header.get("format") != FORMAT_VERSION:
+        raise ValueError(f"unsupported checkpoint format {header.get('format')!r}")
+    return header
+
+
+def load_checkpoint(path: str | os.PathLike) -> LatticeSimulator:
+    """Rebuild a simulator from ``path``, mapping its arrays copy-on-write."""
+    with open(path, "rb") as handle:
+        mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_COPY)
+    header = _read_header(mapped)
+    config = SimulationConfig.from_dict(header["config"])
+    count = header["count"]
+
+    fields: Dict[str, Any] = {}
+    for name, typecode, dtype in FIELDS:
+        spec = header["arrays"][name]
+        if config.backend == "numpy":
+            if np is None:
+                raise ImportError("checkpoint uses backend='numpy' but numpy is not installed")
+            fields[name] = np.frombuffer(mapped, dtype=dtype, count=count, offset=spec["offset"])
+        else:
+            values = array.array(typecode)
+            values.frombytes(mapped[spec["offset"] : spec["offset"] + count * values.itemsize])
+            if sys.byteorder == "big":
+                values.byteswap()
+            fields[name] = values.tolist()
+
+    simulator = LatticeSimulator(config, rng=_restore_rng(header["rng"]), state=LatticeState(**fields))
+    simulator.steps_completed = header["steps_completed"]
+    simulator.forgiveness_count = header["forgiveness_events"]
+    if simulator.history is None:
+        simulator.forgiveness_events = list(range(simulator.forgiveness_count))
+    elif header.get("history"):
+        simulator.history = RunHistory.from_dict(config.long_run, header["history"])
+    simulator.stop_reason = header.get("stop_reason")
+    if simulator.tracker is not None and header.get("tracker"):
+        simulator.tracker = ConvergenceTracker.from_dict(config.stopping, header["tracker"])
+    return simulator
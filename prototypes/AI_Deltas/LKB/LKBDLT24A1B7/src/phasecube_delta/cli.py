@@ -5,14 +5,16 @@ import argparse
 import json
 import os
 import sys
-from typing import Any, Dict
+from typing import Any, Dict, TextIO
 
-from .config import SimulationConfig
+from .checkpoint import load_checkpoint, save_checkpoint
+from .config import BACKENDS, LongRunConfig, SimulationConfig, StoppingRule
 from .simulation import LatticeSimulator
+from .sweep import SWEEPABLE, build_tasks, run_sweep
 
 
-def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
-    parser = argparse.ArgumentParser(description="Run PhaseCube-inspired lattice steps.")
+def add_config_arguments(parser: argparse.ArgumentParser) -> None:
+    """Simulation knobs shared by single runs and sweeps (sweep base values)."""
     parser.add_argument("--grid", type=int, default=10, help="Grid dimension (n -> n^3 cells).")
     parser.add_argument("--steps", type=int, default=50, help="Number of update steps to run.")
     parser.add_argument("--seed", type=int, default=7, help="Random seed for reproducibility.")
@@ -32,12 +34,69 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         default=0.55,
         help="Blend ratio when forgiveness is active (lower tightens stabilization).",
     )
-    return parser.parse_args(argv)
+    parser.add_argument(
+        "--backend",
+        choices=BACKENDS,
+        default="list",
+        help="Lattice backend: pure-Python reference (list) or whole-array numpy.",
+    )
+    parser.add_argument(
+        "--stop-window",
+        type=int,
+        default=0,
+        help="Enable early stopping with windows of N steps (0 disables it).",
+    )
+    parser.add_argument(
+        "--stop-tolerance",
+        type=float,
+        default=1e-3,
+        help="Max change of window-mean metrics that still counts as settled.",
+    )
+    parser.add_argument(
+        "--stop-patience",
+        type=int,
+        default=3,
+        help="Consecutive settled windows required to stop.",
+    )
+    parser.add_argument(
+        "--max-steps",
+        type=int,
+        default=None,
+        help="Hard cap on steps for early stopping (requires --stop-window).",
+    )
+    parser.add_argument(
+        "--long-run",
+        action="store_true",
+        help="Constant-memory bookkeeping: event counters, decimated and recent metric histories.",
+    )
+    parser.add_argument("--history-stride", type=int, default=1, help="Initial long-run history stride.")
+    parser.add_argument("--history-capacity", type=int, default=512, help="Max decimated history samples.")
+    parser.add_argument("--recent-window", type=int, default=64, help="Ring buffer length of recent steps.")
 
 
-def run(argv: list[str] | None = None) -> Dict[str, Any]:
-    args = parse_args(argv)
-    config = SimulationConfig(
+def check_config_arguments(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    """Reject flag combinations that ``config_from_args`` would silently ignore."""
+    if args.max_steps is not None and args.stop_window <= 0:
+        parser.error("--max-steps requires --stop-window >= 1")
+
+
+def config_from_args(args: argparse.Namespace) -> SimulationConfig:
+    stopping = None
+    if args.stop_window > 0:
+        stopping = StoppingRule(
+            window=args.stop_window,
+            tolerance=args.stop_tolerance,
+            patience=args.stop_patience,
+            max_steps=args.max_steps,
+        )
+    long_run = None
+    if args.long_run:
+        long_run = LongRunConfig(
+            stride=args.history_stride,
+            capacity=args.history_capacity,
+            recent=args.recent_window,
+        )
+    return SimulationConfig(
         grid=args.grid,
         flip_p=args.flip_p,
         parity_p=args.parity_p,
@@ -46,15 +105,135 @@ def run(argv: list[str] | None = None) -> Dict[str, Any]:
         forgiveness_threshold=args.forgiveness_threshold,
         forgiveness_blend=args.forgiveness_blend,
         seed=args.seed,
+        backend=args.backend,
+        stopping=stopping,
+        long_run=long_run,
     )
-    simulator = LatticeSimulator(config)
-    simulator.perturb()
-    simulator.step(args.steps)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run PhaseCube-inspired lattice steps.")
+    add_config_arguments(parser)
+    parser.add_argument(
+        "--checkpoint",
+        default="phasecube.ckpt",
+        help="Checkpoint file written by --checkpoint-every.",
+    )
+    parser.add_argument(
+        "--checkpoint-every",
+        type=int,
+        default=0,
+        help="Write a checkpoint every N steps (0 disables checkpointing).",
+    )
+    parser.add_argument(
+        "--resume",
+        default=None,
+        help="Resume from a checkpoint; its config wins and --steps stays the run total.",
+    )
+    args = parser.parse_args(argv)
+    check_config_arguments(parser, args)
+    return args
+
+
+def run(argv: list[str] | None = None) -> Dict[str, Any]:
+    args = parse_args(argv)
+    if args.resume:
+        simulator = load_checkpoint(args.resume)
+    else:
+        simulator = LatticeSimulator(config_from_args(args))
+        simulator.perturb()
+
+    remaining = args.steps - simulator.steps_completed
+    while remaining > 0:
+        chunk = min(args.checkpoint_every, remaining) if args.checkpoint_every > 0 else remaining
+        simulator.step(chunk)
+        remaining -= chunk
+        if args.checkpoint_every > 0:
+            save_checkpoint(simulator, args.checkpoint)
+        if simulator.stop_reason is not None:
+            break
     summary = simulator.summary()
     return summary
 
 
+def _split_assignment(parser: argparse.ArgumentParser, text: str) -> tuple[str, str]:
+    name, sep, value = text.partition("=")
+    name = name.strip().replace("-", "_")
+    if not sep or name not in SWEEPABLE:
+        parser.error(f"expected NAME=VALUES with NAME in {sorted(SWEEPABLE)}, got {text!r}")
+    return name, value
+
+
+def parse_sweep_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="phasecube_delta.cli sweep",
+        description="Run many lattice configurations in a process pool, streaming JSON Lines.",
+    )
+    add_config_arguments(parser)
+    parser.add_argument(
+        "--param",
+        action="append",
+        default=[],
+        metavar="NAME=V1,V2,...",
+        help="Grid axis; the sweep runs the cartesian product of all --param axes.",
+    )
+    parser.add_argument(
+        "--sample",
+        action="append",
+        default=[],
+        metavar="NAME=LO:HI",
+        help="Uniform random range, drawn --samples times per grid point.",
+    )
+    parser.add_argument("--samples", type=int, default=0, help="Random draws per grid point.")
+    parser.add_argument("--sample-seed", type=int, default=0, help="Seed for random sampling.")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: available cores).")
+    parser.add_argument("--output", default="-", help="JSON Lines destination ('-' for stdout).")
+    args = parser.parse_args(argv)
+    check_config_arguments(parser, args)
+
+    args.grid_spec = {}
+    for text in args.param:
+        name, values = _split_assignment(parser, text)
+        args.grid_spec[name] = [SWEEPABLE[name](v) for v in values.split(",") if v.strip()]
+    args.range_spec = {}
+    for text in args.sample:
+        name, bounds = _split_assignment(parser, text)
+        low, sep, high = bounds.partition(":")
+        if not sep:
+            parser.error(f"--sample expects NAME=LO:HI, got {text!r}")
+        args.range_spec[name] = (float(low), float(high))
+    if args.range_spec and args.samples < 1:
+        parser.error("--sample requires --samples >= 1")
+    return args
+
+
+def sweep(argv: list[str] | None = None, stream: TextIO | None = None) -> int:
+    """Run a sweep and write one JSON summary per line; returns the task count."""
+    args = parse_sweep_args(argv)
+    tasks = build_tasks(
+        config_from_args(args),
+        args.steps,
+        grid=args.grid_spec,
+        ranges=args.range_spec,
+        samples=args.samples,
+        sample_seed=args.sample_seed,
+    )
+    handle = stream or (sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8"))
+    try:
+        for result in run_sweep(tasks, workers=args.workers):
+            handle.write(json.dumps(result) + "\n")
+            handle.flush()
+    finally:
+        if handle is not sys.stdout and handle is not stream:
+            handle.close()
+    return len(tasks)
+
+
 def main(argv: list[str] | None = None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == "sweep":
+        sweep(argv[1:])
+        return
     summary = run(argv)
     print(json.dumps(summary, indent=2))
 
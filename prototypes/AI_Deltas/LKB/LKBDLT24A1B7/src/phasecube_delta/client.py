@@ -0,0 +1,110 @@
+"""Pooled client for the warm simulator daemon (see ``server.py``)."""
+from __future__ import annotations
+
+import json
+import queue
+import socket
+from contextlib import contextmanager
+from dataclasses import asdict
+from typing import Any, Dict, Iterator, Tuple
+
+from .config import SimulationConfig
+
+
+class SimulatorError(RuntimeError):
+    """The server rejected a request (unknown simulator, bad config, ...)."""
+
+
+class SimulatorClient:
+    """Thread-safe client that reuses up to ``pool_size`` idle connections."""
+
+    def __init__(self, socket_path: str, pool_size: int = 4, timeout: float | None = 30.0) -> None:
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self._idle: "queue.LifoQueue[Tuple[socket.socket, Any]]" = queue.LifoQueue(maxsize=pool_size)
+
+    def _connect(self) -> Tuple[socket.socket, Any]:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self.socket_path)
+        return sock, sock.makefile("rb")
+
+    @contextmanager
+    def _connection(self) -> Iterator[Tuple[socket.socket, Any]]:
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = self._connect()
+        try:
+            yield conn
+        except BaseException:
+            # The stream may hold a half-read response; never reuse it.
+            self._discard(conn)
+            raise
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            self._discard(conn)
+
+    @staticmethod
+    def _discard(conn: Tuple[socket.socket, Any]) -> None:
+        sock, reader = conn
+        reader.close()
+        sock.close()
+
+    def request(self, op: str, **fields: Any) -> Any:
+        payload = json.dumps({"op": op, **fields}).encode("utf-8") + b"\n"
+        with self._connection() as (sock, reader):
+            sock.sendall(payload)
+            line = reader.readline()
+            if not line:
+                raise ConnectionError("simulator server closed the connection")
+        response = json.loads(line)
+        if not response.get("ok"):
+            raise SimulatorError(response.get("error", "request failed"))
+        return response.get("result")
+
+    def ping(self) -> bool:
+        return self.request("ping") == "pong"
+
+    def create(
+        self,
+        name: str,
+        config: SimulationConfig | None = None,
+        checkpoint: str | None = None,
+        replace: bool = False,
+    ) -> Dict[str, Any]:
+        fields: Dict[str, Any] = {"name": name, "replace": replace}
+        if checkpoint:
+            fields["checkpoint"] = checkpoint
+        else:
+            fields["config"] = asdict(config or SimulationConfig())
+        return self.request("create", **fields)
+
+    def perturb(self, name: str) -> None:
+        self.request("perturb", name=name)
+
+    def step(self, name: str, steps: int = 1) -> int:
+        return self.request("step", name=name, steps=steps)["steps_completed"]
+
+    def summary(self, name: str) -> Dict[str, Any]:
+        return self.request("summary", name=name)
+
+    def snapshot(self, name: str, path: str | None = None) -> str:
+        return self.request("snapshot", name=name, path=path)["path"]
+
+    def drop(self, name: str) -> bool:
+        return self.request("drop", name=name)
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._discard(self._idle.get_nowait())
+            except queue.Empty:
+                return
+
+    def __enter__(self) -> "SimulatorClient":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
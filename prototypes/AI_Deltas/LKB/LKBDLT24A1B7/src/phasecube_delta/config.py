@@ -1,5 +1,7 @@
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Any, Dict, Optional
+
+BACKENDS = ("list", "numpy")
 
 
 @dataclass
@@ -17,6 +19,51 @@ class LensWeights:
     harmonic: float = 0.20
 
 
+@dataclass
+class StoppingRule:
+    """Convergence-aware early stopping for ``LatticeSimulator.step``.
+
+    Summary metrics are averaged over consecutive ``window``-step windows; the
+    run stops once every window mean moves by at most ``tolerance`` from the
+    previous window for ``patience`` windows in a row, or once the simulator
+    has completed ``max_steps`` steps.
+    """
+
+    window: int = 10
+    tolerance: float = 1e-3
+    patience: int = 3
+    max_steps: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        if self.window < 1 or self.patience < 1:
+            raise ValueError("window and patience must be >= 1")
+        if self.tolerance < 0.0:
+            raise ValueError("tolerance must be >= 0")
+        if self.max_steps is not None and self.max_steps < 1:
+            raise ValueError("max_steps must be >= 1 when set")
+
+
+@dataclass
+class LongRunConfig:
+    """Constant-memory bookkeeping for arbitrarily long runs.
+
+    Forgiveness events become a counter, per-step metrics are kept as a
+    decimated history of at most ``capacity`` samples (the sampling stride
+    starts at ``stride`` and doubles whenever the buffer fills), and the last
+    ``recent`` steps live in a fixed-size ring buffer.
+    """
+
+    stride: int = 1
+    capacity: int = 512
+    recent: int = 64
+
+    def __post_init__(self) -> None:
+        if self.stride < 1 or self.recent < 1:
+            raise ValueError("stride and recent must be >= 1")
+        if self.capacity < 2:
+            raise ValueError("capacity must be >= 2")
+
+
 @dataclass
 class SimulationConfig:
     """Configuration knobs (SV3) for the lattice simulator."""
@@ -30,6 +77,22 @@ class SimulationConfig:
     forgiveness_blend: float = 0.55
     lens_weights: LensWeights = field(default_factory=LensWeights)
     seed: Optional[int] = None
+    # "list" is the pure-Python reference; "numpy" runs whole-lattice array ops.
+    backend: str = "list"
+    stopping: Optional[StoppingRule] = None
+    long_run: Optional[LongRunConfig] = None
+
+    @classmethod
+    def from_dict(cls, payload: Dict[str, Any]) -> "SimulationConfig":
+        """Inverse of ``dataclasses.asdict`` (checkpoint headers, server requests)."""
+        fields = dict(payload)
+        if isinstance(fields.get("lens_weights"), dict):
+            fields["lens_weights"] = LensWeights(**fields["lens_weights"])
+        if isinstance(fields.get("stopping"), dict):
+            fields["stopping"] = StoppingRule(**fields["stopping"])
+        if isinstance(fields.get("long_run"), dict):
+            fields["long_run"] = LongRunConfig(**fields["long_run"])
+        return cls(**fields)
 
     def __post_init__(self) -> None:
         if self.grid < 2:
@@ -40,3 +103,5 @@ class SimulationConfig:
                 raise ValueError(f"{name} must be within [0, 1]")
         if not 0.0 < self.forgiveness_blend <= 1.0:
             raise ValueError("forgiveness_blend must be in (0, 1]")
+        if self.backend not in BACKENDS:
+            raise ValueError(f"backend must be one of {BACKENDS}")
@@ -0,0 +1,59 @@
+"""Windowed convergence tracking for early stopping (SV6/SV7).
+
+The tracker folds one metric vector per step into running window sums, so the
+per-step cost is a handful of additions; the comparison against the previous
+window happens once per window.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Sequence
+
+from .config import StoppingRule
+
+METRICS = ("dispersion", "mean_plasma", "mean_liquid", "mean_solid")
+
+
+class ConvergenceTracker:
+    def __init__(self, rule: StoppingRule) -> None:
+        self.rule = rule
+        self._sums: List[float] = [0.0] * len(METRICS)
+        self._filled = 0
+        self._previous: Optional[List[float]] = None
+        self.settled_windows = 0
+
+    def observe(self, values: Sequence[float]) -> bool:
+        """Add one step's metrics; return True once the run has converged."""
+        for i, value in enumerate(values):
+            self._sums[i] += value
+        self._filled += 1
+        if self._filled < self.rule.window:
+            return False
+
+        means = [total / self._filled for total in self._sums]
+        self._sums = [0.0] * len(METRICS)
+        self._filled = 0
+        previous, self._previous = self._previous, means
+        if previous is not None and all(
+            abs(current - before) <= self.rule.tolerance for current, before in zip(means, previous)
+        ):
+            self.settled_windows += 1
+        else:
+            self.settled_windows = 0
+        return self.settled_windows >= self.rule.patience
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "sums": list(self._sums),
+            "filled": self._filled,
+            "previous": self._previous,
+            "settled_windows": self.settled_windows,
+        }
+
+    @classmethod
+    def from_dict(cls, rule: StoppingRule, payload: Dict[str, Any]) -> "ConvergenceTracker":
+        tracker = cls(rule)
+        tracker._sums = list(payload["sums"])
+        tracker._filled = payload["filled"]
+        tracker._previous = payload["previous"]
+        tracker.settled_windows = payload["settled_windows"]
+        return tracker
@@ -0,0 +1,57 @@
+"""Constant-memory run histories for long-run mode (SV7).
+
+``DecimatedHistory`` keeps at most ``capacity`` samples: whenever it fills, the
+stride doubles and only samples on the new stride survive, so the history
+always spans the whole run at a resolution that coarsens with its length.
+``RunHistory`` pairs it with a ring buffer of the most recent steps.
+"""
+from __future__ import annotations
+
+from collections import deque
+from typing import Any, Deque, Dict, List, Sequence, Tuple
+
+from .config import LongRunConfig
+
+Sample = Tuple[float, ...]
+
+
+class DecimatedHistory:
+    def __init__(self, capacity: int, stride: int = 1) -> None:
+        self.capacity = capacity
+        self.stride = stride
+        self.samples: List[Sample] = []
+
+    def record(self, step: int, values: Sequence[float]) -> None:
+        if step % self.stride:
+            return
+        self.samples.append((step, *values))
+        if len(self.samples) >= self.capacity:
+            self.stride *= 2
+            self.samples = [sample for sample in self.samples if sample[0] % self.stride == 0]
+
+
+class RunHistory:
+    """Decimated plus recent per-step metrics (step, dispersion, mean phases)."""
+
+    def __init__(self, config: LongRunConfig) -> None:
+        self.decimated = DecimatedHistory(config.capacity, config.stride)
+        self.recent: Deque[Sample] = deque(maxlen=config.recent)
+
+    def record(self, step: int, values: Sequence[float]) -> None:
+        self.decimated.record(step, values)
+        self.recent.append((step, *values))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "stride": self.decimated.stride,
+            "decimated": [list(sample) for sample in self.decimated.samples],
+            "recent": [list(sample) for sample in self.recent],
+        }
+
+    @classmethod
+    def from_dict(cls, config: LongRunConfig, payload: Dict[str, Any]) -> "RunHistory":
+        history = cls(config)
+        history.decimated.stride = payload["stride"]
+        history.decimated.samples = [tuple(sample) for sample in payload["decimated"]]
+        history.recent.extend(tuple(sample) for sample in payload["recent"])
+        return history
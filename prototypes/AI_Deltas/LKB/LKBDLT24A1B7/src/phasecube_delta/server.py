@@ -0,0 +1,160 @@
+"""Warm simulator daemon serving lattice requests over a Unix socket (SV5/SV7).
+
+The server keeps named ``LatticeSimulator`` instances in memory so callers pay
+interpreter start-up, imports and ``_init_state`` once instead of per call.
+Clients hold persistent connections and exchange newline-delimited JSON:
+
+    request:  {"op": "step", "name": "a", "steps": 10}
+    response: {"ok": true, "result": {...}}  or  {"ok": false, "error": "..."}
+
+Operations: ``ping``, ``create`` (``config`` dict, optional ``checkpoint`` to
+resume from, ``replace``), ``perturb``, ``step`` (``steps``), ``summary``,
+``snapshot`` (writes a checkpoint to ``path`` or the snapshot directory),
+``drop`` and ``list``. Each simulator has its own lock, so requests for
+different simulators run concurrently while requests for one are serialized.
+
+Run it with ``python -m phasecube_delta.server --socket /tmp/phasecube.sock``.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import socketserver
+import threading
+from typing import Any, Callable, Dict, Tuple
+
+from .checkpoint import load_checkpoint, save_checkpoint
+from .config import SimulationConfig
+from .simulation import LatticeSimulator
+
+
+class SimulatorRegistry:
+    """Named simulators plus the request handlers that act on them."""
+
+    def __init__(self, snapshot_dir: str | None = None) -> None:
+        self.snapshot_dir = snapshot_dir or os.getcwd()
+        self._lock = threading.Lock()
+        self._simulators: Dict[str, Tuple[LatticeSimulator, threading.Lock]] = {}
+        self._ops: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+            "ping": lambda request: "pong",
+            "list": lambda request: sorted(self._simulators),
+            "create": self._create,
+            "perturb": self._perturb,
+            "step": self._step,
+            "summary": self._summary,
+            "snapshot": self._snapshot,
+            "drop": self._drop,
+        }
+
+    def handle(self, request: Any) -> Dict[str, Any]:
+        if not isinstance(request, dict):
+            return {"ok": False, "error": f"request must be a JSON object, got {type(request).__name__}"}
+        name = request.get("op")
+        op = self._ops.get(name) if isinstance(name, str) else None
+        if op is None:
+            return {"ok": False, "error": f"unknown op {name!r}"}
+        try:
+            return {"ok": True, "result": op(request)}
+        except (KeyError, ValueError, TypeError, OSError, ImportError) as exc:
+            return {"ok": False, "error": f"{type(exc).__name__}: {exc}"}
+
+    def _get(self, name: str) -> Tuple[LatticeSimulator, threading.Lock]:
+        with self._lock:
+            entry = self._simulators.get(name)
+        if entry is None:
+            raise KeyError(f"no simulator named {name!r}")
+        return entry
+
+    def _create(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        name = request["name"]
+        if request.get("checkpoint"):
+            simulator = load_checkpoint(request["checkpoint"])
+        else:
+            simulator = LatticeSimulator(SimulationConfig.from_dict(request.get("config") or {}))
+        with self._lock:
+            if name in self._simulators and not request.get("replace"):
+                raise ValueError(f"simulator {name!r} already exists")
+            self._simulators[name] = (simulator, threading.Lock())
+        return {"name": name, "cells": simulator.count, "steps_completed": simulator.steps_completed}
+
+    def _perturb(self, request: Dict[str, Any]) -> None:
+        simulator, lock = self._get(request["name"])
+        with lock:
+            simulator.perturb()
+
+    def _step(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        simulator, lock = self._get(request["name"])
+        steps = int(request.get("steps", 1))
+        if steps < 0:
+            raise ValueError("steps must be >= 0")
+        with lock:
+            simulator.step(steps)
+            return {"steps_completed": simulator.steps_completed}
+
+    def _summary(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        simulator, lock = self._get(request["name"])
+        with lock:
+            return simulator.summary()
+
+    def _snapshot(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        name = request["name"]
+        simulator, lock = self._get(name)
+        path = request.get("path") or os.path.join(self.snapshot_dir, f"{name}.ckpt")
+        with lock:
+            save_checkpoint(simulator, path)
+            return {"path": path, "steps_completed": simulator.steps_completed}
+
+    def _drop(self, request: Dict[str, Any]) -> bool:
+        with self._lock:
+            return self._simulators.pop(request["name"], None) is not None
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        registry: SimulatorRegistry = self.server.registry  # type: ignore[attr-defined]
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+            except ValueError as exc:  # JSONDecodeError, or UnicodeDecodeError for non-UTF-8 bytes
+                response: Dict[str, Any] = {"ok": False, "error": f"invalid JSON: {exc}"}
+            else:
+                response = registry.handle(request)
+            self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+
+class SimulatorServer(socketserver.ThreadingUnixStreamServer):
+    """Threaded Unix-socket server; one handler thread per client connection."""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, snapshot_dir: str | None = None) -> None:
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        self.socket_path = socket_path
+        self.registry = SimulatorRegistry(snapshot_dir)
+        super().__init__(socket_path, _RequestHandler)
+
+    def server_close(self) -> None:
+        super().server_close()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Serve warm lattice simulators over a Unix socket.")
+    parser.add_argument("--socket", default="/tmp/phasecube_delta.sock", help="Unix socket path to bind.")
+    parser.add_argument("--snapshot-dir", default=None, help="Default directory for snapshot checkpoints.")
+    args = parser.parse_args(argv)
+    with SimulatorServer(args.socket, args.snapshot_dir) as server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -5,37 +5,95 @@ Design lineage:
 - SV4: Lens weights inform exploratory (predictive) vs stabilizing (harmonic) bias.
 - SV6: Forgiveness operator dampens divergence when dispersion exceeds a threshold.
 - SV5/SV8: Maintain decentralized, noise-driven updates rather than centralized control.
+
+Two backends share the same update rules. ``backend="list"`` walks the lattice
+cell by cell with ``random.Random`` and is the reference implementation.
+``backend="numpy"`` evaluates each rule as a whole-lattice array operation with
+a ``numpy.random.Generator``; it follows the same dynamics but draws a
+different random stream, so runs are statistically (not bit-for-bit)
+equivalent across backends.
+
+Plasma only changes inside ``perturb()``, so both backends keep a per-cell
+neighbor-sum cache plus running plasma moments and refresh them only around
+the cells a perturbation actually touched. Cached sums are recomputed in
+``_neighbors`` order, so they stay bit-identical to a full pass.
 """
 from __future__ import annotations
 
 import math
 import random
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Tuple
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+try:  # Optional dependency: only required for backend="numpy".
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when numpy is absent
+    np = None
 
 from .config import LensWeights, SimulationConfig
+from .convergence import ConvergenceTracker
+from .history import RunHistory
 
 
 @dataclass
 class LatticeState:
-    plasma: List[float]
-    liquid: List[float]
-    solid: List[float]
-    parity: List[int]
+    """Per-cell fields; lists for the list backend, 1-D arrays for numpy."""
+
+    plasma: Sequence[float]
+    liquid: Sequence[float]
+    solid: Sequence[float]
+    parity: Sequence[int]
 
 
 class LatticeSimulator:
     """Simulate a toroidal lattice with ternary phases and harmonic damping."""
 
-    def __init__(self, config: SimulationConfig, rng: random.Random | None = None):
+    def __init__(
+        self,
+        config: SimulationConfig,
+        rng: Any = None,
+        state: LatticeState | None = None,
+    ):
+        """Build a simulator; ``state`` adopts existing fields (e.g. a checkpoint).
+
+        ``rng`` is a ``random.Random`` for the list backend. The numpy backend
+        accepts a ``numpy.random.Generator`` directly or derives one from a
+        ``random.Random`` so injected RNGs still control determinism.
+        """
         self.config = config
-        self.rng = rng or random.Random(config.seed)
         self.size = config.grid
         self.count = self.size ** 3
-        self.state = self._init_state()
+        self.use_arrays = config.backend == "numpy"
+        if self.use_arrays:
+            if np is None:
+                raise ImportError("backend='numpy' requires numpy (pip install numpy)")
+            if isinstance(rng, random.Random):
+                rng = np.random.default_rng(rng.getrandbits(64))
+            self.rng: Any = rng if rng is not None else np.random.default_rng(config.seed)
+        else:
+            self.rng = rng or random.Random(config.seed)
+        self.state = state if state is not None else self._init_state()
+        # Long-run mode keeps only the counter; the list grows one entry per event.
         self.forgiveness_events: List[int] = []
+        self.forgiveness_count = 0
+        self.steps_completed = 0
+        # Set to "converged" or "max_steps" once the stopping rule ends the run.
+        self.stop_reason: str | None = None
+        self.tracker = ConvergenceTracker(config.stopping) if config.stopping else None
+        self.history = RunHistory(config.long_run) if config.long_run else None
+        self._tracked_plasma: Any = None
+        self._plasma_stats: Tuple[float, float] | None = None  # (mean, dispersion)
+        self.resync()
 
     def _init_state(self) -> LatticeState:
+        if self.use_arrays:
+            return LatticeState(
+                plasma=self.rng.random(self.count) * 0.5,
+                liquid=self.rng.random(self.count) * 0.5,
+                solid=self.rng.random(self.count) * 0.5,
+                parity=np.zeros(self.count, dtype=np.int8),
+            )
+
         def r() -> float:
             return self.rng.random() * 0.5
 
@@ -58,24 +116,128 @@ class LatticeSimulator:
             yield self._index(x + dx, y + dy, z + dz)
 
     def neighbor_average(self, idx: int) -> float:
+        self._ensure_plasma_cache()
+        return self._neighbor_sum[idx] / 6.0
+
+    def _neighbor_total(self, idx: int) -> float:
         total = 0.0
         for n in self._neighbors(idx):
             total += self.state.plasma[n]
-        return total / 6.0
+        return total
+
+    def _neighbor_indices(self, idx: "np.ndarray") -> "np.ndarray":
+        """Vectorized ``_neighbors``: one row of six flat indices per cell."""
+        s = self.size
+        x, y, z = idx // (s * s), (idx // s) % s, idx % s
+        columns = []
+        for dx, dy, dz in ((1, 0, 0), (-1, 0, 0), (0, 1, 0), (0, -1, 0), (0, 0, 1), (0, 0, -1)):
+            columns.append(((x + dx) % s) * s * s + ((y + dy) % s) * s + (z + dz) % s)
+        return np.stack(columns, axis=1)
+
+    def _neighbor_sum_array(self) -> "np.ndarray":
+        """Whole-lattice neighbor sums, accumulated in ``_neighbors`` order."""
+        cube = np.asarray(self.state.plasma).reshape(self.size, self.size, self.size)
+        total = (
+            np.roll(cube, -1, axis=0)
+            + np.roll(cube, 1, axis=0)
+            + np.roll(cube, -1, axis=1)
+            + np.roll(cube, 1, axis=1)
+            + np.roll(cube, -1, axis=2)
+            + np.roll(cube, 1, axis=2)
+        )
+        return total.reshape(self.count)
+
+    def _neighbor_average_array(self) -> "np.ndarray":
+        self._ensure_plasma_cache()
+        return self._neighbor_sum / 6.0
+
+    def resync(self) -> None:
+        """Rebuild the neighbor-sum cache and drop the cached plasma statistics.
+
+        Called automatically when ``state.plasma`` is replaced; call it by hand
+        after editing plasma values in place outside ``perturb()``.
+        """
+        plasma = self.state.plasma
+        if self.use_arrays:
+            self._neighbor_sum = self._neighbor_sum_array()
+        else:
+            self._neighbor_sum = [self._neighbor_total(i) for i in range(self.count)]
+        self._plasma_stats = None
+        self._tracked_plasma = plasma
+
+    def _ensure_plasma_cache(self) -> None:
+        if self.state.plasma is not self._tracked_plasma:
+            self.resync()
+
+    def _refresh_neighbors(self, flipped: Iterable[int]) -> None:
+        """Recompute cached sums for every cell adjacent to a flipped cell."""
+        affected = set()
+        for i in flipped:
+            affected.update(self._neighbors(i))
+        for n in affected:
+            self._neighbor_sum[n] = self._neighbor_total(n)
 
     def perturb(self) -> None:
+        self._ensure_plasma_cache()
+        if self.use_arrays:
+            self._perturb_array()
+            return
         cfg = self.config
+        plasma = self.state.plasma
+        flipped: List[int] = []
         for i in range(self.count):
             if self.rng.random() < cfg.flip_p:
                 # Small plasma kick; keep bounded to [0, 1).
                 delta = (self.rng.random() - 0.5) * 0.3
-                self.state.plasma[i] = (self.state.plasma[i] + delta) % 1.0
+                plasma[i] = (plasma[i] + delta) % 1.0
+                flipped.append(i)
             if self.rng.random() < cfg.parity_p:
                 self.state.parity[i] = 1 - self.state.parity[i]
+        if flipped:
+            self._plasma_stats = None
+        if len(flipped) * 6 >= self.count:
+            self._neighbor_sum = [self._neighbor_total(i) for i in range(self.count)]
+        else:
+            self._refresh_neighbors(flipped)
+
+    def _perturb_array(self) -> None:
+        cfg = self.config
+        plasma = self.state.plasma
+        flipped = np.flatnonzero(self.rng.random(self.count) < cfg.flip_p)
+        delta = (self.rng.random(flipped.size) - 0.5) * 0.3
+        plasma[flipped] = (plasma[flipped] + delta) % 1.0
+        if flipped.size:
+            self._plasma_stats = None
+        if flipped.size * 6 >= self.count:
+            self._neighbor_sum = self._neighbor_sum_array()
+        elif flipped.size:
+            affected = np.unique(self._neighbor_indices(flipped))
+            rows = plasma[self._neighbor_indices(affected)]
+            self._neighbor_sum[affected] = (
+                rows[:, 0] + rows[:, 1] + rows[:, 2] + rows[:, 3] + rows[:, 4] + rows[:, 5]
+            )
+        parity_flips = self.rng.random(self.count) < cfg.parity_p
+        self.state.parity[parity_flips] ^= 1
+
+    def _plasma_moments(self) -> Tuple[float, float]:
+        """``(mean, standard deviation)`` of plasma, cached until plasma changes.
+
+        Only ``perturb()`` moves plasma, so the exact two-pass statistics are
+        computed at most once per perturb and every ``step()`` reads them in
+        O(1) without accumulating rounding drift.
+        """
+        self._ensure_plasma_cache()
+        if self._plasma_stats is None:
+            plasma = self.state.plasma
+            if self.use_arrays:
+                self._plasma_stats = (float(np.mean(plasma)), float(np.std(plasma)))
+            else:
+                mean = sum(plasma) / self.count
+                self._plasma_stats = (mean, math.sqrt(sum((p - mean) ** 2 for p in plasma) / self.count))
+        return self._plasma_stats
 
     def _dispersion(self) -> float:
-        mean = sum(self.state.plasma) / self.count
-        return math.sqrt(sum((p - mean) ** 2 for p in self.state.plasma) / self.count)
+        return self._plasma_moments()[1]
 
     def _effective_path_b(self, dispersion: float, lenses: LensWeights) -> float:
         base = self.config.path_b_p
@@ -89,33 +251,97 @@ class LatticeSimulator:
             return self.config.forgiveness_blend
         return 1.0
 
-    def step(self, steps: int = 1) -> None:
+    def step(self, steps: int = 1) -> int:
+        """Advance up to ``steps`` steps; returns how many actually ran.
+
+        With a ``StoppingRule`` configured the run ends early once the summary
+        metrics settle or the hard step cap is reached; later calls are no-ops.
+        """
+        executed = 0
         for _ in range(steps):
+            if self.stop_reason is not None:
+                break
             dispersion = self._dispersion()
             effective_path_b = self._effective_path_b(dispersion, self.config.lens_weights)
             forgiveness = self._forgiveness_factor(dispersion)
             if forgiveness < 1.0:
-                self.forgiveness_events.append(len(self.forgiveness_events))
-
-            p0 = list(self.state.plasma)
-            l0 = list(self.state.liquid)
-            s0 = list(self.state.solid)
-
-            for i in range(self.count):
-                avg = (p0[i] + l0[i] + s0[i]) / 3.0
-                neighbor_delta = abs(p0[i] - self.neighbor_average(i)) + self.state.parity[i] * 0.13
-                choice = neighbor_delta if self.rng.random() < effective_path_b else avg
-                liquid_value = avg * (1 - forgiveness) + choice * forgiveness
-                self.state.liquid[i] = liquid_value % 1.0
-                self.state.solid[i] = (s0[i] * (1 - self.config.alpha) + liquid_value * self.config.alpha) % 1.0
-
-    def summary(self) -> Dict[str, float]:
-        dispersion = self._dispersion()
-        mean_plasma = sum(self.state.plasma) / self.count
-        mean_liquid = sum(self.state.liquid) / self.count
-        mean_solid = sum(self.state.solid) / self.count
-        parity_ratio = sum(self.state.parity) / self.count
-        return {
+                if self.history is None:
+                    self.forgiveness_events.append(self.forgiveness_count)
+                self.forgiveness_count += 1
+            self.steps_completed += 1
+            executed += 1
+
+            if self.use_arrays:
+                liquid_total, solid_total = self._step_array(effective_path_b, forgiveness)
+            else:
+                liquid_total, solid_total = self._step_list(effective_path_b, forgiveness)
+            if self.tracker is not None or self.history is not None:
+                self._after_step(dispersion, liquid_total, solid_total)
+        return executed
+
+    def _step_list(self, effective_path_b: float, forgiveness: float) -> Tuple[float, float]:
+        p0 = self.state.plasma
+        l0 = list(self.state.liquid)
+        s0 = list(self.state.solid)
+        neighbor_sum = self._neighbor_sum
+        liquid_total = 0.0
+        solid_total = 0.0
+
+        for i in range(self.count):
+            avg = (p0[i] + l0[i] + s0[i]) / 3.0
+            neighbor_delta = abs(p0[i] - neighbor_sum[i] / 6.0) + self.state.parity[i] * 0.13
+            choice = neighbor_delta if self.rng.random() < effective_path_b else avg
+            liquid_value = avg * (1 - forgiveness) + choice * forgiveness
+            liquid = liquid_value % 1.0
+            solid = (s0[i] * (1 - self.config.alpha) + liquid_value * self.config.alpha) % 1.0
+            self.state.liquid[i] = liquid
+            self.state.solid[i] = solid
+            liquid_total += liquid
+            solid_total += solid
+        return liquid_total, solid_total
+
+    def _step_array(self, effective_path_b: float, forgiveness: float) -> Tuple[float, float]:
+        state = self.state
+        alpha = self.config.alpha
+        avg = (state.plasma + state.liquid + state.solid) / 3.0
+        neighbor_delta = np.abs(state.plasma - self._neighbor_average_array()) + state.parity * 0.13
+        choice = np.where(self.rng.random(self.count) < effective_path_b, neighbor_delta, avg)
+        liquid_value = avg * (1 - forgiveness) + choice * forgiveness
+        state.solid = (state.solid * (1 - alpha) + liquid_value * alpha) % 1.0
+        state.liquid = liquid_value % 1.0
+        if self.tracker is None and self.history is None:
+            return 0.0, 0.0
+        return float(np.sum(state.liquid)), float(np.sum(state.solid))
+
+    def _after_step(self, dispersion: float, liquid_total: float, solid_total: float) -> None:
+        # Plasma is untouched by step(), so the pre-step dispersion and the
+        # cached plasma mean already describe the post-step state.
+        metrics = (
+            dispersion,
+            self._plasma_moments()[0],
+            liquid_total / self.count,
+            solid_total / self.count,
+        )
+        if self.history is not None:
+            self.history.record(self.steps_completed, metrics)
+        if self.tracker is None:
+            return
+        if self.tracker.observe(metrics):
+            self.stop_reason = "converged"
+        elif self.tracker.rule.max_steps is not None and self.steps_completed >= self.tracker.rule.max_steps:
+            self.stop_reason = "max_steps"
+
+    def summary(self) -> Dict[str, Any]:
+        mean_plasma, dispersion = self._plasma_moments()
+        if self.use_arrays:
+            mean_liquid = float(np.mean(self.state.liquid))
+            mean_solid = float(np.mean(self.state.solid))
+            parity_ratio = float(np.count_nonzero(self.state.parity)) / self.count
+        else:
+            mean_liquid = sum(self.state.liquid) / self.count
+            mean_solid = sum(self.state.solid) / self.count
+            parity_ratio = sum(self.state.parity) / self.count
+        summary: Dict[str, Any] = {
             "grid": self.size,
             "cells": self.count,
             "dispersion": dispersion,
@@ -123,6 +349,11 @@ class LatticeSimulator:
             "mean_liquid": mean_liquid,
             "mean_solid": mean_solid,
             "parity_ratio": parity_ratio,
-            "forgiveness_events": len(self.forgiveness_events),
+            "forgiveness_events": self.forgiveness_count,
             "path_b_p": self.config.path_b_p,
+            "steps_completed": self.steps_completed,
+            "stop_reason": self.stop_reason or "completed",
         }
+        if self.history is not None:
+            summary["history"] = self.history.to_dict()
+        return summary
@@ -0,0 +1,97 @@
+import json
+import os
+import shutil
+import socket
+import sys
+import tempfile
+import threading
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from phasecube_delta import LatticeSimulator, SimulationConfig  # noqa: E402
+from phasecube_delta.client import SimulatorClient, SimulatorError  # noqa: E402
+from phasecube_delta.server import SimulatorServer  # noqa: E402
+
+
+@pytest.fixture
+def client():
+    # Unix socket paths are length-limited, so keep them out of pytest's tmp_path.
+    workdir = tempfile.mkdtemp(prefix="pcd", dir="/tmp")
+    server = SimulatorServer(os.path.join(workdir, "s.sock"), snapshot_dir=workdir)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    with SimulatorClient(server.socket_path, pool_size=2) as client:
+        yield client
+    server.shutdown()
+    server.server_close()
+    shutil.rmtree(workdir)
+
+
+def test_server_matches_in_process_run(client):
+    cfg = SimulationConfig(grid=4, seed=17)
+    client.create("a", cfg)
+    client.perturb("a")
+    assert client.step("a", 3) == 3
+    assert client.step("a", 2) == 5
+
+    local = LatticeSimulator(SimulationConfig(grid=4, seed=17))
+    local.perturb()
+    local.step(5)
+    assert client.summary("a") == local.summary()
+
+
+def test_snapshot_resume_and_drop(client):
+    client.create("a", SimulationConfig(grid=3, seed=2))
+    client.perturb("a")
+    client.step("a", 2)
+    path = client.snapshot("a")
+    assert os.path.exists(path)
+
+    client.create("b", checkpoint=path)
+    client.step("a", 3)
+    client.step("b", 3)
+    assert client.summary("a") == client.summary("b")
+
+    assert client.drop("a") is True
+    with pytest.raises(SimulatorError):
+        client.summary("a")
+    with pytest.raises(SimulatorError):
+        client.create("b", SimulationConfig(grid=3))
+    assert client.ping()
+
+
+def test_registry_rejects_malformed_requests():
+    from phasecube_delta.server import SimulatorRegistry
+
+    registry = SimulatorRegistry()
+    for request in ([1], "step", None, {"op": []}, {"op": {"x": 1}}, {}):
+        response = registry.handle(request)
+        assert response["ok"] is False
+        assert response["error"]
+
+
+def test_server_answers_undecodable_request_lines(client):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(10)
+        sock.connect(client.socket_path)
+        stream = sock.makefile("rwb")
+        stream.write(b'{"op": "\x80"}\n')
+        stream.flush()
+        response = json.loads(stream.readline())
+        assert response["ok"] is False
+        # The connection survives the bad line.
+        stream.write(b'{"op": "ping"}\n')
+        stream.flush()
+        assert json.loads(stream.readline())["ok"] is True
+
+
+def test_create_from_truncated_checkpoint_reports_error(client, tmp_path):
+    path = tmp_path / "short.ckpt"
+    path.write_bytes(b"PCDCKPT1\x01")
+    with pytest.raises(SimulatorError, match="truncated checkpoint header"):
+        client.create("t", checkpoint=str(path))
+    assert client.ping()
@@ -50,3 +50,150 @@ def test_forgiveness_dampens_difference_bias():
 
     sim.step(1)
     assert sim.forgiveness_events  # forgiveness recorded when threshold crossed
+
+
+def test_numpy_backend_matches_list_neighbor_average():
+    np = pytest.importorskip("numpy")
+    list_sim = LatticeSimulator(SimulationConfig(grid=4, seed=3))
+    array_sim = LatticeSimulator(SimulationConfig(grid=4, seed=3, backend="numpy"))
+    array_sim.state.plasma = np.array(list_sim.state.plasma)
+
+    expected = [list_sim.neighbor_average(i) for i in range(list_sim.count)]
+    assert array_sim._neighbor_average_array().tolist() == expected
+    assert array_sim._dispersion() == pytest.approx(list_sim._dispersion())
+
+
+def test_numpy_backend_is_deterministic_and_bounded():
+    pytest.importorskip("numpy")
+    cfg = SimulationConfig(grid=5, seed=9, backend="numpy")
+    sim_a = LatticeSimulator(cfg)
+    sim_b = LatticeSimulator(deepcopy(cfg))
+
+    sim_a.perturb(); sim_a.step(4)
+    sim_b.perturb(); sim_b.step(4)
+
+    summary = sim_a.summary()
+    assert summary == sim_b.summary()
+    assert set(summary) == set(LatticeSimulator(SimulationConfig(grid=2)).summary())
+    assert all(0.0 <= v < 1.0 for v in sim_a.state.liquid)
+    assert isinstance(summary["dispersion"], float)
+
+
+def test_unknown_backend_rejected():
+    with pytest.raises(ValueError):
+        SimulationConfig(backend="gpu")
+
+
+@pytest.mark.parametrize("backend", ["list", "numpy"])
+def test_incremental_caches_match_full_recompute(backend):
+    if backend == "numpy":
+        pytest.importorskip("numpy")
+    sim = LatticeSimulator(SimulationConfig(grid=5, seed=13, flip_p=0.1, backend=backend))
+    for _ in range(4):
+        sim.perturb()
+        sim.step(1)
+    cached_sums = list(sim._neighbor_sum)
+    cached_dispersion = sim._dispersion()
+
+    sim.resync()
+    assert list(sim._neighbor_sum) == cached_sums
+    assert sim._dispersion() == cached_dispersion
+
+
+def test_list_dispersion_is_exact_two_pass_std():
+    sim = LatticeSimulator(SimulationConfig(grid=4, seed=21, flip_p=0.3))
+    for _ in range(50):
+        sim.perturb()
+        sim.step(1)
+    plasma = sim.state.plasma
+    mean = sum(plasma) / sim.count
+    assert sim._dispersion() == math.sqrt(sum((p - mean) ** 2 for p in plasma) / sim.count)
+    assert sim.summary()["mean_plasma"] == mean
+
+
+@pytest.mark.parametrize("backend", ["list", "numpy"])
+def test_checkpoint_resume_is_bit_identical(tmp_path, backend):
+    if backend == "numpy":
+        pytest.importorskip("numpy")
+    from phasecube_delta.checkpoint import load_checkpoint, save_checkpoint
+
+    cfg = SimulationConfig(grid=4, seed=21, flip_p=0.2, forgiveness_threshold=0.1, backend=backend)
+    uninterrupted = LatticeSimulator(cfg)
+    interrupted = LatticeSimulator(deepcopy(cfg))
+    for sim in (uninterrupted, interrupted):
+        sim.perturb()
+        sim.step(3)
+
+    path = tmp_path / "run.ckpt"
+    save_checkpoint(interrupted, path)
+    resumed = load_checkpoint(path)
+    assert resumed.steps_completed == 3
+
+    for sim in (uninterrupted, resumed):
+        sim.perturb()
+        sim.step(4)
+    assert resumed.summary() == uninterrupted.summary()
+    for name in ("plasma", "liquid", "solid", "parity"):
+        assert list(getattr(resumed.state, name)) == list(getattr(uninterrupted.state, name))
+
+
+@pytest.mark.parametrize("backend", ["list", "numpy"])
+def test_stopping_rule_ends_settled_runs_early(backend):
+    if backend == "numpy":
+        pytest.importorskip("numpy")
+    from phasecube_delta.config import StoppingRule
+
+    rule = StoppingRule(window=5, tolerance=0.01, patience=2, max_steps=400)
+    sim = LatticeSimulator(SimulationConfig(grid=6, seed=3, backend=backend, stopping=rule))
+    sim.perturb()
+    executed = sim.step(1000)
+
+    summary = sim.summary()
+    assert executed == summary["steps_completed"] < 400
+    assert summary["stop_reason"] == "converged"
+    assert sim.step(10) == 0  # run has ended
+
+
+def test_stopping_rule_enforces_hard_cap():
+    from phasecube_delta.config import StoppingRule
+
+    rule = StoppingRule(window=5, tolerance=0.0, patience=2, max_steps=12)
+    sim = LatticeSimulator(SimulationConfig(grid=3, seed=3, stopping=rule))
+    sim.perturb()
+    sim.step(100)
+    assert sim.summary()["steps_completed"] == 12
+    assert sim.summary()["stop_reason"] == "max_steps"
+
+    plain = LatticeSimulator(SimulationConfig(grid=3, seed=3))
+    plain.step(4)
+    assert plain.summary()["stop_reason"] == "completed"
+
+
+@pytest.mark.parametrize("backend", ["list", "numpy"])
+def test_long_run_bookkeeping_is_bounded(tmp_path, backend):
+    if backend == "numpy":
+        pytest.importorskip("numpy")
+    from phasecube_delta.checkpoint import load_checkpoint, save_checkpoint
+    from phasecube_delta.config import LongRunConfig
+
+    cfg = SimulationConfig(
+        grid=3, seed=5, forgiveness_threshold=0.0, backend=backend,
+        long_run=LongRunConfig(stride=1, capacity=8, recent=5),
+    )
+    sim = LatticeSimulator(cfg)
+    sim.perturb()
+    sim.step(200)
+
+    summary = sim.summary()
+    assert sim.forgiveness_events == []
+    assert summary["forgiveness_events"] == sim.forgiveness_count == 200
+    history = summary["history"]
+    assert len(history["decimated"]) < 8
+    assert history["stride"] >= 200 // 8
+    assert all(sample[0] % history["stride"] == 0 for sample in history["decimated"])
+    assert [sample[0] for sample in history["recent"]] == [196, 197, 198, 199, 200]
+
+    path = tmp_path / "long.ckpt"
+    save_checkpoint(sim, path)
+    resumed = load_checkpoint(path)
+    assert resumed.summary() == summary
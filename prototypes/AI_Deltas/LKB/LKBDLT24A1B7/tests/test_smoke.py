@@ -2,6 +2,8 @@ import json
 import os
 import sys
 
+import pytest
+
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
 if ROOT not in sys.path:
     sys.path.insert(0, ROOT)
@@ -21,3 +23,55 @@ def test_cli_run_returns_summary():
 def test_version_string_present():
     assert isinstance(__version__, str)
     assert __version__.count(".") >= 1
+
+
+def test_cli_checkpoint_and_resume_matches_straight_run(tmp_path):
+    ckpt = str(tmp_path / "cli.ckpt")
+    straight = run(["--steps", "6", "--grid", "3", "--seed", "5"])
+    run(["--steps", "4", "--grid", "3", "--seed", "5", "--checkpoint", ckpt, "--checkpoint-every", "2"])
+    resumed = run(["--steps", "6", "--resume", ckpt])
+    assert resumed == straight
+
+
+def test_sweep_streams_json_lines_longest_first(tmp_path):
+    from phasecube_delta.cli import sweep
+    from phasecube_delta.config import SimulationConfig
+    from phasecube_delta.sweep import build_tasks
+
+    tasks = build_tasks(SimulationConfig(grid=3), 2, grid={"grid": [2, 4], "steps": [1, 3]})
+    assert [(t.config.grid, t.steps) for t in tasks] == [(4, 3), (4, 1), (2, 3), (2, 1)]
+
+    out = tmp_path / "sweep.jsonl"
+    argv = [
+        "--grid", "3", "--steps", "2",
+        "--param", "flip_p=0.01,0.05",
+        "--sample", "forgiveness_blend=0.3:0.9", "--samples", "2",
+        "--workers", "2", "--output", str(out),
+    ]
+    assert sweep(argv) == 4
+    lines = [json.loads(line) for line in out.read_text().splitlines()]
+    assert sorted(line["task"] for line in lines) == [0, 1, 2, 3]
+    for line in lines:
+        assert line["cells"] == 27
+        assert 0.3 <= line["params"]["forgiveness_blend"] <= 0.9
+        direct = run(["--grid", "3", "--steps", "2", "--flip-p", str(line["params"]["flip_p"]),
+                      "--forgiveness-blend", repr(line["params"]["forgiveness_blend"])])
+        assert direct["dispersion"] == line["dispersion"]
+
+
+def test_cli_early_stopping_survives_resume(tmp_path):
+    ckpt = str(tmp_path / "stop.ckpt")
+    flags = ["--grid", "4", "--seed", "3", "--stop-window", "4", "--stop-tolerance", "0.02", "--stop-patience", "2"]
+    straight = run(["--steps", "200", *flags])
+    assert straight["stop_reason"] == "converged"
+    assert straight["steps_completed"] < 200
+
+    run(["--steps", "6", *flags, "--checkpoint", ckpt, "--checkpoint-every", "3"])
+    resumed = run(["--steps", "200", "--resume", ckpt])
+    assert resumed == straight
+
+
+def test_cli_rejects_max_steps_without_stop_window(capsys):
+    with pytest.raises(SystemExit):
+        run(["--grid", "3", "--steps", "4", "--max-steps", "2"])
+    assert "--max-steps requires --stop-window" in capsys.readouterr().err